@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Loads dpocket result tables of one lipid class into the dpocket Parquet store.
+
+Reads every <prefix>_fpocketp.txt, <prefix>_fpocketnp.txt and <prefix>_explicitp.txt
+below the given directories (e.g. dpocket_outputs/ of the SLURM job in
+example_dpocket_run/dpocket_fatty_acyl.sh), parses them with the fixed dpout schema and
+writes them, tagged with lipid class, pocket set and run, to
+dpocket_pockets/lipid_class=<class>/pockets.parquet. plot_dpocket_descriptors.py can
+plot from this store (--source store) instead of Source_Data_dpocket.xlsx.
+
+Usage:
+    python3 load_dpocket_outputs.py -c fattyacyl -i /PATH/dpocket_outputs [--workers N]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from lipid_analysis.dpocket import DPOCKET_STORE, iter_dpout_files, read_dpout, write_pockets
+from lipid_analysis.lipid_classes import LIPID_CLASSES
+from lipid_analysis.parallel import default_workers, parallel_map
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-c",
+        "--lipid-class",
+        required=True,
+        choices=LIPID_CLASSES,
+        help="Lipid class the dpocket runs belong to.",
+    )
+    parser.add_argument(
+        "-i",
+        "--input-dirs",
+        nargs="+",
+        default=["dpocket_outputs"],
+        help="Directories holding the dpocket result tables.",
+    )
+    parser.add_argument(
+        "-s",
+        "--store",
+        default=DPOCKET_STORE,
+        help="Directory of the dpocket Parquet store (partitioned by lipid class).",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=default_workers(),
+        help="Number of processes reading files in parallel. Defaults to all cores.",
+    )
+    args = parser.parse_args()
+    return args
+
+
+def main():
+    args = parse_args()
+
+    paths = []
+    for input_dir in args.input_dirs:
+        paths += [path for path, _, _ in iter_dpout_files(input_dir)]
+
+    if not paths:
+        raise ValueError(f"No dpocket result tables found in {args.input_dirs}")
+
+    frames = parallel_map(read_dpout, paths, args.workers, chunk_size=32)
+    n_rows = write_pockets(frames, args.lipid_class, args.store)
+
+    print(f"{args.lipid_class}: loaded {n_rows} pockets from {len(paths)} files")
+    print(f"dpocket store written to: {args.store}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Renders dpocket descriptor violin plots for all lipid classes in one run.
+
+Replaces running plot_polarity_score.py, plot_hydrophobicity_score.py, plot_as_max_dst.py,
+plot_ligand_volume.py, plot_pocket_volume.py and plot_lipid_volume_over_protein_pocket_volume.py
+one by one: the workbook is loaded once, and every requested descriptor is written as
+<name>_violin.pdf plus a table of per-class medians. Besides the six manuscript figures,
+any numeric dpocket column (e.g. mean_as_solv_acc, drug_score, flex) can be plotted.
+
+Usage:
+    python3 plot_dpocket_descriptors.py                       # the six manuscript figures
+    python3 plot_dpocket_descriptors.py -d drug_score flex    # any dpocket columns
+    python3 plot_dpocket_descriptors.py --all --workers 8     # every numeric column
+    python3 plot_dpocket_descriptors.py --source store        # from load_dpocket_outputs.py
+"""
+import matplotlib
+# Ensure all text in the PDF stays editable (TrueType instead of paths)
+matplotlib.rcParams['pdf.fonttype'] = 42
+matplotlib.rcParams['ps.fonttype'] = 42
+
+# Force Arial for all text
+matplotlib.rcParams['font.family'] = 'Arial'
+matplotlib.use("Agg")
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from lipid_analysis.dpocket import DPOCKET_STORE, POCKET_SETS, load_pockets
+from lipid_analysis.lipid_classes import class_colors, class_labels
+from lipid_analysis.parallel import parallel_map
+from lipid_analysis.source_data import SOURCE_DATA_DPOCKET, read_sheets
+
+# --------------------------------------
+# Lipid classes (sheet names) and colors
+# --------------------------------------
+# sheet name (lipid class display name) -> lipid class ID in the dpocket store
+sheet_classes = class_labels()
+target_sheets = list(sheet_classes)
+
+color_map = class_colors()
+
+# --------------------------------------
+# Manuscript figures
+# --------------------------------------
+# descriptor -> plot settings. "columns" holds one dpocket column, or two for a ratio.
+FIGURES = {
+    "polarity_score": {
+        "columns": ["polarity_score"],
+        "ylabel": "Polarity score",
+        "median_header": "Polarity score",
+        "pdf": "polarity_score_violin.pdf",
+        "medians": "polarity_score_median_values.txt",
+    },
+    "hydrophobicity_score": {
+        "columns": ["hydrophobicity_score"],
+        "ylabel": "Hydrophobicity score",
+        "median_header": "Lipid class\tMedian hydrophobicity_score",
+        "pdf": "hydrophobicity_score_violin.pdf",
+        "medians": "hydrophobicity_score_median_values.txt",
+    },
+    "as_max_dst": {
+        "columns": ["as_max_dst"],
+        "ylabel": "as_max_dst",
+        "median_header": "as_max_dst",
+        "pdf": "as_max_dst_violin.pdf",
+        "medians": "as_max_dst_median_values.txt",
+    },
+    "lig_vol": {
+        "columns": ["lig_vol"],
+        "ylabel": "Lipid volume (Å³)",
+        "median_header": "Lipid class\tMedian lipid volume (Å³)",
+        "pdf": "lipid_volume_violin.pdf",
+        "medians": "lipid_volume_median_values.txt",
+    },
+    "pock_vol": {
+        "columns": ["pock_vol"],
+        "ylabel": "Pocket volume (Å³)",
+        "median_header": "Lipid class\tMedian pocket volume (Å³)",
+        "median_format": ".2f",
+        "pdf": "pocket_volume_violin.pdf",
+        "medians": "pocket_volumes_median_values.txt",
+    },
+    "lig_vol/pock_vol": {
+        "columns": ["lig_vol", "pock_vol"],
+        "ylabel": "Lipid Volume / Protein Pocket Volume",
+        "median_header": "Lipid class\tMedian (Lipid Volume / Pocket Volume)",
+        "ylim": (0, 3),
+        "pdf": "lipid_to_pocket_volume_ratio_violin.pdf",
+        "medians": "lipid_to_pocket_volume_ratio_medians.txt",
+    },
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-S",
+        "--source",
+        default="excel",
+        choices=["excel", "store"],
+        help="Read descriptors from the workbook, or from the dpocket store written by "
+        "load_dpocket_outputs.py.",
+    )
+    parser.add_argument(
+        "-e",
+        "--excel-file",
+        default=SOURCE_DATA_DPOCKET,
+        help="Workbook with one sheet of dpocket descriptors per lipid class.",
+    )
+    parser.add_argument(
+        "-s",
+        "--store",
+        default=DPOCKET_STORE,
+        help="Directory of the dpocket Parquet store (with --source store).",
+    )
+    parser.add_argument(
+        "-p",
+        "--pocket-set",
+        default="fpocketp",
+        choices=POCKET_SETS,
+        help="dpocket pocket set to plot (with --source store).",
+    )
+    parser.add_argument(
+        "-d",
+        "--descriptors",
+        nargs="+",
+        default=list(FIGURES),
+        help="Descriptors to plot: dpocket column names, or keys of FIGURES "
+        "(e.g. lig_vol/pock_vol). Defaults to the six manuscript figures.",
+    )
+    parser.add_argument(
+        "-a",
+        "--all",
+        action="store_true",
+        help="Plot every numeric dpocket column found in the workbook.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        default=".",
+        help="Directory to write the PDFs and median tables into.",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes rendering figures in parallel.",
+    )
+    args = parser.parse_args()
+    return args
+
+
+def load_store_sheets(store_dir: str, pocket_set: str) -> dict:
+    """
+    Loads the pockets of every lipid class from the dpocket store, in the same
+    sheet name -> DataFrame form as the workbook.
+
+    Args:
+        store_dir (str): root directory of the dpocket store.
+        pocket_set (str): pocket set to load (e.g. "fpocketp").
+    """
+    pockets = load_pockets(store_dir, pocket_sets=[pocket_set])
+    pockets["lipid_class"] = pockets["lipid_class"].astype(str)
+
+    return {
+        sheet: pockets[pockets["lipid_class"] == class_id]
+        for sheet, class_id in sheet_classes.items()
+        if (pockets["lipid_class"] == class_id).any()
+    }
+
+
+def figure_settings(descriptor: str) -> dict:
+    """
+    Returns the plot settings of a descriptor: those of FIGURES, or defaults named
+    after the dpocket column.
+
+    Args:
+        descriptor (str): key of FIGURES or dpocket column name.
+    """
+    if descriptor in FIGURES:
+        return FIGURES[descriptor]
+
+    return {
+        "columns": [descriptor],
+        "ylabel": descriptor,
+        "median_header": f"Lipid class\tMedian {descriptor}",
+        "pdf": f"{descriptor}_violin.pdf",
+        "medians": f"{descriptor}_median_values.txt",
+    }
+
+
+def find_column(df: pd.DataFrame, name: str):
+    """
+    Returns the column of a sheet matching a dpocket column name: an exact
+    (case-insensitive) match if there is one, otherwise the first column containing it.
+    """
+    for col in df.columns:
+        if col.lower() == name.lower():
+            return col
+    for col in df.columns:
+        if name.lower() in col.lower():
+            return col
+    return None
+
+
+def descriptor_values(sheets: dict, settings: dict) -> dict:
+    """
+    Collects the numeric values of one descriptor per lipid class.
+
+    Args:
+        sheets (dict): sheet name -> DataFrame.
+        settings (dict): plot settings (see figure_settings).
+    Returns:
+        a dictionary of lipid class -> np.ndarray, in target_sheets order.
+    """
+    values = {}
+
+    for sheet in target_sheets:
+        df = sheets.get(sheet)
+        if df is None:
+            continue
+
+        cols = [find_column(df, name) for name in settings["columns"]]
+        if any(col is None for col in cols):
+            print(f"WARNING: no '{'/'.join(settings['columns'])}' column found in sheet {sheet}, skipping...")
+            continue
+
+        tmp = df[cols].apply(pd.to_numeric, errors="coerce").dropna()
+
+        if len(cols) == 2:
+            # ratio; drop zero denominators
+            tmp = tmp[tmp[cols[1]] > 0]
+            vals = tmp[cols[0]] / tmp[cols[1]]
+        else:
+            vals = tmp[cols[0]]
+
+        if vals.empty:
+            print(f"WARNING: sheet {sheet} has no numeric values for '{'/'.join(settings['columns'])}', skipping...")
+            continue
+
+        values[sheet] = vals.to_numpy()
+
+    return values
+
+
+def render_descriptor(job) -> str:
+    """
+    Writes the violin plot and median table of one descriptor.
+
+    Args:
+        job (tuple): (descriptor, plot settings, lipid class -> values, output directory).
+    Returns:
+        the path of the PDF.
+    """
+    descriptor, settings, values, output_dir = job
+    classes = list(values)
+    data_list = [values[c] for c in classes]
+
+    # --------------------------------------
+    # Medians
+    # --------------------------------------
+    median_format = settings.get("median_format", ".3f")
+    median_path = os.path.join(output_dir, settings["medians"])
+    with open(median_path, "w") as f:
+        f.write(settings["median_header"] + "\n")
+        for cls, vals in zip(classes, data_list):
+            f.write(f"{cls}\t{np.median(vals):{median_format}}\n")
+
+    # --------------------------------------
+    # Plot
+    # --------------------------------------
+    fig = plt.figure(figsize=(4.5, 4))
+
+    vp = plt.violinplot(
+        data_list,
+        showmeans=False,
+        showextrema=False,
+        showmedians=True
+    )
+
+    for body, cls in zip(vp["bodies"], classes):
+        body.set_facecolor(color_map[cls])
+        body.set_edgecolor("black")
+        body.set_linewidth(1)
+        body.set_alpha(0.95)
+
+    vp["cmedians"].set_color("black")
+    vp["cmedians"].set_linewidth(1.5)
+
+    plt.xticks(range(1, len(classes) + 1), classes, rotation=40, ha="right")
+    plt.ylabel(settings["ylabel"], fontsize=11)
+
+    ax = plt.gca()
+    ax.spines["top"].set_visible(False)
+    ax.spines["right"].set_visible(False)
+    ax.spines["left"].set_linewidth(1)
+    ax.spines["bottom"].set_linewidth(1)
+    if "ylim" in settings:
+        ax.set_ylim(*settings["ylim"])
+
+    # n = X labels above each violin
+    ymax = max(vals.max() for vals in data_list)
+    for i, vals in enumerate(data_list, start=1):
+        plt.text(
+            i,
+            ymax * 1.05,
+            f"n = {len(vals)}",
+            ha="center",
+            va="bottom",
+            fontsize=9,
+            rotation=45
+        )
+
+    plt.tight_layout()
+
+    pdf_path = os.path.join(output_dir, settings["pdf"])
+    plt.savefig(pdf_path, dpi=300)
+    plt.close(fig)
+
+    return pdf_path
+
+
+def main():
+    args = parse_args()
+
+    # --------------------------------------
+    # Load every lipid class once
+    # --------------------------------------
+    if args.source == "store":
+        sheets = load_store_sheets(args.store, args.pocket_set)
+    else:
+        sheets = read_sheets(args.excel_file, target_sheets)
+
+    descriptors = list(args.descriptors)
+    if args.all:
+        numeric = set()
+        for df in sheets.values():
+            numeric.update(df.select_dtypes(include="number").columns)
+        descriptors += sorted(col for col in numeric if col not in descriptors)
+
+    jobs = []
+    for descriptor in descriptors:
+        settings = figure_settings(descriptor)
+        values = descriptor_values(sheets, settings)
+        if not values:
+            print(f"WARNING: no valid '{descriptor}' data found in any sheet, skipping...")
+            continue
+        jobs.append((descriptor, settings, values, args.output_dir))
+
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    for (descriptor, settings, _, _), pdf_path in zip(
+        jobs, parallel_map(render_descriptor, jobs, args.workers, chunk_size=1)
+    ):
+        print(f"{descriptor}: saved {pdf_path} and {settings['medians']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,11 +9,17 @@ matplotlib.rcParams['font.family'] = 'Arial'
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lipid_analysis.source_data import SOURCE_DATA_DPOCKET, read_sheet
 
 # --------------------------------------
 # User configuration
 # --------------------------------------
-excel_file = "../../Source_Data_dpocket.xlsx"
+excel_file = SOURCE_DATA_DPOCKET  # read through the binary cache in .source_data_cache/
 
 target_sheets = [
     "Sterol",
@@ -49,7 +55,7 @@ color_map = {
 all_data = []
 
 for sheet in target_sheets:
-    df = pd.read_excel(excel_file, sheet_name=sheet)
+    df = read_sheet(excel_file, sheet)
 
     # auto-find polarity_score column
     prop_col = None
@@ -0,0 +1,562 @@
+#!/usr/bin/env python3
+"""
+Runs dpocket over a structure/ligand list in balanced shards, locally or as a SLURM array.
+
+Replaces the serial loop of example_dpocket_run/dpocket_fatty_acyl.sh. The input list
+(example_input_fatty_acyl.txt format: "<pdb file> <ligand code>" per line, "#" comments)
+is split into shards of roughly equal total atom count, written to <out>/split_inputs/.
+Shards are then either
+  - run locally: one dpocket process per shard, as many at a time as --workers; the
+    largest shards are queued first and every idle worker takes the next one, so no core
+    sits idle behind a long shard, or
+  - written as a SLURM array job (--slurm), one array task per shard.
+
+Each shard is retried up to --retries times and killed after --timeout seconds. Its outcome
+is recorded in <out>/status/<shard>.json (exit code, attempts, run time, structures whose
+ligand dpocket could not find), and the records of all shards are collected into
+dpocket_failed.tsv and dpocket_missing_ligand_pdbs.tsv. Shards that already finished are
+skipped when the batch is run again. dpocket tables are written to
+<out>/dpocket_outputs/<shard>_{fpocketp,fpocketnp,explicitp}.txt, ready for
+load_dpocket_outputs.py.
+
+Usage:
+    python3 run_dpocket_batch.py -i example_input_fatty_acyl.txt -o dpocket_fatty_acyl [--workers N]
+    python3 run_dpocket_batch.py -i example_input_fatty_acyl.txt -o dpocket_fatty_acyl --slurm --shards 200
+    sbatch dpocket_fatty_acyl/dpocket_array.sh
+    python3 run_dpocket_batch.py -o dpocket_fatty_acyl --collect
+"""
+import argparse
+import glob
+import hashlib
+import heapq
+import json
+import os
+import re
+import shlex
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from lipid_analysis.parallel import default_workers, parallel_map
+from lipid_analysis.protids import normalize_pdb_name
+
+SHARD_DIR = "split_inputs"
+OUTPUT_DIR = "dpocket_outputs"
+STATUS_DIR = "status"
+FAILED_LOG = "dpocket_failed.tsv"
+MISSING_LIGAND_LOG = "dpocket_missing_ligand_pdbs.tsv"
+SLURM_SCRIPT = "dpocket_array.sh"
+
+SHARD_NAME_RE = re.compile(r"^shard_\d+")
+
+# e.g. "ERROR - No ligand STE found in BD1hmt-A-A-STE1_protonated.pdb"
+NO_LIGAND_RE = re.compile(r"ERROR - No ligand.*?\bin\s+(\S+?\.pdb)")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-i",
+        "--input-list",
+        help="dpocket input list: '<pdb file> <ligand code>' per line.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        required=True,
+        help="Batch directory (shards, dpocket outputs, status records, logs).",
+    )
+    parser.add_argument(
+        "-p",
+        "--pdb-dir",
+        default=None,
+        help="Directory the PDB files of the input list are relative to. "
+        "Defaults to the directory of the input list.",
+    )
+    parser.add_argument(
+        "-n",
+        "--shards",
+        type=int,
+        default=None,
+        help="Number of shards. Defaults to 4 per worker (local) or 100 (--slurm).",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=default_workers(),
+        help="Number of dpocket processes run at a time. Defaults to all cores.",
+    )
+    parser.add_argument(
+        "-t",
+        "--timeout",
+        type=float,
+        default=3600,
+        help="Seconds after which a dpocket process is killed.",
+    )
+    parser.add_argument(
+        "-r",
+        "--retries",
+        type=int,
+        default=1,
+        help="Times a failed or timed-out shard is run again.",
+    )
+    parser.add_argument(
+        "--dpocket",
+        default="dpocket",
+        help="dpocket executable.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-run shards that already finished.",
+    )
+    parser.add_argument(
+        "--slurm",
+        action="store_true",
+        help="Write the shards and a SLURM array script instead of running them.",
+    )
+    parser.add_argument(
+        "--account",
+        default=None,
+        help="SLURM account (with --slurm).",
+    )
+    parser.add_argument(
+        "--time",
+        default="04:00:00",
+        help="SLURM wall time per array task (with --slurm).",
+    )
+    parser.add_argument(
+        "--max-running",
+        type=int,
+        default=None,
+        help="Maximum number of array tasks running at once (with --slurm).",
+    )
+    parser.add_argument(
+        "--run-shard",
+        type=int,
+        default=None,
+        help="Run a single shard by index (used by the SLURM array tasks).",
+    )
+    parser.add_argument(
+        "--collect",
+        action="store_true",
+        help="Only collect the status records of a batch into the failure logs.",
+    )
+    args = parser.parse_args()
+
+    if args.input_list is None and args.run_shard is None and not args.collect:
+        parser.error("--input-list is required unless --run-shard or --collect is given")
+
+    return args
+
+
+# --------------------------------------
+# Input list and sharding
+# --------------------------------------
+def read_input_list(input_list: str, pdb_dir: str = None) -> list:
+    """
+    Reads a dpocket input list.
+
+    Args:
+        input_list (str): file with one "<pdb file> <ligand code>" entry per line.
+        pdb_dir (str): directory the PDB files are relative to.
+            Defaults to the directory of the input list.
+    Returns:
+        a list of (pdb path, ligand code) tuples.
+    """
+    if pdb_dir is None:
+        pdb_dir = os.path.dirname(os.path.abspath(input_list))
+
+    entries = []
+    with open(input_list) as f:
+        for line in f:
+            fields = line.split()
+            if not fields or fields[0].startswith("#"):
+                continue
+            if len(fields) < 2:
+                print(f"WARNING: no ligand code for {fields[0]}, skipped")
+                continue
+            entries.append((os.path.join(pdb_dir, fields[0]), fields[1]))
+
+    return entries
+
+
+def count_atoms(pdb_path: str) -> int:
+    """
+    Returns the number of ATOM/HETATM records of a PDB file, or -1 if it cannot be read.
+    """
+    try:
+        with open(pdb_path, "rb") as f:
+            return sum(1 for line in f if line.startswith((b"ATOM", b"HETATM")))
+    except OSError:
+        return -1
+
+
+def make_shards(entries: list, atom_counts: list, n_shards: int) -> list:
+    """
+    Splits entries into shards of balanced total atom count.
+    Entries are assigned largest first, each to the currently lightest shard.
+
+    Args:
+        entries (list): (pdb path, ligand code) tuples.
+        atom_counts (list): atom count of each entry.
+        n_shards (int): number of shards.
+    Returns:
+        a list of (total atoms, entries) tuples, heaviest shard first.
+    """
+    n_shards = max(1, min(n_shards, len(entries)))
+    heap = [(0, i) for i in range(n_shards)]
+    shards = [[] for _ in range(n_shards)]
+    loads = [0] * n_shards
+
+    order = sorted(range(len(entries)), key=lambda i: -atom_counts[i])
+    for i in order:
+        load, shard = heapq.heappop(heap)
+        shards[shard].append(entries[i])
+        loads[shard] = load + atom_counts[i]
+        heapq.heappush(heap, (loads[shard], shard))
+
+    return sorted(zip(loads, shards), key=lambda shard: -shard[0])
+
+
+def shard_name(index: int) -> str:
+    return f"shard_{index:04d}"
+
+
+def prune_stale_shards(output_dir: str, shard_files: list):
+    """
+    Deletes dpocket outputs and status records a previous batch left behind: those of
+    shards the new batch no longer has, and those of shards whose input changed and
+    have to run again. Stale tables would otherwise be loaded as duplicate pockets, and
+    stale records reported as failures.
+    """
+    keep = {Path(p).stem for p in shard_files if is_finished(p, output_dir)}
+    patterns = [
+        os.path.join(output_dir, OUTPUT_DIR, "shard_*"),
+        os.path.join(output_dir, STATUS_DIR, "shard_*.json"),
+    ]
+    for pattern in patterns:
+        for path in glob.glob(pattern):
+            match = SHARD_NAME_RE.match(os.path.basename(path))
+            if match and match.group(0) not in keep:
+                os.remove(path)
+
+
+def write_shards(shards: list, output_dir: str) -> list:
+    """
+    Writes one dpocket input file per shard to <output_dir>/split_inputs/,
+    replacing the shards of a previous batch (see prune_stale_shards).
+
+    Returns:
+        the paths of the shard files, in shard order.
+    """
+    shard_dir = os.path.join(output_dir, SHARD_DIR)
+    os.makedirs(shard_dir, exist_ok=True)
+    for old_path in glob.glob(os.path.join(shard_dir, "shard_*.txt")):
+        os.remove(old_path)
+
+    paths = []
+    for index, (_, shard) in enumerate(shards):
+        path = os.path.join(shard_dir, f"{shard_name(index)}.txt")
+        with open(path, "w") as f:
+            for pdb_path, ligand in shard:
+                f.write(f"{pdb_path}\t{ligand}\n")
+        paths.append(path)
+
+    prune_stale_shards(output_dir, paths)
+
+    return paths
+
+
+# --------------------------------------
+# Running shards
+# --------------------------------------
+def status_path(output_dir: str, name: str) -> str:
+    return os.path.join(output_dir, STATUS_DIR, f"{name}.json")
+
+
+def shard_digest(shard_file: str) -> str:
+    with open(shard_file, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def is_finished(shard_file: str, output_dir: str) -> bool:
+    """
+    Whether a shard with the same content already ran to completion in an earlier run.
+    """
+    path = status_path(output_dir, Path(shard_file).stem)
+    if not os.path.exists(path):
+        return False
+    with open(path) as f:
+        record = json.load(f)
+    return record.get("status") == "ok" and record.get("sha256") == shard_digest(shard_file)
+
+
+def run_shard(shard_file: str, output_dir: str, dpocket: str = "dpocket",
+              timeout: float = 3600, retries: int = 1) -> dict:
+    """
+    Runs dpocket on one shard file, with retry and timeout, and records the outcome.
+
+    Args:
+        shard_file (str): dpocket input file of the shard.
+        output_dir (str): batch directory.
+        dpocket (str): dpocket executable.
+        timeout (float): seconds after which dpocket is killed.
+        retries (int): times a failed or timed-out run is repeated.
+    Returns:
+        the status record, also written to <output_dir>/status/<shard>.json.
+    """
+    name = Path(shard_file).stem
+    os.makedirs(os.path.join(output_dir, OUTPUT_DIR), exist_ok=True)
+    os.makedirs(os.path.join(output_dir, STATUS_DIR), exist_ok=True)
+    output_prefix = os.path.join(output_dir, OUTPUT_DIR, name)
+
+    with open(shard_file) as f:
+        ligands = dict(line.rstrip("\n").split("\t") for line in f if line.strip())
+
+    record = {
+        "shard": name,
+        "input_file": shard_file,
+        "sha256": shard_digest(shard_file),
+        "n_structures": len(ligands),
+    }
+    start = time.time()
+
+    for attempt in range(1, retries + 2):
+        try:
+            proc = subprocess.run(
+                [dpocket, "-f", shard_file, "-o", output_prefix],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                errors="replace",
+                timeout=timeout,
+            )
+            output = proc.stdout
+            status = "ok" if proc.returncode == 0 else "failed"
+            returncode = proc.returncode
+        except subprocess.TimeoutExpired as e:
+            output = e.stdout.decode(errors="replace") if isinstance(e.stdout, bytes) else (e.stdout or "")
+            status = "timeout"
+            returncode = None
+        except OSError as e:
+            output = str(e)
+            status = "failed"
+            returncode = None
+
+        if status == "ok":
+            break
+
+    missing = []
+    for pdb_file in NO_LIGAND_RE.findall(output):
+        # dpocket reports the file name as listed in the shard
+        pdb_path = next((p for p in ligands if p == pdb_file or p.endswith("/" + pdb_file)), pdb_file)
+        missing.append({"pdb": pdb_path, "ligand": ligands.get(pdb_path)})
+
+    record.update({
+        "status": status,
+        "returncode": returncode,
+        "attempts": attempt,
+        "seconds": round(time.time() - start, 1),
+        "missing_ligand": missing,
+        "log_tail": output.strip().splitlines()[-5:] if status != "ok" else [],
+    })
+
+    path = status_path(output_dir, name)
+    with open(path + ".tmp", "w") as f:
+        json.dump(record, f, indent=1)
+    os.replace(path + ".tmp", path)
+
+    return record
+
+
+def run_local(shard_files: list, output_dir: str, workers: int, **run_kwargs) -> list:
+    """
+    Runs shards with up to `workers` dpocket processes at a time.
+    Shards are taken from a shared queue in the given (heaviest first) order.
+    """
+    records = []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            pool.submit(run_shard, shard_file, output_dir, **run_kwargs): shard_file
+            for shard_file in shard_files
+        }
+        for i, future in enumerate(as_completed(futures), 1):
+            record = future.result()
+            records.append(record)
+            print(
+                f"[{i}/{len(futures)}] {record['shard']}: {record['status']} "
+                f"({record['n_structures']} structures, {record['seconds']} s)"
+            )
+
+    return records
+
+
+def collect_status(output_dir: str) -> tuple:
+    """
+    Collects the status records of all shards of a batch into
+    dpocket_failed.tsv and dpocket_missing_ligand_pdbs.tsv.
+
+    Returns:
+        (number of shards, failed shard records, missing-ligand entries).
+    """
+    records = []
+    for path in sorted(glob.glob(os.path.join(output_dir, STATUS_DIR, "shard_*.json"))):
+        # only shards of the current batch
+        if not os.path.exists(os.path.join(output_dir, SHARD_DIR, f"{Path(path).stem}.txt")):
+            continue
+        with open(path) as f:
+            records.append(json.load(f))
+
+    failed = [r for r in records if r["status"] != "ok"]
+    missing = [(r["shard"], m) for r in records for m in r["missing_ligand"]]
+
+    with open(os.path.join(output_dir, FAILED_LOG), "w") as f:
+        f.write("shard\tinput_file\tstatus\treturncode\tattempts\tlast_output\n")
+        for r in failed:
+            last_line = r["log_tail"][-1] if r["log_tail"] else ""
+            f.write(
+                f"{r['shard']}\t{r['input_file']}\t{r['status']}\t{r['returncode']}\t"
+                f"{r['attempts']}\t{last_line}\n"
+            )
+
+    with open(os.path.join(output_dir, MISSING_LIGAND_LOG), "w") as f:
+        f.write("shard\tpdb\tBioDolphinID\tligand\n")
+        for shard, m in missing:
+            f.write(f"{shard}\t{m['pdb']}\t{normalize_pdb_name(m['pdb'])}\t{m['ligand']}\n")
+
+    return len(records), failed, missing
+
+
+# --------------------------------------
+# SLURM array
+# --------------------------------------
+def write_slurm_script(output_dir: str, n_shards: int, args) -> str:
+    """
+    Writes a SLURM array script running one shard per array task.
+    """
+    script = os.path.abspath(__file__)
+    output_dir = os.path.abspath(output_dir)
+    array = f"0-{n_shards - 1}"
+    if args.max_running:
+        array += f"%{args.max_running}"
+
+    lines = [
+        "#!/bin/bash",
+        "",
+        "# dpocket SLURM array job written by run_dpocket_batch.py, one task per shard",
+        "",
+        "# submit with: sbatch " + SLURM_SCRIPT,
+        "",
+        f"#SBATCH -J dpocket_{Path(output_dir).name}",
+    ]
+    if args.account:
+        lines.append(f"#SBATCH -A {args.account}")
+    lines += [
+        "#SBATCH -N 1",
+        "#SBATCH -n 1",
+        f"#SBATCH -t {args.time}",
+        f"#SBATCH --array={array}",
+        f"#SBATCH -o {output_dir}/logs/dpocket_%A_%a.out",
+        f"#SBATCH -e {output_dir}/logs/dpocket_%A_%a.err",
+        "",
+        "conda activate fpocket_env",
+        "",
+        " ".join([
+            "python3", shlex.quote(script),
+            "-o", shlex.quote(output_dir),
+            "--run-shard", '"$SLURM_ARRAY_TASK_ID"',
+            "--dpocket", shlex.quote(args.dpocket),
+            "--timeout", str(args.timeout),
+            "--retries", str(args.retries),
+        ]),
+        "",
+    ]
+
+    os.makedirs(os.path.join(output_dir, "logs"), exist_ok=True)
+    path = os.path.join(output_dir, SLURM_SCRIPT)
+    with open(path, "w") as f:
+        f.write("\n".join(lines))
+    os.chmod(path, 0o755)
+
+    return path
+
+
+def print_summary(output_dir: str):
+    n_shards, failed, missing = collect_status(output_dir)
+    print(f"{n_shards - len(failed)} of {n_shards} shards finished")
+    print(f"Failed shards logged to: {os.path.join(output_dir, FAILED_LOG)} ({len(failed)})")
+    print(
+        f"PDBs with missing ligands logged to: {os.path.join(output_dir, MISSING_LIGAND_LOG)} "
+        f"({len(missing)})"
+    )
+
+
+def main():
+    args = parse_args()
+    run_kwargs = {"dpocket": args.dpocket, "timeout": args.timeout, "retries": args.retries}
+
+    if args.collect:
+        print_summary(args.output_dir)
+        return
+
+    if args.run_shard is not None:
+        shard_file = os.path.join(args.output_dir, SHARD_DIR, f"{shard_name(args.run_shard)}.txt")
+        record = run_shard(shard_file, args.output_dir, **run_kwargs)
+        print(f"{record['shard']}: {record['status']} after {record['attempts']} attempt(s)")
+        sys.exit(0 if record["status"] == "ok" else 1)
+
+    # --------------------------------------
+    # Shard the input list by atom count
+    # --------------------------------------
+    entries = read_input_list(args.input_list, args.pdb_dir)
+    atom_counts = list(parallel_map(count_atoms, [pdb for pdb, _ in entries], args.workers, chunk_size=256))
+
+    unreadable = [pdb for (pdb, _), n in zip(entries, atom_counts) if n < 0]
+    for pdb in unreadable:
+        print(f"WARNING: cannot read {pdb}, skipped")
+    kept = [i for i, n in enumerate(atom_counts) if n >= 0]
+    entries = [entries[i] for i in kept]
+    atom_counts = [atom_counts[i] for i in kept]
+
+    if not entries:
+        raise ValueError(f"No readable structures in {args.input_list}")
+
+    n_shards = args.shards
+    if n_shards is None:
+        n_shards = 100 if args.slurm else 4 * args.workers
+
+    shards = make_shards(entries, atom_counts, n_shards)
+    shard_files = write_shards(shards, args.output_dir)
+    print(
+        f"{len(entries)} structures in {len(shard_files)} shards "
+        f"of {shards[-1][0]}-{shards[0][0]} atoms"
+    )
+
+    if args.slurm:
+        path = write_slurm_script(args.output_dir, len(shard_files), args)
+        print(f"SLURM array script written to: {path}")
+        print(f"Submit with: sbatch {path}; then collect with --collect")
+        return
+
+    # --------------------------------------
+    # Run the shards locally
+    # --------------------------------------
+    if args.force:
+        todo = shard_files
+    else:
+        todo = [p for p in shard_files if not is_finished(p, args.output_dir)]
+        if len(todo) < len(shard_files):
+            print(f"{len(shard_files) - len(todo)} shards already finished, skipped")
+
+    run_local(todo, args.output_dir, args.workers, **run_kwargs)
+    print_summary(args.output_dir)
+
+
+if __name__ == "__main__":
+    main()
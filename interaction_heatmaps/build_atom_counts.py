@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Counts the PLIP interactions of every ligand atom, for all ligand codes of any number of
+lipid classes (all eight by default), and writes one <LIG>_lipid_atoms_total_clean.txt
+per ligand code.
+
+Each class's PLIP tree is walked once and every run is assigned to the ligand code of its
+folder name (BD1hmt-A-A-STE1 -> STE), so all heat map counts of a class come from a single
+pass instead of one <LIG>_interaction_map.sh run per ligand (lipid_analysis/ligand_atom_counts.py).
+Counts are written to the <class>/*_interaction_map/ folder holding <LIG>.pdb, or to a new
+<class>/<LIG>_interaction_map/ folder for ligands without one.
+
+Atom names differ between deposited entries, so the ligand atoms of every structure are
+matched onto the bonded heavy atoms of its <LIG>.pdb template (lipid_analysis/ligand_templates.py)
+and counted under the template's names; --no-templates keeps each structure's own names.
+
+Usage:
+    python3 build_atom_counts.py -r /PATH/plip                  # all lipid classes and ligands
+    python3 build_atom_counts.py -c sterol -l CLR ERG -r /PATH/plip
+"""
+
+import argparse
+import glob
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from lipid_analysis.ligand_atom_counts import (
+    ATOM_COUNTS_SUFFIX,
+    count_ligand_atoms,
+    format_atom_counts,
+)
+from lipid_analysis.ligand_templates import TemplateAligner
+from lipid_analysis.lipid_classes import LIPID_CLASSES, PLIP_ROOT, plip_class_root
+from lipid_analysis.parallel import default_workers
+from lipid_analysis.plip_report import iter_reports
+
+HEATMAP_ROOT = str(Path(__file__).resolve().parent)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-c",
+        "--classes",
+        nargs="+",
+        default=LIPID_CLASSES,
+        choices=LIPID_CLASSES,
+        help="Lipid classes to count. Defaults to all eight.",
+    )
+    parser.add_argument(
+        "-r",
+        "--plip-root",
+        default=PLIP_ROOT,
+        help="Directory holding one folder of PLIP runs per lipid class.",
+    )
+    parser.add_argument(
+        "-l",
+        "--ligands",
+        nargs="+",
+        default=None,
+        help="Ligand residue codes to write (e.g. CLR ERG). Defaults to every code found.",
+    )
+    parser.add_argument(
+        "-o",
+        "--heatmap-root",
+        default=HEATMAP_ROOT,
+        help="Directory holding the <class>/<LIG>_interaction_map/ folders.",
+    )
+    parser.add_argument(
+        "--no-templates",
+        action="store_true",
+        help="Count atoms by the names of each structure instead of mapping them onto "
+        "the <LIG>.pdb templates.",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=default_workers(),
+        help="Number of processes reading PLIP runs in parallel. Defaults to all cores.",
+    )
+    return parser.parse_args(argv)
+
+
+def find_templates(lipid_class, heatmap_root=HEATMAP_ROOT):
+    """
+    Returns the ligand code -> <LIG>.pdb template mapping of the heat map folders of a class.
+    """
+    pattern = os.path.join(heatmap_root, lipid_class, "*_interaction_map", "*.pdb")
+    return {Path(path).stem: path for path in sorted(glob.glob(pattern))}
+
+
+def interaction_map_dir(lipid_class, code, heatmap_root=HEATMAP_ROOT):
+    """
+    Returns the heat map folder of a ligand: the <class>/*_interaction_map/ folder holding
+    <LIG>.pdb or <LIG>_lipid_atoms_total_clean.txt, else <class>/<LIG>_interaction_map/.
+    """
+    class_dir = os.path.join(heatmap_root, lipid_class)
+
+    for filename in (f"{code}.pdb", f"{code}{ATOM_COUNTS_SUFFIX}"):
+        matches = sorted(glob.glob(os.path.join(class_dir, "*_interaction_map", filename)))
+        if matches:
+            return os.path.dirname(matches[0])
+
+    return os.path.join(class_dir, f"{code}_interaction_map")
+
+
+def write_atom_counts(lipid_class, code, counts, heatmap_root=HEATMAP_ROOT):
+    """
+    Writes <LIG>_lipid_atoms_total_clean.txt of one ligand and returns its path.
+    """
+    output_dir = interaction_map_dir(lipid_class, code, heatmap_root)
+    os.makedirs(output_dir, exist_ok=True)
+
+    output_path = os.path.join(output_dir, f"{code}{ATOM_COUNTS_SUFFIX}")
+    tmp_path = os.path.join(output_dir, f".{code}{ATOM_COUNTS_SUFFIX}.tmp")
+    with open(tmp_path, "w") as f:
+        f.write(format_atom_counts(counts))
+    os.replace(tmp_path, output_path)
+
+    return output_path
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    n_written = 0
+    found = set()
+    for lipid_class in args.classes:
+        root_dir = plip_class_root(lipid_class, args.plip_root)
+        if not os.path.isdir(root_dir):
+            print(f"WARNING: {lipid_class}: {root_dir} not found, skipping.")
+            continue
+
+        aligner = None if args.no_templates else TemplateAligner(
+            find_templates(lipid_class, args.heatmap_root)
+        )
+        atom_counts = count_ligand_atoms(
+            iter_reports(root_dir), args.ligands, args.workers, aligner=aligner
+        )
+        found.update(atom_counts)
+        if aligner is not None:
+            print(f"{lipid_class}: {aligner.n_variants} atom naming variants aligned to templates")
+
+        for code, counts in sorted(atom_counts.items()):
+            if not counts:
+                print(f"WARNING: {lipid_class} {code}: no interacting ligand atoms, skipping.")
+                continue
+            output_path = write_atom_counts(lipid_class, code, counts, args.heatmap_root)
+            print(f"{lipid_class} {code}: {sum(counts.values())} interactions written to {output_path}")
+            n_written += 1
+
+    for code in sorted(set(args.ligands or []) - found):
+        print(f"WARNING: {code}: no PLIP runs found.")
+
+    print(f"\nDone. {n_written} atom count files written.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Renders the PyMOL interaction maps of all ligands of any number of lipid classes
+(all eight by default) in one headless PyMOL session.
+
+For every <class>/*_interaction_map/ folder holding <LIG>.pdb and
+<LIG>_lipid_atoms_total_clean.txt (build_atom_counts.py), the ligand is loaded, the
+interaction count of each atom is written to its B-factor with a single cmd.alter call,
+and the atoms are colored blue (fewest) to red (most interactions) with cmd.spectrum,
+as <LIG>_interaction_map_pymol.py does with one color per atom. Each map is written to
+<LIG>_map.png and <LIG>_map.pse next to the template.
+
+Requires the PyMOL Python module (pymol-open-source, or the Python of a PyMOL install).
+
+Usage:
+    python3 render_pymol_maps.py                              # all lipid classes
+    python3 render_pymol_maps.py -c sterol -l CLR ERG --width 2400 --height 1800
+"""
+
+import argparse
+import glob
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from lipid_analysis.ligand_atom_counts import ATOM_COUNTS_SUFFIX
+from lipid_analysis.lipid_classes import LIPID_CLASSES
+
+HEATMAP_ROOT = str(Path(__file__).resolve().parent)
+PALETTE = "blue_red"
+# atoms without interactions keep their element colors
+NO_COUNT = -1.0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-c",
+        "--classes",
+        nargs="+",
+        default=LIPID_CLASSES,
+        choices=LIPID_CLASSES,
+        help="Lipid classes to render. Defaults to all eight.",
+    )
+    parser.add_argument(
+        "-l",
+        "--ligands",
+        nargs="+",
+        default=None,
+        help="Ligand residue codes to render (e.g. CLR ERG). Defaults to every map found.",
+    )
+    parser.add_argument(
+        "-o",
+        "--heatmap-root",
+        default=HEATMAP_ROOT,
+        help="Directory holding the <class>/<LIG>_interaction_map/ folders.",
+    )
+    parser.add_argument("--width", type=int, default=1200, help="PNG width in pixels.")
+    parser.add_argument("--height", type=int, default=900, help="PNG height in pixels.")
+    parser.add_argument("--dpi", type=int, default=300, help="PNG resolution.")
+    parser.add_argument(
+        "--no-ray",
+        action="store_true",
+        help="Save the OpenGL image instead of ray tracing each PNG.",
+    )
+    return parser.parse_args(argv)
+
+
+def find_maps(lipid_classes, heatmap_root=HEATMAP_ROOT, ligands=None):
+    """
+    Returns (ligand code, template PDB, atom counts file) of every interaction map folder
+    holding both files.
+    """
+    maps = []
+    for lipid_class in lipid_classes:
+        pattern = os.path.join(heatmap_root, lipid_class, "*_interaction_map", "*.pdb")
+        for pdb_path in sorted(glob.glob(pattern)):
+            code = Path(pdb_path).stem
+            if ligands is not None and code not in ligands:
+                continue
+
+            counts_path = os.path.join(os.path.dirname(pdb_path), f"{code}{ATOM_COUNTS_SUFFIX}")
+            if not os.path.exists(counts_path):
+                print(f"WARNING: {lipid_class} {code}: {counts_path} not found, skipping.")
+                continue
+            maps.append((code, pdb_path, counts_path))
+
+    return maps
+
+
+def read_atom_counts(counts_path):
+    """
+    Reads <LIG>_lipid_atoms_total_clean.txt into an atom name -> count dictionary.
+    """
+    counts = {}
+    with open(counts_path) as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2:
+                counts[parts[0]] = counts.get(parts[0], 0) + int(parts[1])
+
+    return counts
+
+
+def render_map(cmd, code, pdb_path, counts, args):
+    """
+    Colors one ligand by interaction count and writes <LIG>_map.png and <LIG>_map.pse.
+    """
+    output_dir = os.path.dirname(pdb_path)
+    obj = code if code[0].isalpha() else f"lig_{code}"
+
+    cmd.load(pdb_path, obj)
+    cmd.show_as("sticks", obj)
+
+    cmd.alter(obj, "b = counts.get(name, no_count)", space={"counts": counts, "no_count": NO_COUNT})
+    cmd.spectrum("b", PALETTE, f"{obj} and not b < 0", minimum=0, maximum=max(counts.values()))
+
+    cmd.orient(obj)
+    cmd.zoom(obj, complete=1)
+
+    png_path = os.path.join(output_dir, f"{code}_map.png")
+    cmd.png(png_path, width=args.width, height=args.height, dpi=args.dpi, ray=0 if args.no_ray else 1)
+    pse_path = os.path.join(output_dir, f"{code}_map.pse")
+    cmd.save(pse_path)
+
+    cmd.delete(obj)
+
+    return png_path, pse_path
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    maps = find_maps(args.classes, args.heatmap_root, args.ligands)
+    if not maps:
+        print("No interaction maps found.")
+        return
+
+    # one headless session for every map
+    from pymol import cmd
+
+    n_rendered = 0
+    for code, pdb_path, counts_path in maps:
+        counts = read_atom_counts(counts_path)
+        if not counts:
+            print(f"WARNING: {code}: {counts_path} is empty, skipping.")
+            continue
+
+        png_path, pse_path = render_map(cmd, code, pdb_path, counts, args)
+        print(f"{code}: {png_path}, {pse_path}")
+        n_rendered += 1
+
+    print(f"\nDone. {n_rendered} interaction maps rendered.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Lists ligands bound by several distinct proteins, for any number of lipid classes
+(all eight by default).
+
+Proteins are read from the ProteinCartography results of all classes at once into an
+index of (lipid class, ligand, protein signature) -> protids, which is saved to
+sameligand_index.parquet together with the cartography root and the size and modification
+time of every results file, and rebuilt when any of these differ (or with --rebuild).
+The list of each requested class is printed; with --write, it is written to
+<class>/<class>_sameligand_differentprotein_list/<class>.txt. With --ligands or
+--leiden-clusters, the matching index rows are printed instead.
+
+Usage:
+    python3 sameligand_differentproteins.py -c sterol
+    python3 sameligand_differentproteins.py --write          # all lipid classes
+    python3 sameligand_differentproteins.py -l CLR ERG
+    python3 sameligand_differentproteins.py -g LC05 --shared-only -c sterol
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from lipid_analysis.lipid_classes import CARTOGRAPHY_ROOT, LIPID_CLASSES, cartography_tsv
+from lipid_analysis.manifest import file_fingerprint
+
+HEATMAP_ROOT = str(Path(__file__).resolve().parent)
+INDEX_FILE = os.path.join(HEATMAP_ROOT, "sameligand_index.parquet")
+# Parquet metadata key of the cartography root and results files the index was built from
+INDEX_SOURCES_KEY = b"sameligand_sources"
+
+# a protein is defined by these columns of the ProteinCartography results
+SIGNATURE_COLUMNS = ["Protein names", "LeidenCluster", "Pfam", "InterPro"]
+INDEX_KEYS = ["lipid_class", "ligand"] + SIGNATURE_COLUMNS
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-c",
+        "--classes",
+        nargs="+",
+        default=LIPID_CLASSES,
+        choices=LIPID_CLASSES,
+        help="Lipid classes to list. Defaults to all eight.",
+    )
+    parser.add_argument(
+        "-m",
+        "--cartography-root",
+        default=CARTOGRAPHY_ROOT,
+        help="Directory holding the ProteinCartography results.",
+    )
+    parser.add_argument(
+        "--write",
+        action="store_true",
+        help="Write each list to <class>/<class>_sameligand_differentprotein_list/<class>.txt.",
+    )
+    parser.add_argument(
+        "-l",
+        "--ligands",
+        nargs="+",
+        default=None,
+        help="Look up the proteins binding these ligand codes in the index (e.g. CLR).",
+    )
+    parser.add_argument(
+        "-g",
+        "--leiden-clusters",
+        nargs="+",
+        default=None,
+        help="Look up the ligands bound in these LeidenClusters in the index (e.g. LC05).",
+    )
+    parser.add_argument(
+        "--shared-only",
+        action="store_true",
+        help="Only look up ligands bound by several distinct proteins.",
+    )
+    parser.add_argument(
+        "--index",
+        default=INDEX_FILE,
+        help="Parquet file of the shared-ligand index of all lipid classes.",
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Rebuild the index even if it is up to date.",
+    )
+    return parser.parse_args(argv)
+
+
+def parse_ligands(protids):
+    """
+    Returns the ligand code of every protid of a Series: the first three characters of the
+    last dash-delimited field (NaN if it is shorter).
+
+    Examples:
+    BD1jpz-A-A-1401     -> 140
+    BD5uxy-A-A-X901     -> X90
+    BDxxxx-A-B-LIG1402  -> LIG
+    """
+    last_field = protids.str.split("-").str[-1]
+    return last_field.str[:3].where(last_field.str.len() >= 3)
+
+
+def load_class_proteins(lipid_class, cartography_root=CARTOGRAPHY_ROOT):
+    """
+    Returns the protid, ligand and protein signature columns of the ProteinCartography
+    results file of a lipid class, or None if the file is missing.
+    """
+    tsv_file = cartography_tsv(lipid_class, cartography_root)
+    if not os.path.exists(tsv_file):
+        print(f"WARNING: {lipid_class}: {tsv_file} not found, skipping.")
+        return None
+
+    df = pd.read_csv(
+        tsv_file,
+        sep="\t",
+        dtype=str,
+        usecols=lambda col: col == "protid" or col in SIGNATURE_COLUMNS,
+    )
+    df = df.dropna(subset=["protid"])
+
+    # a protein is defined by its name, LeidenCluster, Pfam and InterPro
+    for col in SIGNATURE_COLUMNS:
+        if col not in df.columns:
+            df[col] = ""
+
+    df["ligand"] = parse_ligands(df["protid"])
+    df = df.dropna(subset=["ligand"])
+    df.insert(0, "lipid_class", lipid_class)
+
+    return df[INDEX_KEYS + ["protid"]]
+
+
+def build_ligand_index(lipid_classes=LIPID_CLASSES, cartography_root=CARTOGRAPHY_ROOT):
+    """
+    Builds the ligand x protein signature -> protids index of several lipid classes.
+
+    Returns:
+        a DataFrame with one row per (lipid class, ligand, protein signature) holding its
+        protids (in file order), n_protids, and n_proteins, the number of distinct proteins
+        binding the ligand in that class. Proteins of a ligand keep their file order.
+    """
+    frames = [load_class_proteins(c, cartography_root) for c in lipid_classes]
+    frames = [df for df in frames if df is not None]
+    if not frames:
+        raise FileNotFoundError(f"No ProteinCartography results found in {cartography_root}")
+
+    proteins = pd.concat(frames, ignore_index=True)
+
+    index = (
+        proteins
+        .groupby(INDEX_KEYS, sort=False, dropna=False)["protid"]
+        .agg(protids=list, n_protids="size")
+        .reset_index()
+    )
+    index["n_proteins"] = index.groupby(["lipid_class", "ligand"])["ligand"].transform("size")
+
+    # lipid classes in the requested order, ligands sorted, proteins in order of appearance
+    index["_class_order"] = index["lipid_class"].map({c: i for i, c in enumerate(lipid_classes)})
+    index = index.sort_values(["_class_order", "ligand"], kind="stable").drop(columns="_class_order")
+
+    return index.reset_index(drop=True)
+
+
+def index_sources(cartography_root=CARTOGRAPHY_ROOT):
+    """
+    Returns what an index of all lipid classes is built from: the cartography root and the
+    path, size and modification time of every ProteinCartography results file found.
+    """
+    files = {}
+    for lipid_class in LIPID_CLASSES:
+        tsv_file = os.path.abspath(cartography_tsv(lipid_class, cartography_root))
+        if os.path.exists(tsv_file):
+            files[tsv_file] = file_fingerprint(tsv_file, digest=False)
+
+    return {"cartography_root": os.path.abspath(cartography_root), "files": files}
+
+
+def index_is_stale(index_path, cartography_root=CARTOGRAPHY_ROOT):
+    """
+    Returns True if the index is missing or was built from another cartography root or
+    from other results files (added, deleted or changed) than those found now.
+    """
+    if not os.path.exists(index_path):
+        return True
+
+    metadata = pq.read_schema(index_path).metadata or {}
+    sources = metadata.get(INDEX_SOURCES_KEY)
+    if sources is None:
+        return True
+
+    return json.loads(sources) != index_sources(cartography_root)
+
+
+def load_ligand_index(index_path=INDEX_FILE, cartography_root=CARTOGRAPHY_ROOT, rebuild=False):
+    """
+    Loads the index of all lipid classes, building and saving it first if it is missing,
+    out of date or rebuild is set. The sources of the index (see index_sources) are saved
+    in the Parquet metadata.
+    """
+    if not rebuild and not index_is_stale(index_path, cartography_root):
+        return pd.read_parquet(index_path)
+
+    print(f"Building the shared-ligand index of all lipid classes: {index_path}")
+    sources = index_sources(cartography_root)
+    index = build_ligand_index(LIPID_CLASSES, cartography_root)
+
+    table = pa.Table.from_pandas(index, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[INDEX_SOURCES_KEY] = json.dumps(sources, sort_keys=True).encode()
+    table = table.replace_schema_metadata(metadata)
+
+    os.makedirs(os.path.dirname(os.path.abspath(index_path)), exist_ok=True)
+    tmp_path = f"{index_path}.tmp"
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, index_path)
+
+    return index
+
+
+def query_index(index, ligands=None, leiden_clusters=None, lipid_classes=None, shared_only=False):
+    """
+    Returns the rows of the index for the given ligands and/or LeidenClusters.
+
+    Args:
+        index (pd.DataFrame): index of build_ligand_index / load_ligand_index.
+        ligands (list): ligand codes to keep (e.g. ["CLR"]). Defaults to all.
+        leiden_clusters (list): LeidenClusters to keep (e.g. ["LC05"]). Defaults to all.
+        lipid_classes (list): lipid class IDs to keep. Defaults to all.
+        shared_only (bool): keep only ligands bound by several distinct proteins.
+    """
+    keep = pd.Series(True, index=index.index)
+    if ligands is not None:
+        keep &= index["ligand"].isin(ligands)
+    if leiden_clusters is not None:
+        keep &= index["LeidenCluster"].isin(leiden_clusters)
+    if lipid_classes is not None:
+        keep &= index["lipid_class"].isin(lipid_classes)
+    if shared_only:
+        keep &= index["n_proteins"] > 1
+
+    return index[keep]
+
+
+def _cell(value):
+    # missing values are printed as in the original lists
+    return "nan" if value is None or (isinstance(value, float) and pd.isna(value)) else value
+
+
+def format_shared_ligands(index):
+    """
+    Returns the report of ligands shared by multiple distinct proteins.
+
+    Args:
+        index (pd.DataFrame): index rows of one lipid class (see build_ligand_index).
+    """
+    lines = ["Ligands shared by distinct proteins:", ""]
+
+    shared = index[index["n_proteins"] > 1]
+    for ligand, proteins in shared.groupby("ligand", sort=True):
+        lines.append(f"Ligand: {ligand}")
+        signatures = proteins[SIGNATURE_COLUMNS].itertuples(index=False, name=None)
+        for i, (signature, protids) in enumerate(zip(signatures, proteins["protids"]), start=1):
+            protein_name, leiden, pfam, interpro = map(_cell, signature)
+            lines.append(f"  Protein {i}:")
+            lines.append(f"    Protein names : {protein_name}")
+            lines.append(f"    LeidenCluster : {leiden}")
+            lines.append(f"    Pfam          : {pfam}")
+            lines.append(f"    InterPro      : {interpro}")
+            lines.append(f"    Protids:")
+            for p in protids:
+                lines.append(f"      {p}")
+        lines.append("")
+
+    return "\n".join(lines) + "\n"
+
+
+def format_query(rows):
+    """
+    Returns the table of a query_index result, one protein per line.
+    """
+    if rows.empty:
+        return "No matching ligands.\n"
+
+    table = rows.assign(protids=rows["protids"].map(lambda p: ",".join(p)))
+    return table.to_string(index=False) + "\n"
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    index = load_ligand_index(args.index, args.cartography_root, args.rebuild)
+
+    if args.ligands is not None or args.leiden_clusters is not None:
+        rows = query_index(index, args.ligands, args.leiden_clusters, args.classes, args.shared_only)
+        print(format_query(rows), end="")
+        return
+
+    for lipid_class in args.classes:
+        class_index = index[index["lipid_class"] == lipid_class]
+        if class_index.empty:
+            print(f"WARNING: {lipid_class}: not in the index, skipping.")
+            continue
+
+        report = format_shared_ligands(class_index)
+
+        if not args.write:
+            print(report, end="")
+            continue
+
+        output_dir = os.path.join(HEATMAP_ROOT, lipid_class, f"{lipid_class}_sameligand_differentprotein_list")
+        os.makedirs(output_dir, exist_ok=True)
+        output_path = os.path.join(output_dir, f"{lipid_class}.txt")
+        with open(output_path, "w") as f:
+            f.write(report)
+        print(f"{lipid_class}: shared-ligand list written to {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+"""
+Shared helpers for the lipid-protein interaction analyses in this repository.
+
+The scripts under plip_analysis/, dpocket_analysis/, pfam_analysis/, secondarystructure/
+and interaction_heatmaps/ import from this package instead of re-implementing parsing
+of PLIP reports and lipid-class bookkeeping in every copy.
+"""
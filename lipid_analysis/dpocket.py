@@ -0,0 +1,212 @@
+"""
+Loader for dpocket result tables (dpout_fpocketp.txt, dpout_fpocketnp.txt, dpout_explicitp.txt).
+
+dpocket writes one whitespace-delimited table per pocket set and run
+(<prefix>_fpocketp.txt etc., e.g. dpocket_outputs/<input>_fpocketp.txt from the SLURM job
+in dpocket_analysis/example_dpocket_run/dpocket_fatty_acyl.sh). Every table has the same
+57 columns, so files are parsed with a fixed schema and written, tagged with lipid class,
+pocket set and run, to a Parquet store partitioned by lipid class
+(<store>/lipid_class=<class>/pockets.parquet).
+"""
+import os
+import re
+from pathlib import Path
+from typing import Iterator, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+__all__ = [
+    "DPOCKET_STORE",
+    "DPOUT_COLUMNS",
+    "POCKET_SETS",
+    "SCHEMA",
+    "iter_dpout_files",
+    "read_dpout",
+    "write_pockets",
+    "load_pockets",
+]
+
+# Default location of the store, next to the dpocket plotting scripts
+DPOCKET_STORE = str(Path(__file__).resolve().parents[1] / "dpocket_analysis" / "dpocket_pockets")
+
+POCKETS_FILE = "pockets.parquet"
+
+# dpocket pocket sets: pockets overlapping the ligand, other pockets, explicit ligand pocket
+POCKET_SETS = ["fpocketp", "fpocketnp", "explicitp"]
+
+AMINO_ACIDS = [
+    "ALA", "ARG", "ASN", "ASP", "CYS", "GLN", "GLU", "GLY", "HIS", "ILE",
+    "LEU", "LYS", "MET", "PHE", "PRO", "SER", "THR", "TRP", "TYR", "VAL",
+]
+
+# dpout column -> dtype (header of dpout_fpocketp.txt)
+DPOUT_COLUMNS = {
+    "pdb": "string",
+    "lig": "string",
+    "overlap": "float64",
+    "PP-crit": "int64",
+    "PP-dst": "float64",
+    "crit4": "float64",
+    "crit5": "float64",
+    "crit6": "int64",
+    "crit6_continue": "float64",
+    "lig_vol": "float64",
+    "pock_vol": "float64",
+    "nb_AS": "int64",
+    "nb_AS_norm": "float64",
+    "mean_as_ray": "float64",
+    "mean_as_solv_acc": "float64",
+    "apol_as_prop": "float64",
+    "apol_as_prop_norm": "float64",
+    "mean_loc_hyd_dens": "float64",
+    "mean_loc_hyd_dens_norm": "float64",
+    "hydrophobicity_score": "float64",
+    "volume_score": "float64",
+    "polarity_score": "int64",
+    "polarity_score_norm": "float64",
+    "charge_score": "int64",
+    "flex": "float64",
+    "prop_polar_atm": "float64",
+    "as_density": "float64",
+    "as_density_norm": "float64",
+    "as_max_dst": "float64",
+    "as_max_dst_norm": "float64",
+    "drug_score": "float64",
+    "convex_hull_volume": "float64",
+    "surf_pol_vdw14": "float64",
+    "surf_pol_vdw22": "float64",
+    "surf_apol_vdw14": "float64",
+    "surf_apol_vdw22": "float64",
+    "n_abpa": "int64",
+    **{aa: "int64" for aa in AMINO_ACIDS},
+}
+
+ARROW_TYPES = {"string": pa.string(), "float64": pa.float64(), "int64": pa.int64()}
+
+# store schema: dpout columns plus the run (output prefix) and pocket set of each row
+SCHEMA = pa.schema(
+    [(col, ARROW_TYPES[dtype]) for col, dtype in DPOUT_COLUMNS.items()]
+    + [("run", pa.string()), ("pocket_set", pa.string())]
+)
+
+# <prefix>_<pocket set>.txt, e.g. dpout_fpocketp.txt
+DPOUT_RE = re.compile(r"^(?P<run>.+)_(?P<pocket_set>" + "|".join(POCKET_SETS) + r")\.txt$")
+
+
+def iter_dpout_files(root_dir: str) -> Iterator[tuple]:
+    """
+    Walks a directory tree and yields every dpocket result table, in sorted order.
+
+    Args:
+        root_dir (str): directory to search (e.g. dpocket_outputs).
+    Yields:
+        (path, run name, pocket set) tuples.
+    """
+    for root, dirs, files in os.walk(root_dir):
+        dirs.sort()
+        for filename in sorted(files):
+            match = DPOUT_RE.match(filename)
+            if match:
+                yield os.path.join(root, filename), match.group("run"), match.group("pocket_set")
+
+
+def read_dpout(path: str, run: Optional[str] = None, pocket_set: Optional[str] = None) -> pd.DataFrame:
+    """
+    Reads one dpocket result table with the fixed dpout schema.
+    The header line is skipped, and extra trailing fields are ignored.
+
+    Args:
+        path (str): path to a <prefix>_<pocket set>.txt file.
+        run (str): run name to tag the rows with. Defaults to the file prefix.
+        pocket_set (str): pocket set to tag the rows with. Defaults to the file suffix.
+    """
+    match = DPOUT_RE.match(os.path.basename(path))
+    if run is None:
+        run = match.group("run") if match else None
+    if pocket_set is None:
+        pocket_set = match.group("pocket_set") if match else None
+
+    # numeric columns are parsed as float so that missing values don't fail the read
+    df = pd.read_csv(
+        path,
+        sep=r"\s+",
+        header=None,
+        skiprows=1,
+        names=list(DPOUT_COLUMNS),
+        usecols=range(len(DPOUT_COLUMNS)),
+        dtype={col: "float64" if dtype != "string" else "object" for col, dtype in DPOUT_COLUMNS.items()},
+        engine="c",
+    )
+    df["run"] = run
+    df["pocket_set"] = pocket_set
+
+    return df
+
+
+def write_pockets(frames, lipid_class: str, store_dir: str = DPOCKET_STORE) -> int:
+    """
+    Writes the pockets of one lipid class to the store, replacing its previous partition.
+
+    Args:
+        frames (iterable): DataFrames from read_dpout.
+        lipid_class (str): lipid class ID used as partition key.
+        store_dir (str): root directory of the store.
+    Returns:
+        the number of rows written.
+    """
+    out_dir = os.path.join(store_dir, f"lipid_class={lipid_class}")
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, POCKETS_FILE)
+    # dot prefix: ignored by the dataset reader while being written
+    tmp_path = os.path.join(out_dir, f".{POCKETS_FILE}.tmp")
+
+    n_rows = 0
+    with pq.ParquetWriter(tmp_path, SCHEMA) as writer:
+        for df in frames:
+            # float -> int64 casts fail loudly if an integer column holds fractions
+            table = pa.Table.from_pandas(df, schema=SCHEMA, preserve_index=False)
+            writer.write_table(table)
+            n_rows += table.num_rows
+
+    os.replace(tmp_path, out_path)
+
+    return n_rows
+
+
+def load_pockets(
+    store_dir: str = DPOCKET_STORE,
+    columns: Optional[list] = None,
+    lipid_classes: Optional[list] = None,
+    pocket_sets: Optional[list] = None,
+) -> pd.DataFrame:
+    """
+    Loads pockets from the store.
+    Only the requested columns are read, and the lipid class / pocket set filters are
+    pushed down to the Parquet reader.
+
+    Args:
+        store_dir (str): root directory of the store.
+        columns (list): columns to load (plus "lipid_class" if wanted). Defaults to all.
+        lipid_classes (list): lipid class IDs to keep. Defaults to all.
+        pocket_sets (list): pocket sets to keep (see POCKET_SETS). Defaults to all.
+    """
+    if not os.path.isdir(store_dir):
+        raise FileNotFoundError(
+            f"No dpocket store at {store_dir}. Run dpocket_analysis/load_dpocket_outputs.py"
+        )
+
+    dataset = ds.dataset(store_dir, format="parquet", partitioning="hive")
+
+    expression = None
+    if lipid_classes is not None:
+        expression = ds.field("lipid_class").isin(list(lipid_classes))
+    if pocket_sets is not None:
+        pocket_filter = ds.field("pocket_set").isin(list(pocket_sets))
+        expression = pocket_filter if expression is None else expression & pocket_filter
+
+    table = dataset.to_table(columns=columns, filter=expression)
+
+    return table.to_pandas()
@@ -0,0 +1,72 @@
+"""
+On-disk cache of DSSP secondary structure assignments.
+
+Running DSSP dominates the secondary structure analysis, and its result depends only on the
+PDB file. Assignments are therefore stored per structure, keyed by the SHA-256 of the file
+contents (<cache>/<sha256[:2]>/<sha256>.json), so re-running with another distance cutoff
+or metadata file, or for another lipid class sharing the structure, never calls DSSP again.
+"""
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+from Bio.PDB import DSSP, PDBParser
+
+from lipid_analysis.manifest import file_fingerprint
+
+__all__ = [
+    "DSSP_CACHE",
+    "dssp_cache_path",
+    "secondary_structure",
+]
+
+# Default location of the cache, next to the secondary structure outputs
+DSSP_CACHE = str(Path(__file__).resolve().parents[1] / "secondarystructure" / ".dssp_cache")
+
+
+def dssp_cache_path(pdb_path: str, cache_dir: str = DSSP_CACHE) -> str:
+    """
+    Returns the cache file of a PDB file (which need not exist yet).
+    """
+    digest = file_fingerprint(pdb_path)["sha256"]
+    return os.path.join(cache_dir, digest[:2], f"{digest}.json")
+
+
+def secondary_structure(pdb_path: str, model=None, cache_dir: Optional[str] = DSSP_CACHE) -> dict:
+    """
+    Returns the DSSP assignment of every residue of a structure, from the cache if possible.
+
+    Args:
+        pdb_path (str): path to the PDB file.
+        model: first Bio.PDB model of the structure, if already parsed.
+        cache_dir (str): cache directory, or None to always run DSSP.
+    Returns:
+        a dictionary of (chain ID, residue number) -> DSSP code ("H", "E", "-", ...).
+    """
+    cache_path = dssp_cache_path(pdb_path, cache_dir) if cache_dir else None
+
+    if cache_path and os.path.exists(cache_path):
+        with open(cache_path) as f:
+            return {(chain, resnum): ss for chain, resnum, ss in json.load(f)["residues"]}
+
+    if model is None:
+        model = PDBParser(QUIET=True).get_structure("structure", pdb_path)[0]
+
+    dssp = DSSP(model, pdb_path)
+    residue_ss = {}
+    for key in dssp.keys():
+        chain_id, res_id = key
+        residue_ss[(chain_id, res_id[1])] = dssp[key][2]
+
+    if cache_path:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({
+                "pdb": os.path.basename(pdb_path),
+                "residues": [[chain, resnum, ss] for (chain, resnum), ss in residue_ss.items()],
+            }, f)
+        os.replace(tmp_path, cache_path)
+
+    return residue_ss
@@ -0,0 +1,385 @@
+"""
+Columnar (Parquet) store of PLIP interactions.
+
+All interaction rows of all lipid classes live in one typed table, partitioned by
+lipid class (hive layout: <store>/lipid_class=<class>/interactions.parquet).
+Every row keeps its link back to the structure (BioDolphinID), binding site, residue and
+ligand atoms, so plotting scripts can load just the columns and rows they need.
+"""
+import os
+from pathlib import Path
+from typing import Iterable, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+__all__ = [
+    "PLIP_STORE",
+    "PARTITION_FILE",
+    "COLUMN_TYPES",
+    "SCHEMA",
+    "convert_value",
+    "ligand_atom_indices",
+    "records_to_table",
+    "partition_dir",
+    "read_partition",
+    "write_partition",
+    "update_partition",
+    "load_interactions",
+    "load_feature",
+]
+
+# Default location of the store, next to the PLIP plotting scripts
+PLIP_STORE = str(Path(__file__).resolve().parents[1] / "plip_analysis" / "plip_interactions")
+
+PARTITION_FILE = "interactions.parquet"
+
+# PLIP report column -> value type
+COLUMN_TYPES = {
+    "BioDolphinID": "str",
+    "binding_site": "str",
+    "interaction": "str",
+    "RESNR": "int",
+    "RESTYPE": "str",
+    "RESCHAIN": "str",
+    "RESNR_LIG": "int",
+    "RESTYPE_LIG": "str",
+    "RESCHAIN_LIG": "str",
+    "SIDECHAIN": "bool",
+    "PROTISDON": "bool",
+    "PROTISPOS": "bool",
+    "PROTCHARGED": "bool",
+    "DIST": "float",
+    "DIST_H-A": "float",
+    "DIST_D-A": "float",
+    "DIST_A-W": "float",
+    "DIST_D-W": "float",
+    "DON_ANGLE": "float",
+    "ACC_ANGLE": "float",
+    "WATER_ANGLE": "float",
+    "CENTDIST": "float",
+    "ANGLE": "float",
+    "OFFSET": "float",
+    "RMS": "float",
+    "DONORTYPE": "str",
+    "ACCEPTORTYPE": "str",
+    "LIG_GROUP": "str",
+    "TYPE": "str",
+    "METAL_TYPE": "str",
+    "TARGET_TYPE": "str",
+    "LOCATION": "str",
+    "GEOMETRY": "str",
+    "COORDINATION": "int",
+    "COMPLEXNUM": "int",
+    "DONORIDX": "int",
+    "ACCEPTORIDX": "int",
+    "DONOR_IDX": "int",
+    "ACCEPTOR_IDX": "int",
+    "WATER_IDX": "int",
+    "DON_IDX": "int",
+    "ACC_IDX": "int",
+    "METAL_IDX": "int",
+    "TARGET_IDX": "int",
+    "LIGCARBONIDX": "int_list",
+    "PROTCARBONIDX": "int_list",
+    "PROT_IDX_LIST": "int_list",
+    "LIG_IDX_LIST": "int_list",
+    "LIG_ATOM_IDX": "int_list",
+    "LIGCOO": "coord",
+    "PROTCOO": "coord",
+    "WATERCOO": "coord",
+    "METALCOO": "coord",
+    "TARGETCOO": "coord",
+}
+
+ARROW_TYPES = {
+    "str": pa.string(),
+    "int": pa.int64(),
+    "float": pa.float64(),
+    "bool": pa.bool_(),
+    "int_list": pa.list_(pa.int64()),
+    "coord": pa.list_(pa.float64(), 3),
+}
+
+SCHEMA = pa.schema([(col, ARROW_TYPES[kind]) for col, kind in COLUMN_TYPES.items()])
+
+
+def convert_value(value, kind: str):
+    """
+    Converts a PLIP report string to a typed value, returning None for empty or invalid cells.
+    Values that are already typed (e.g. from plip_xml.parse_report_xml) are returned unchanged.
+
+    Args:
+        value (str): cell value.
+        kind (str): value type (see COLUMN_TYPES).
+    """
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        return value
+    value = value.strip()
+    if value == "":
+        return None
+
+    try:
+        if kind == "str":
+            return value
+        if kind == "int":
+            return int(value)
+        if kind == "float":
+            return float(value)
+        if kind == "bool":
+            return value.lower() == "true"
+        if kind == "int_list":
+            return [int(v) for v in value.split(",") if v.strip()]
+        if kind == "coord":
+            coord = [float(v) for v in value.split(",")]
+            return coord if len(coord) == 3 else None
+    except ValueError:
+        return None
+
+
+def ligand_atom_indices(record: dict) -> Optional[list]:
+    """
+    Returns the ligand-side atom indices of a typed interaction record.
+
+    Args:
+        record (dict): typed interaction record (see records_to_table).
+    """
+    interaction = record.get("interaction")
+
+    if interaction == "hydrophobic":
+        return record.get("LIGCARBONIDX")
+    if interaction in ("salt_bridges", "pi_stacking", "pi_cation"):
+        return record.get("LIG_IDX_LIST")
+    if interaction == "hydrogen_bonds":
+        idx = record.get("ACCEPTORIDX") if record.get("PROTISDON") else record.get("DONORIDX")
+    elif interaction == "water_bridges":
+        idx = record.get("ACCEPTOR_IDX") if record.get("PROTISDON") else record.get("DONOR_IDX")
+    elif interaction == "halogen_bonds":
+        # the halogen donor always belongs to the ligand
+        idx = record.get("DON_IDX")
+    elif interaction == "metal_bonds":
+        idx = record.get("TARGET_IDX") if record.get("LOCATION") == "ligand" else None
+    else:
+        idx = None
+
+    return None if idx is None else [idx]
+
+
+def records_to_table(records: Iterable[dict]) -> pa.Table:
+    """
+    Converts interaction records (as yielded by plip_report.parse_report or
+    plip_xml.parse_report_xml) to a typed table.
+    Columns that PLIP did not report for an interaction type are left null.
+
+    Args:
+        records (iterable): interaction records with string or typed values.
+    """
+    columns = {col: [] for col in COLUMN_TYPES}
+
+    for record in records:
+        typed = {col: convert_value(record.get(col), kind) for col, kind in COLUMN_TYPES.items()}
+        typed["LIG_ATOM_IDX"] = ligand_atom_indices(typed)
+        for col in COLUMN_TYPES:
+            columns[col].append(typed[col])
+
+    return pa.table(columns, schema=SCHEMA)
+
+
+def _batched(records: Iterable[dict], batch_size: int):
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def partition_dir(lipid_class: str, store_dir: str = PLIP_STORE) -> str:
+    """
+    Returns the directory of the store partition of one lipid class.
+
+    Args:
+        lipid_class (str): lipid class ID used as partition key.
+        store_dir (str): root directory of the store.
+    """
+    return os.path.join(store_dir, f"lipid_class={lipid_class}")
+
+
+def read_partition(lipid_class: str, store_dir: str = PLIP_STORE) -> Optional[pa.Table]:
+    """
+    Reads the whole store partition of one lipid class, or returns None if it doesn't exist.
+
+    Args:
+        lipid_class (str): lipid class ID used as partition key.
+        store_dir (str): root directory of the store.
+    """
+    path = os.path.join(partition_dir(lipid_class, store_dir), PARTITION_FILE)
+    if not os.path.exists(path):
+        return None
+
+    return pq.read_table(path, schema=SCHEMA)
+
+
+def write_partition(
+    records: Iterable[dict],
+    lipid_class: str,
+    store_dir: str = PLIP_STORE,
+    batch_size: int = 50000,
+) -> int:
+    """
+    Streams interaction records into the store partition of one lipid class,
+    replacing any previous contents of that partition.
+
+    Args:
+        records (iterable): interaction records with string or typed values.
+        lipid_class (str): lipid class ID used as partition key.
+        store_dir (str): root directory of the store.
+        batch_size (int): number of records converted and written at a time.
+    Returns:
+        the number of rows written.
+    """
+    out_dir = partition_dir(lipid_class, store_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, PARTITION_FILE)
+    # dot prefix: ignored by the dataset reader while being written
+    tmp_path = os.path.join(out_dir, f".{PARTITION_FILE}.tmp")
+
+    n_rows = 0
+    with pq.ParquetWriter(tmp_path, SCHEMA) as writer:
+        for batch in _batched(records, batch_size):
+            table = records_to_table(batch)
+            writer.write_table(table)
+            n_rows += table.num_rows
+
+    os.replace(tmp_path, out_path)
+
+    return n_rows
+
+
+def update_partition(
+    records: Iterable[dict],
+    lipid_class: str,
+    replaced_ids: Iterable[str],
+    id_order: list,
+    store_dir: str = PLIP_STORE,
+    batch_size: int = 50000,
+) -> int:
+    """
+    Replaces the rows of some structures in the store partition of one lipid class.
+
+    Rows of replaced_ids are dropped, the new records are added, and the partition is
+    reordered by id_order, so the result is the same as re-extracting every report.
+
+    Args:
+        records (iterable): interaction records of new or changed reports.
+        lipid_class (str): lipid class ID used as partition key.
+        replaced_ids (iterable): BioDolphinIDs whose rows are removed or replaced.
+        id_order (list): BioDolphinIDs in report order; rows of other IDs are dropped.
+        store_dir (str): root directory of the store.
+        batch_size (int): number of rows per Parquet row group.
+    Returns:
+        the number of rows in the partition.
+    """
+    tables = []
+
+    existing = read_partition(lipid_class, store_dir)
+    if existing is not None:
+        replaced = pa.array(sorted(set(replaced_ids)), pa.string())
+        tables.append(existing.filter(pc.invert(pc.is_in(existing["BioDolphinID"], replaced))))
+
+    for batch in _batched(records, batch_size):
+        tables.append(records_to_table(batch))
+
+    table = pa.concat_tables(tables) if tables else SCHEMA.empty_table()
+
+    # stable sort by position of the structure in report order
+    position = pc.index_in(table["BioDolphinID"], value_set=pa.array(id_order, pa.string()))
+    table = table.filter(pc.is_valid(position))
+    position = position.filter(pc.is_valid(position))
+    table = table.take(pc.sort_indices(position))
+
+    out_dir = partition_dir(lipid_class, store_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, PARTITION_FILE)
+    tmp_path = os.path.join(out_dir, f".{PARTITION_FILE}.tmp")
+
+    pq.write_table(table, tmp_path, row_group_size=batch_size)
+    os.replace(tmp_path, out_path)
+
+    return table.num_rows
+
+
+def load_interactions(
+    store_dir: str = PLIP_STORE,
+    columns: Optional[list] = None,
+    lipid_classes: Optional[list] = None,
+    interactions: Optional[list] = None,
+) -> pd.DataFrame:
+    """
+    Loads interaction rows from the store.
+    Only the requested columns are read, and the lipid class / interaction type filters
+    are pushed down to the Parquet reader.
+
+    Args:
+        store_dir (str): root directory of the store.
+        columns (list): columns to load (plus "lipid_class" if wanted). Defaults to all.
+        lipid_classes (list): lipid class IDs to keep. Defaults to all.
+        interactions (list): interaction types to keep (e.g. "hydrogen_bonds").
+            Defaults to all.
+    """
+    if not os.path.isdir(store_dir):
+        raise FileNotFoundError(
+            f"No interaction store at {store_dir}. Run plip_analysis/extract_plip_interactions.py"
+        )
+
+    dataset = ds.dataset(store_dir, format="parquet", partitioning="hive")
+
+    expression = None
+    if lipid_classes is not None:
+        expression = ds.field("lipid_class").isin(list(lipid_classes))
+    if interactions is not None:
+        interaction_filter = ds.field("interaction").isin(list(interactions))
+        expression = interaction_filter if expression is None else expression & interaction_filter
+
+    table = dataset.to_table(columns=columns, filter=expression)
+
+    return table.to_pandas()
+
+
+def load_feature(
+    interaction: str,
+    column: str,
+    store_dir: str = PLIP_STORE,
+    lipid_classes: Optional[list] = None,
+) -> dict:
+    """
+    Loads one feature of one interaction type, grouped by lipid class.
+    Replaces reading the one-value-per-line files (e.g. <class>_hbond_stats/dist_DA.txt).
+
+    Args:
+        interaction (str): interaction type (e.g. "hydrogen_bonds").
+        column (str): PLIP column (e.g. "DIST_D-A").
+        store_dir (str): root directory of the store.
+        lipid_classes (list): lipid class IDs to load. Defaults to all.
+    Returns:
+        a dictionary of lipid class ID -> pd.Series of non-null values.
+    """
+    df = load_interactions(
+        store_dir,
+        columns=["lipid_class", column],
+        lipid_classes=lipid_classes,
+        interactions=[interaction],
+    )
+    df = df.dropna(subset=[column])
+
+    return {
+        str(lipid_class): values.reset_index(drop=True)
+        for lipid_class, values in df.groupby("lipid_class", observed=True)[column]
+    }
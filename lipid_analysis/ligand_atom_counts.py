@@ -0,0 +1,257 @@
+"""
+Per-ligand-atom interaction counts for the interaction heat maps.
+
+Each PLIP run folder (named after its BioDolphinID, e.g. BD1hmt-A-A-STE1) holds the
+structure of one ligand instance. The atom indices of its PLIP interactions (LIGCARBONIDX,
+DONORIDX, ACCEPTORIDX and LIG_IDX_LIST, as in the interaction_heatmaps/<class>/
+<LIG>_interaction_map/*.sh scripts) are looked up in the HETATM records of the ligand in
+the run's own PDB file and summed per ligand atom name. All ligand codes are counted in the
+same pass over the reports, so every <LIG>_lipid_atoms_total_clean.txt of a lipid class
+comes from one walk of its PLIP tree. With a ligand_templates.TemplateAligner, atom
+names of every structure are first translated to those of the ligand's reference template.
+"""
+import glob
+import os
+import re
+from collections import Counter
+from functools import partial
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+
+from lipid_analysis.ligand_templates import TemplateAligner
+from lipid_analysis.parallel import parallel_map
+from lipid_analysis.pdb_atoms import read_pdb_atoms, select_altlocs
+from lipid_analysis.plip_report import parse_report
+
+__all__ = [
+    "INDEX_COLUMNS",
+    "ATOM_COUNTS_SUFFIX",
+    "ALL_ATOM_LIGANDS",
+    "ligand_code",
+    "structure_pdb",
+    "ligand_atoms",
+    "ligand_atom_names",
+    "first_instance",
+    "interaction_indices",
+    "scan_structure",
+    "canonical_counts",
+    "count_ligand_atoms",
+    "format_atom_counts",
+]
+
+# PLIP columns whose atom indices are counted, and whether they hold a comma-separated list
+INDEX_COLUMNS = {
+    "LIGCARBONIDX": True,
+    "DONORIDX": False,
+    "ACCEPTORIDX": False,
+    "LIG_IDX_LIST": True,
+}
+
+# <LIG>_lipid_atoms_total_clean.txt
+ATOM_COUNTS_SUFFIX = "_lipid_atoms_total_clean.txt"
+
+# ligand code (first three characters) and instance number of the last ID field,
+# e.g. BD1hmt-A-A-STE1 -> STE
+LIGAND_FIELD_RE = re.compile(r"^(\w{3})[0-9]+$")
+INDEX_LIST_RE = re.compile(r"^[0-9,]+$")
+
+# Ligands whose <LIG>_lipid_atoms_total_clean.txt lists every ligand atom, with 0 for
+# atoms without interactions (as their <LIG>_interaction_map.sh scripts did)
+ALL_ATOM_LIGANDS = frozenset({
+    "ACD", "STE", "DGA", "TGL", "P5S", "POV", "24G", "U20", "CIS", "Z1T",
+})
+
+
+def ligand_code(biodolphin_id: str) -> Optional[str]:
+    """
+    Returns the ligand residue code of a BioDolphinID, or None if it has none.
+
+    Args:
+        biodolphin_id (str): BioDolphinID / PLIP run folder name (e.g. "BD1hmt-A-A-STE1").
+    """
+    match = LIGAND_FIELD_RE.match(biodolphin_id.split("-")[-1])
+    return match.group(1) if match else None
+
+
+def structure_pdb(run_dir: str) -> Optional[str]:
+    """
+    Returns the PDB file of a PLIP run folder (the first in sorted order), or None.
+    """
+    pdb_files = sorted(glob.glob(os.path.join(run_dir, "*.pdb")))
+    return pdb_files[0] if pdb_files else None
+
+
+def ligand_atoms(pdb_path: str, code: str) -> np.ndarray:
+    """
+    Returns the HETATM records of a ligand in a PDB file (all instances of all models).
+    Atoms without a name or element are left out.
+
+    Args:
+        pdb_path (str): path to the PDB file.
+        code (str): ligand residue code (e.g. "CLR").
+    """
+    atoms = read_pdb_atoms(pdb_path, first_model=False)
+    atoms = atoms[atoms["het"] & (atoms["resname"] == code)]
+    return atoms[(atoms["name"] != "") & (atoms["element"] != "")]
+
+
+def ligand_atom_names(atoms: np.ndarray) -> dict:
+    """
+    Returns the serial -> (atom name, element) mapping of ligand atoms.
+    """
+    return {
+        serial: (name, element)
+        for serial, name, element in zip(
+            atoms["serial"].tolist(), atoms["name"].tolist(), atoms["element"].tolist()
+        )
+    }
+
+
+def first_instance(atoms: np.ndarray) -> np.ndarray:
+    """
+    Returns the atoms of the first residue (chain, number, insertion code) among ligand
+    atoms, with one record per atom (the most occupied alternate location).
+    """
+    if len(atoms) == 0:
+        return atoms
+
+    first = atoms[0]
+    keep = (
+        (atoms["chain"] == first["chain"])
+        & (atoms["resnum"] == first["resnum"])
+        & (atoms["icode"] == first["icode"])
+    )
+    return select_altlocs(atoms[keep])
+
+
+def interaction_indices(record: dict) -> list:
+    """
+    Returns the atom indices of one PLIP interaction record (see plip_report.parse_report)
+    in the INDEX_COLUMNS. Cells that are not indices are skipped.
+    """
+    indices = []
+
+    for column, is_list in INDEX_COLUMNS.items():
+        value = record.get(column)
+        if not value:
+            continue
+        if is_list and INDEX_LIST_RE.match(value):
+            indices.extend(int(v) for v in value.split(",") if v)
+        elif not is_list and value.isdigit():
+            indices.append(int(value))
+
+    return indices
+
+
+def scan_structure(report_path: str, all_atom_ligands: Iterable[str] = ALL_ATOM_LIGANDS) -> Optional[tuple]:
+    """
+    Counts the interactions of each ligand atom name in one PLIP run.
+    Atom indices are resolved against the ligand atoms of the run's own PDB file, so
+    the counts are keyed by (BioDolphinID, serial) and independent of other structures.
+    Indices of protein atoms (e.g. DONORIDX of protein donors) do not match and are left out.
+
+    Args:
+        report_path (str): path to the report.txt of the run.
+        all_atom_ligands (iterable): ligand codes whose atoms without interactions are
+            counted as 0 rather than left out.
+    Returns:
+        (ligand code, Counter of (atom name, element) -> interactions, atoms of the first
+        ligand instance), or None if the run folder has no ligand code.
+    """
+    run_dir = os.path.dirname(report_path)
+    code = ligand_code(Path(run_dir).name)
+    if code is None:
+        return None
+
+    pdb_path = structure_pdb(run_dir)
+    if pdb_path is None:
+        print(f"WARNING: no PDB file in {run_dir}, skipping.")
+        return code, Counter(), None
+
+    atoms = ligand_atoms(pdb_path, code)
+    atom_names = ligand_atom_names(atoms)
+
+    counts = Counter()
+    if code in all_atom_ligands:
+        counts.update(dict.fromkeys(atom_names.values(), 0))
+    for record in parse_report(report_path):
+        for idx in interaction_indices(record):
+            atom = atom_names.get(idx)
+            if atom is not None:
+                counts[atom] += 1
+
+    # the instance aligned to the template: first residue of the first model
+    return code, counts, first_instance(atoms[atoms["model"] == 0])
+
+
+def canonical_counts(counts: Counter, name_map: Optional[dict]) -> Counter:
+    """
+    Renames the atoms of per-structure counts with a name -> template name mapping
+    (see ligand_templates.TemplateAligner). Atoms not in the mapping keep their names;
+    atoms mapped to None (not in the template) are dropped.
+    """
+    if not name_map:
+        return counts
+
+    renamed = Counter()
+    for (name, element), n in counts.items():
+        new_name = name_map.get(name, name)
+        if new_name is not None:
+            renamed[(new_name, element)] += n
+    return renamed
+
+
+def count_ligand_atoms(
+    report_paths: Iterable[str],
+    ligands: Optional[Iterable[str]] = None,
+    workers: Optional[int] = 1,
+    chunk_size: int = 16,
+    aligner: Optional[TemplateAligner] = None,
+    all_atom_ligands: Iterable[str] = ALL_ATOM_LIGANDS,
+) -> dict:
+    """
+    Counts the interactions of every ligand atom name, for all ligand codes at once.
+    Runs are streamed one at a time, so memory is bounded by the number of distinct
+    atom names rather than the number of structures.
+
+    Args:
+        report_paths (iterable): paths to report.txt files, one per PLIP run.
+        ligands (iterable): ligand codes to count. Defaults to all codes found.
+        workers (int): number of worker processes (None for all cores, 1 for serial).
+        chunk_size (int): number of runs handed to a worker at a time.
+        aligner (TemplateAligner): renames the atoms of every structure to the atom names
+            of its ligand's template. Defaults to keeping the names of each structure.
+        all_atom_ligands (iterable): ligand codes whose atoms without interactions are
+            kept with a count of 0.
+    Returns:
+        a dictionary of ligand code -> Counter of (atom name, element) -> interactions.
+    """
+    if ligands is not None:
+        ligands = set(ligands)
+        report_paths = (
+            path for path in report_paths
+            if ligand_code(Path(path).parent.name) in ligands
+        )
+
+    atom_counts = {}
+    scan = partial(scan_structure, all_atom_ligands=frozenset(all_atom_ligands))
+    for result in parallel_map(scan, report_paths, workers, chunk_size):
+        if result is None:
+            continue
+        code, counts, instance = result
+        if aligner is not None and counts:
+            counts = canonical_counts(counts, aligner.name_map(code, instance))
+        atom_counts.setdefault(code, Counter()).update(counts)
+
+    return atom_counts
+
+
+def format_atom_counts(counts: Counter) -> str:
+    """
+    Formats the atom counts of one ligand as <LIG>_lipid_atoms_total_clean.txt
+    ("<atom name> <count> <element>" lines, most interacting atoms first).
+    """
+    rows = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    return "".join(f"{name} {n} {element}\n" for (name, element), n in rows)
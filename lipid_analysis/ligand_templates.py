@@ -0,0 +1,287 @@
+"""
+Canonical atom names of ligands, by graph matching onto reference templates.
+
+The same ligand code is named differently between deposited entries (and PDB files
+written by different tools), so counts summed by atom name can mix atoms that are not
+equivalent. Each structure's ligand is turned into a graph of its bonded heavy atoms
+(bonds inferred from covalent radii) and matched onto the graph of a reference template,
+the <LIG>.pdb of the ligand's interaction_heatmaps/<class>/*_interaction_map/ folder,
+preferring mappings that keep atom names. Structures missing atoms of the template (or
+templates missing atoms of the structure) are matched as subgraphs; structure atoms
+without a template atom are dropped from the counts. Atoms that are
+equivalent in the graph (e.g. the two oxygens of a carboxylate) are interchangeable.
+
+Matches are memoized per (ligand code, atom-name set), so aligning every instance of a
+ligand costs one graph match per naming variant.
+"""
+from collections import deque
+from typing import Optional
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from lipid_analysis.pdb_atoms import read_pdb_atoms
+
+__all__ = [
+    "COVALENT_RADII",
+    "BOND_TOLERANCE",
+    "LigandGraph",
+    "heavy_atoms",
+    "ligand_graph",
+    "match_graphs",
+    "TemplateAligner",
+]
+
+# Covalent radii (Å) of the elements found in lipids; other elements use DEFAULT_RADIUS
+COVALENT_RADII = {
+    "C": 0.76,
+    "N": 0.71,
+    "O": 0.66,
+    "P": 1.07,
+    "S": 1.05,
+    "F": 0.57,
+    "CL": 1.02,
+    "BR": 1.20,
+    "I": 1.39,
+    "SE": 1.20,
+    "B": 0.84,
+}
+DEFAULT_RADIUS = 0.80
+
+# Two atoms are bonded if closer than the sum of their radii plus this tolerance (Å)
+BOND_TOLERANCE = 0.45
+
+HYDROGENS = {"H", "D"}
+
+# Search steps after which a match is given up (highly symmetric, badly differing graphs)
+MAX_MATCH_STEPS = 200000
+
+
+class LigandGraph:
+    """
+    Graph of the bonded heavy atoms of a ligand.
+
+    Args:
+        names (list): atom names.
+        elements (list): element symbols (upper case).
+        neighbors (list): set of bonded atom positions of every atom.
+    """
+
+    def __init__(self, names: list, elements: list, neighbors: list):
+        self.names = names
+        self.elements = elements
+        self.neighbors = neighbors
+
+    def __len__(self):
+        return len(self.names)
+
+
+def heavy_atoms(atoms: np.ndarray) -> np.ndarray:
+    """
+    Returns the atoms of a ligand that are not hydrogens (ATOM_DTYPE records).
+    """
+    return atoms[~np.isin(np.char.upper(atoms["element"]), list(HYDROGENS))]
+
+
+def ligand_graph(atoms: np.ndarray) -> LigandGraph:
+    """
+    Builds the heavy-atom graph of one ligand residue.
+
+    Args:
+        atoms (np.ndarray): atoms of the ligand (lipid_analysis.pdb_atoms.ATOM_DTYPE).
+            Hydrogens are left out.
+    """
+    atoms = heavy_atoms(atoms)
+    elements = np.char.upper(atoms["element"]).tolist()
+
+    radii = np.array([COVALENT_RADII.get(e, DEFAULT_RADIUS) for e in elements])
+    neighbors = [set() for _ in elements]
+
+    if len(atoms) > 1:
+        cutoff = 2 * radii.max() + BOND_TOLERANCE
+        for i, j in cKDTree(atoms["coord"]).query_pairs(cutoff):
+            if np.linalg.norm(atoms["coord"][i] - atoms["coord"][j]) <= radii[i] + radii[j] + BOND_TOLERANCE:
+                neighbors[i].add(j)
+                neighbors[j].add(i)
+
+    return LigandGraph(atoms["name"].tolist(), elements, neighbors)
+
+
+def _match_order(graph: LigandGraph) -> list:
+    """
+    Orders the atoms of a graph for matching: breadth-first through each connected
+    component, starting from its most connected atom, so every atom after the first of a
+    component has an already matched neighbor.
+    """
+    order = []
+    seen = set()
+
+    for start in sorted(range(len(graph)), key=lambda i: -len(graph.neighbors[i])):
+        if start in seen:
+            continue
+        seen.add(start)
+        queue = deque([start])
+        while queue:
+            atom = queue.popleft()
+            order.append(atom)
+            for neighbor in sorted(graph.neighbors[atom], key=lambda i: -len(graph.neighbors[i])):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    queue.append(neighbor)
+
+    return order
+
+
+def match_graphs(query: LigandGraph, template: LigandGraph,
+                 max_steps: int = MAX_MATCH_STEPS) -> Optional[dict]:
+    """
+    Maps the atoms of query onto atoms of template of the same element, such that every
+    bond of query is a bond of template (an isomorphism if both graphs have the same atoms
+    and bonds). Candidates with the same atom name are tried first, so a query named like
+    the template maps onto itself.
+
+    Args:
+        query (LigandGraph): graph to map; must not have more atoms than template.
+        template (LigandGraph): reference graph.
+        max_steps (int): number of search steps after which the match is given up.
+    Returns:
+        a dictionary of query atom position -> template atom position, or None.
+    """
+    if len(query) > len(template):
+        return None
+
+    template_by_name = {name: i for i, name in enumerate(template.names)}
+    order = _match_order(query)
+    mapping = {}
+    used = set()
+    steps = 0
+
+    def candidates(atom):
+        mapped_neighbors = [mapping[n] for n in query.neighbors[atom] if n in mapping]
+        if mapped_neighbors:
+            pool = template.neighbors[mapped_neighbors[0]]
+        else:
+            pool = range(len(template))
+
+        element = query.elements[atom]
+        degree = len(query.neighbors[atom])
+        found = [
+            t for t in pool
+            if t not in used
+            and template.elements[t] == element
+            and len(template.neighbors[t]) >= degree
+            and all(m in template.neighbors[t] for m in mapped_neighbors)
+        ]
+
+        same_name = template_by_name.get(query.names[atom])
+        if same_name in found:
+            found.remove(same_name)
+            found.insert(0, same_name)
+        return found
+
+    def extend(position):
+        nonlocal steps
+        if position == len(order):
+            return True
+
+        atom = order[position]
+        for t in candidates(atom):
+            steps += 1
+            if steps > max_steps:
+                return False
+            mapping[atom] = t
+            used.add(t)
+            if extend(position + 1):
+                return True
+            del mapping[atom]
+            used.discard(t)
+
+        return False
+
+    return dict(mapping) if extend(0) else None
+
+
+class TemplateAligner:
+    """
+    Maps the atom names of ligand instances onto the atom names of reference templates.
+
+    Args:
+        templates (dict): ligand code -> template PDB file (e.g. "CLR" -> ".../CLR.pdb").
+    """
+
+    def __init__(self, templates: dict):
+        self.templates = dict(templates)
+        self._graphs = {}
+        self._cache = {}
+
+    def template_graph(self, code: str) -> Optional[LigandGraph]:
+        """
+        Returns the heavy-atom graph of the template of a ligand code, or None if it has none.
+        """
+        if code not in self.templates:
+            return None
+        if code not in self._graphs:
+            self._graphs[code] = ligand_graph(read_pdb_atoms(self.templates[code]))
+        return self._graphs[code]
+
+    def name_map(self, code: str, atoms: np.ndarray) -> Optional[dict]:
+        """
+        Returns the atom name -> template atom name mapping of the heavy atoms of one
+        ligand residue, or None if the ligand has no template, repeats heavy atom names or
+        does not match the template. Heavy atoms of the residue that are not in the
+        template map to None. Mappings are computed once per (ligand code, heavy
+        atom-name set); hydrogens are not matched and do not take part.
+
+        Args:
+            code (str): ligand residue code.
+            atoms (np.ndarray): atoms of one instance of the ligand (ATOM_DTYPE), with
+                one record per atom (see pdb_atoms.select_altlocs).
+        """
+        if code not in self.templates:
+            return None
+
+        # the name set of a residue with repeated names (alternate locations, several
+        # models) stands for other residues too, so such residues are neither aligned nor cached
+        names = heavy_atoms(atoms)["name"].tolist()
+        if len(set(names)) != len(names):
+            print(f"WARNING: {code}: repeated atom names in one residue, keeping their names.")
+            return None
+
+        key = (code, frozenset(names))
+        if key not in self._cache:
+            self._cache[key] = self._align(code, atoms)
+        return self._cache[key]
+
+    def _align(self, code, atoms):
+        template = self.template_graph(code)
+        query = ligand_graph(atoms)
+
+        if len(query) <= len(template):
+            mapping = match_graphs(query, template)
+        else:
+            # template has fewer atoms than the structure: match it into the structure
+            mapping = match_graphs(template, query)
+            mapping = None if mapping is None else {q: t for t, q in mapping.items()}
+
+        if mapping is None:
+            print(f"WARNING: {code}: atoms {sorted(query.names)} do not match the template, "
+                  "keeping their names.")
+            return None
+
+        name_map = {query.names[q]: template.names[t] for q, t in mapping.items()}
+
+        # atoms beyond the template have no equivalent atom, and their own names may be
+        # template names given to other atoms
+        unmatched = sorted(name for name in query.names if name not in name_map)
+        if unmatched:
+            print(f"WARNING: {code}: atoms {unmatched} are not in the template, dropping their counts.")
+            name_map.update(dict.fromkeys(unmatched))
+
+        return name_map
+
+    @property
+    def n_variants(self) -> int:
+        """
+        Number of distinct (ligand code, atom-name set) variants aligned so far.
+        """
+        return len(self._cache)
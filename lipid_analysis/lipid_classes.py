@@ -0,0 +1,194 @@
+"""
+Registry of the lipid classes analyzed in this study.
+
+Every per-class script used to carry its own copy of the class paths, labels and colors.
+They are defined once here: class ID, display name (also the sheet name in
+Source_Data_dpocket.xlsx), figure color and the input roots of each class.
+"""
+import os
+from pathlib import Path
+
+__all__ = [
+    "LIPID_CLASS_REGISTRY",
+    "LIPID_CLASSES",
+    "FIGURE_ORDER",
+    "PLIP_ROOT",
+    "PLIP_FOLDERS",
+    "PFAM_SOURCE_ROOT",
+    "CARTOGRAPHY_ROOT",
+    "get_lipid_class",
+    "class_labels",
+    "class_colors",
+    "plip_class_root",
+    "pfam_source_workbook",
+    "cartography_tsv",
+]
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Root directory holding one PLIP output folder per lipid class
+PLIP_ROOT = "/Volumes/8TB_McShan_Drive/nikki/project_1/plip"
+
+# Root directory of the BioDolphin exports (one workbook per lipid class, duplicates removed)
+PFAM_SOURCE_ROOT = "/Volumes/8TB_McShan_Drive/nikki/project_1/duplicates_deleted"
+
+# ProteinCartography cluster-mode results shipped with the repository
+CARTOGRAPHY_ROOT = str(REPO_ROOT / "proteincartography")
+
+# Lipid class ID -> settings, in manuscript order (matches plip_analysis/1_sterol ...
+# 8_glycerophospholipid)
+#   display_name:    label in figures and sheet name in Source_Data_dpocket.xlsx
+#   color:           fill color in the cross-class figures
+#   plip_folder:     folder of the PLIP runs below PLIP_ROOT
+#   pfam_workbook:   BioDolphin export below PFAM_SOURCE_ROOT
+#   pfam_summary:    PFAM summary written by pfam_analysis/pfam_frequencies/extract_pfam.py
+#   cartography_run: ProteinCartography results below CARTOGRAPHY_ROOT (without the suffix)
+LIPID_CLASS_REGISTRY = {
+    "sterol": {
+        "display_name": "Sterol",
+        "color": "#F2C9D1",
+        "plip_folder": "sterol_lipids",
+        "pfam_workbook": "Sterol_lipids.xlsx",
+        "pfam_summary": "sterol_pfams_summary.xlsx",
+        "cartography_run": "final_results_cluster-mode_sterols/cluster-mode-sterols",
+    },
+    "polyketide": {
+        "display_name": "Polyketide",
+        "color": "#CBC7D6",
+        "plip_folder": "polyketide",
+        "pfam_workbook": "polyketide.xlsx",
+        "pfam_summary": "polyketide_pfams_summary.xlsx",
+        "cartography_run": "final_results_cluster-mode_polyketides/cluster-mode-polyketides",
+    },
+    "prenol": {
+        "display_name": "Prenol",
+        "color": "#D0F2F2",
+        "plip_folder": "prenol_lipid",
+        "pfam_workbook": "prenol_lipid.xlsx",
+        "pfam_summary": "prenol_pfams_summary.xlsx",
+        "cartography_run": "final_results_cluster-mode_prenols/cluster-mode-prenol",
+    },
+    "saccharolipid": {
+        "display_name": "Saccharolipid",
+        "color": "#F5F5F5",
+        "plip_folder": "saccharo_lipid",
+        "pfam_workbook": "saccharo_lipid.xlsx",
+        "pfam_summary": "saccharolipid_pfams_summary.xlsx",
+        "cartography_run": "final_results_cluster-mode_saccharolipids/cluster-mode-saccharolipids",
+    },
+    "sphingolipid": {
+        "display_name": "Sphingolipid",
+        "color": "#F2ECD3",
+        "plip_folder": "sphingo_lipids",
+        "pfam_workbook": "sphingo_lipid.xlsx",
+        "pfam_summary": "sphingolipid_pfams_summary.xlsx",
+        "cartography_run": "final_results_cluster-mode_sphingolipids/cluster-mode-sphingolipids",
+    },
+    "fattyacyl": {
+        "display_name": "Fatty Acyl",
+        "color": "#F2DDBF",
+        "plip_folder": "Fatty_acyl",
+        "pfam_workbook": "Fatty_acyl.xlsx",
+        "pfam_summary": "fatty_acyl_pfams_summary.xlsx",
+        "cartography_run": "final_results_cluster-mode_fattyacyls/cluster-mode-fattyacyl",
+    },
+    "glycerolipid": {
+        "display_name": "Glycerolipid",
+        "color": "#D4EBD1",
+        "plip_folder": "Gylcerolipids",
+        "pfam_workbook": "Gylcerolipids.xlsx",
+        "pfam_summary": "glycerolipid_pfams_summary.xlsx",
+        "cartography_run": "final_results_cluster-mode_glycerolipids/cluster-mode-glycerolipid",
+    },
+    "glycerophospholipid": {
+        "display_name": "Glycerophospholipid",
+        "color": "#F5C1CE",
+        "plip_folder": "Glycerophospholipid",
+        "pfam_workbook": "glycerophospholipid.xlsx",
+        "pfam_summary": "glycerophospholipid_pfams_summary.xlsx",
+        "cartography_run": "final_results_cluster-mode_glycerophospholipid/cluster-mode-glycerophospholipid",
+    },
+}
+
+# Lipid class IDs in manuscript order
+LIPID_CLASSES = list(LIPID_CLASS_REGISTRY)
+
+# Order of the lipid classes along the x axis of the cross-class figures
+FIGURE_ORDER = [
+    "sterol",
+    "polyketide",
+    "prenol",
+    "saccharolipid",
+    "sphingolipid",
+    "fattyacyl",
+    "glycerophospholipid",
+    "glycerolipid",
+]
+
+# Folder names (below PLIP_ROOT) of the PLIP runs for each lipid class
+PLIP_FOLDERS = {
+    lipid_class: settings["plip_folder"] for lipid_class, settings in LIPID_CLASS_REGISTRY.items()
+}
+
+
+def get_lipid_class(lipid_class: str) -> dict:
+    """
+    Returns the registry entry of a lipid class.
+
+    Args:
+        lipid_class (str): lipid class ID (one of LIPID_CLASSES).
+    """
+    if lipid_class not in LIPID_CLASS_REGISTRY:
+        raise ValueError(f"Unknown lipid class: {lipid_class}")
+
+    return LIPID_CLASS_REGISTRY[lipid_class]
+
+
+def class_labels(lipid_classes: list = FIGURE_ORDER) -> dict:
+    """
+    Returns a dictionary of display name -> lipid class ID, in the given order.
+    """
+    return {get_lipid_class(c)["display_name"]: c for c in lipid_classes}
+
+
+def class_colors(lipid_classes: list = FIGURE_ORDER) -> dict:
+    """
+    Returns a dictionary of display name -> figure color, in the given order.
+    """
+    return {get_lipid_class(c)["display_name"]: get_lipid_class(c)["color"] for c in lipid_classes}
+
+
+def plip_class_root(lipid_class: str, plip_root: str = PLIP_ROOT) -> str:
+    """
+    Returns the directory containing the PLIP output folders for a lipid class.
+
+    Args:
+        lipid_class (str): lipid class ID (one of LIPID_CLASSES).
+        plip_root (str): root directory of all PLIP runs.
+    """
+    return os.path.join(plip_root, get_lipid_class(lipid_class)["plip_folder"])
+
+
+def pfam_source_workbook(lipid_class: str, source_root: str = PFAM_SOURCE_ROOT) -> str:
+    """
+    Returns the BioDolphin export (BioDolphinID, protein_Pfam_ID, ...) of a lipid class.
+
+    Args:
+        lipid_class (str): lipid class ID (one of LIPID_CLASSES).
+        source_root (str): directory holding the exports.
+    """
+    return os.path.join(source_root, get_lipid_class(lipid_class)["pfam_workbook"])
+
+
+def cartography_tsv(lipid_class: str, cartography_root: str = CARTOGRAPHY_ROOT,
+                    suffix: str = "aggregated_features_pca_tsne.tsv") -> str:
+    """
+    Returns a ProteinCartography results file (protid, LeidenCluster, ...) of a lipid class.
+
+    Args:
+        lipid_class (str): lipid class ID (one of LIPID_CLASSES).
+        cartography_root (str): directory holding the final_results_cluster-mode_* folders.
+        suffix (str): results file, without the run prefix.
+    """
+    run = get_lipid_class(lipid_class)["cartography_run"]
+    return os.path.join(cartography_root, f"{run}_{suffix}")
@@ -0,0 +1,124 @@
+"""
+Manifest of the PLIP reports already ingested into the interaction store.
+
+Each lipid class partition keeps a JSON manifest (_manifest.json, skipped by the
+Parquet reader) recording the size, modification time and content hash of every
+report.txt it was built from. Re-running the extraction then only parses reports
+that are new or whose content changed, and drops rows of reports that disappeared.
+"""
+import hashlib
+import json
+import os
+from typing import Iterable, Optional
+
+__all__ = [
+    "MANIFEST_FILE",
+    "file_fingerprint",
+    "load_manifest",
+    "write_manifest",
+    "plan_update",
+]
+
+MANIFEST_FILE = "_manifest.json"
+
+
+def file_fingerprint(path: str, digest: bool = True) -> dict:
+    """
+    Returns the size, modification time (ns) and, optionally, SHA-256 of a file.
+
+    Args:
+        path (str): file to fingerprint.
+        digest (bool): whether to hash the file contents.
+    """
+    stat = os.stat(path)
+    fingerprint = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    if digest:
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                sha.update(block)
+        fingerprint["sha256"] = sha.hexdigest()
+
+    return fingerprint
+
+
+def load_manifest(partition_dir: str) -> Optional[dict]:
+    """
+    Loads the manifest of a store partition.
+
+    Args:
+        partition_dir (str): directory of the partition (<store>/lipid_class=<class>).
+    Returns:
+        a dictionary of report path (relative to the lipid class directory) -> entry,
+        or None if the partition has no manifest.
+    """
+    path = os.path.join(partition_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+
+    with open(path) as f:
+        return json.load(f)["reports"]
+
+
+def write_manifest(manifest: dict, partition_dir: str, class_root: str):
+    """
+    Writes the manifest of a store partition.
+
+    Args:
+        manifest (dict): report path (relative to class_root) -> entry.
+        partition_dir (str): directory of the partition.
+        class_root (str): lipid class directory the reports were read from.
+    """
+    os.makedirs(partition_dir, exist_ok=True)
+    path = os.path.join(partition_dir, MANIFEST_FILE)
+    tmp_path = path + ".tmp"
+
+    with open(tmp_path, "w") as f:
+        json.dump({"class_root": class_root, "reports": manifest}, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def plan_update(report_paths: Iterable[str], class_root: str, manifest: dict):
+    """
+    Compares the reports on disk with a manifest.
+
+    Reports whose size and modification time match the manifest are taken as unchanged
+    without reading them; otherwise the content hash decides.
+
+    Args:
+        report_paths (iterable): paths of the report.txt files currently on disk.
+        class_root (str): lipid class directory the manifest paths are relative to.
+        manifest (dict): manifest loaded with load_manifest.
+    Returns:
+        (reports to parse, manifest entries of unchanged reports, relative paths of
+        reports that are no longer on disk).
+    """
+    to_parse = []
+    unchanged = {}
+    seen = set()
+
+    for report_path in report_paths:
+        rel_path = os.path.relpath(report_path, class_root)
+        seen.add(rel_path)
+        entry = manifest.get(rel_path)
+
+        if entry is None:
+            to_parse.append(report_path)
+            continue
+
+        fingerprint = file_fingerprint(report_path, digest=False)
+        if fingerprint["size"] == entry["size"] and fingerprint["mtime_ns"] == entry["mtime_ns"]:
+            unchanged[rel_path] = entry
+            continue
+
+        fingerprint = file_fingerprint(report_path)
+        if fingerprint["sha256"] == entry["sha256"]:
+            # touched but not modified
+            unchanged[rel_path] = {**entry, **fingerprint}
+        else:
+            to_parse.append(report_path)
+
+    removed = [rel_path for rel_path in manifest if rel_path not in seen]
+
+    return to_parse, unchanged, removed
@@ -0,0 +1,81 @@
+"""
+Order-preserving process-pool map used to spread per-file work (PLIP reports,
+PDB files, ...) over all CPU cores.
+
+Items are sent to the workers in chunks, and results are yielded in input order,
+so a parallel run produces exactly the same output as a serial one.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional
+
+__all__ = [
+    "default_workers",
+    "parallel_map",
+]
+
+
+def default_workers() -> int:
+    """
+    Returns the number of CPU cores available to this process.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _chunked(items: Iterable, chunk_size: int) -> Iterator[list]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _apply(func: Callable, chunk: list) -> list:
+    return [func(item) for item in chunk]
+
+
+def parallel_map(
+    func: Callable,
+    items: Iterable,
+    workers: Optional[int] = None,
+    chunk_size: int = 64,
+) -> Iterator:
+    """
+    Yields func(item) for every item, in input order.
+
+    With more than one worker, items are grouped into chunks that are processed by a
+    process pool. Only a bounded number of chunks is in flight at a time, so results
+    are streamed rather than collected. Scripts calling this must guard their entry
+    point with `if __name__ == "__main__":`.
+
+    Args:
+        func (callable): module-level (picklable) function applied to each item.
+        items (iterable): items to process, e.g. report paths.
+        workers (int): number of worker processes. Defaults to all cores;
+            1 processes the items serially in this process.
+        chunk_size (int): number of items sent to a worker at a time.
+    """
+    if workers is None:
+        workers = default_workers()
+
+    if workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    max_pending = 4 * workers
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in _chunked(items, chunk_size):
+            pending.append(executor.submit(_apply, func, chunk))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,170 @@
+"""
+Fast reader of the ATOM/HETATM records of PDB files into NumPy structured arrays.
+
+Building a Bio.PDB structure creates Python objects for every chain, residue and atom,
+which dominates the run time of scripts that only need coordinates and a few labels.
+read_pdb_atoms instead slices the fixed columns of the coordinate records (the layout of
+ATOM_SPEC_DICT in proteincartography/fixed_cartography_scripts/assess_pdbs.py) as one
+byte matrix, so every field is converted in a single vectorized call per column.
+"""
+from typing import Iterable
+
+import numpy as np
+
+__all__ = [
+    "PDB_ATOM_COLUMNS",
+    "ATOM_DTYPE",
+    "WATER_RESIDUES",
+    "read_pdb_atoms",
+    "select_altlocs",
+    "ligand_mask",
+    "protein_mask",
+    "residue_keys",
+]
+
+# Field -> (start, end) byte offsets of ATOM/HETATM records, as in ATOM_SPEC_DICT
+# (with Y spanning the full 38-46 columns)
+PDB_ATOM_COLUMNS = {
+    "ATOM": (0, 6),
+    "SERIAL": (6, 11),
+    "NAME": (12, 16),
+    "ALTLOC": (16, 17),
+    "RESIDUE": (17, 20),
+    "CHAIN": (21, 22),
+    "RESNUM": (22, 26),
+    "RESINS": (26, 27),
+    "X": (30, 38),
+    "Y": (38, 46),
+    "Z": (46, 54),
+    "OCC": (54, 60),
+    "TEMP": (60, 66),
+    "SEG": (72, 76),
+    "ELEM": (76, 78),
+    "CHARGE": (78, 80),
+}
+
+RECORD_WIDTH = 80
+
+ATOM_DTYPE = np.dtype([
+    ("model", "i4"),
+    ("het", "?"),
+    ("serial", "i4"),
+    ("name", "U4"),
+    ("altloc", "U1"),
+    ("resname", "U3"),
+    ("chain", "U1"),
+    ("resnum", "i4"),
+    ("icode", "U1"),
+    ("coord", "f4", (3,)),
+    ("occupancy", "f4"),
+    ("bfactor", "f4"),
+    ("element", "U2"),
+])
+
+WATER_RESIDUES = {"HOH", "WAT"}
+
+
+def _column(records: np.ndarray, field: str) -> np.ndarray:
+    """
+    Returns one fixed-width field of all records as stripped byte strings.
+    """
+    start, end = PDB_ATOM_COLUMNS[field]
+    values = np.ascontiguousarray(records[:, start:end]).view(f"S{end - start}").ravel()
+    return np.char.strip(values)
+
+
+def _numeric_column(records: np.ndarray, field: str, dtype, blank) -> np.ndarray:
+    """
+    Returns one numeric field of all records, with blank fields set to blank.
+    """
+    values = _column(records, field)
+    return np.where(values == b"", blank, values).astype(dtype)
+
+
+def read_pdb_atoms(pdb_path: str, first_model: bool = True) -> np.ndarray:
+    """
+    Reads the ATOM and HETATM records of a PDB file.
+
+    Args:
+        pdb_path (str): path to the PDB file.
+        first_model (bool): stop at the first ENDMDL record, like structure[0] in Bio.PDB.
+    Returns:
+        a structured array of ATOM_DTYPE with one entry per record, in file order.
+        The model field is the position of the record's model (0 for the first).
+    """
+    with open(pdb_path, "rb") as f:
+        all_lines = f.read().splitlines()
+
+    lines = []
+    models = []
+    model = 0
+    for line in all_lines:
+        if line.startswith((b"ATOM  ", b"HETATM")):
+            lines.append(line)
+            models.append(model)
+        elif line.startswith(b"ENDMDL"):
+            if first_model:
+                break
+            model += 1
+
+    atoms = np.zeros(len(lines), dtype=ATOM_DTYPE)
+    if not lines:
+        return atoms
+
+    atoms["model"] = models
+    records = np.frombuffer(
+        b"".join(line[:RECORD_WIDTH].ljust(RECORD_WIDTH) for line in lines), dtype="S1"
+    ).reshape(len(lines), RECORD_WIDTH)
+
+    atoms["het"] = _column(records, "ATOM") == b"HETATM"
+    atoms["serial"] = _numeric_column(records, "SERIAL", "i4", b"0")
+    atoms["name"] = _column(records, "NAME").astype("U4")
+    atoms["altloc"] = _column(records, "ALTLOC").astype("U1")
+    atoms["resname"] = _column(records, "RESIDUE").astype("U3")
+    atoms["chain"] = _column(records, "CHAIN").astype("U1")
+    atoms["resnum"] = _numeric_column(records, "RESNUM", "i4", b"0")
+    atoms["icode"] = _column(records, "RESINS").astype("U1")
+    for axis, field in enumerate(("X", "Y", "Z")):
+        atoms["coord"][:, axis] = _numeric_column(records, field, "f4", b"nan")
+    atoms["occupancy"] = _numeric_column(records, "OCC", "f4", b"1")
+    atoms["bfactor"] = _numeric_column(records, "TEMP", "f4", b"0")
+    atoms["element"] = _column(records, "ELEM").astype("U2")
+
+    return atoms
+
+
+def select_altlocs(atoms: np.ndarray) -> np.ndarray:
+    """
+    Keeps one record per atom, as Bio.PDB does: the most occupied alternate location
+    (the first on ties), and the first record of atoms repeated without an altloc.
+    """
+    keys = atoms[["chain", "resnum", "icode", "resname", "name"]]
+    priority = np.where(atoms["altloc"] == "", -np.inf, -atoms["occupancy"])
+    order = np.argsort(priority, kind="stable")
+    _, first = np.unique(keys[order], return_index=True)
+
+    if len(first) == len(atoms):
+        return atoms
+
+    return atoms[np.sort(order[first])]
+
+
+def ligand_mask(atoms: np.ndarray, exclude: Iterable[str] = WATER_RESIDUES) -> np.ndarray:
+    """
+    Returns the mask of ligand atoms: HETATM records except the excluded residues (water).
+    """
+    return atoms["het"] & ~np.isin(atoms["resname"], list(exclude))
+
+
+def protein_mask(atoms: np.ndarray) -> np.ndarray:
+    """
+    Returns the mask of protein (ATOM record) atoms.
+    """
+    return ~atoms["het"]
+
+
+def residue_keys(atoms: np.ndarray) -> list:
+    """
+    Returns the (chain ID, residue number) key of every atom.
+    """
+    return list(zip(atoms["chain"].tolist(), atoms["resnum"].tolist()))
@@ -0,0 +1,169 @@
+"""
+Parser for PLIP plain-text reports (report.txt).
+
+Every **Section** table of a report is recognized by its header row, so columns are
+looked up by name (e.g. "DIST_D-A") rather than by whitespace-split position.
+Each report is read exactly once and yields one record per interaction row.
+"""
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from lipid_analysis.parallel import parallel_map
+
+__all__ = [
+    "INTERACTION_TYPES",
+    "SECTION_TITLES",
+    "count_interactions",
+    "iter_reports",
+    "parse_report",
+    "parse_reports",
+    "split_table_row",
+]
+
+# PLIP section title -> interaction type key
+# (keys follow pfam_analysis/pfam_plip_interactions/plot_pfam_plip_*.py)
+INTERACTION_TYPES = {
+    "Hydrophobic Interactions": "hydrophobic",
+    "Hydrogen Bonds": "hydrogen_bonds",
+    "Salt Bridges": "salt_bridges",
+    "Water Bridges": "water_bridges",
+    "pi-Stacking": "pi_stacking",
+    "pi-Cation Interactions": "pi_cation",
+    "Halogen Bonds": "halogen_bonds",
+    "Metal Complexes": "metal_bonds",
+}
+
+# interaction type key -> PLIP section title
+SECTION_TITLES = {key: title for title, key in INTERACTION_TYPES.items()}
+
+# e.g. "STE:A:133 (STE) - SMALLMOLECULE"
+BINDING_SITE_RE = re.compile(r"^(\S+:\S+:\S+) \((.*)\) - (\S+)\s*$")
+
+
+def split_table_row(line: str) -> list:
+    """
+    Splits a PLIP ASCII table row into its stripped cell values.
+    Cells are delimited by "|", so multi-token values such as coordinates stay intact.
+
+    Args:
+        line (str): table row starting with "|".
+    """
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def parse_report(report_path: str, biodolphin_id: Optional[str] = None) -> Iterator[dict]:
+    """
+    Streams all interaction rows from a PLIP report.txt file.
+
+    Each record holds the BioDolphinID, the binding site the row belongs to,
+    the interaction type (see INTERACTION_TYPES) and every column of the section table
+    keyed by its header name. Values are kept as the strings printed by PLIP.
+
+    Args:
+        report_path (str): path to report.txt.
+        biodolphin_id (str): BioDolphinID of the structure.
+            Defaults to the name of the folder containing the report.
+    """
+    if biodolphin_id is None:
+        biodolphin_id = Path(report_path).parent.name
+
+    binding_site = None
+    interaction = None
+    header = None
+
+    with open(report_path) as f:
+        for line in f:
+            if line.startswith("**"):
+                title = line.strip().strip("*").strip()
+                interaction = INTERACTION_TYPES.get(title, title)
+                header = None
+                continue
+
+            if line.startswith("|"):
+                if interaction is None:
+                    continue
+
+                cells = split_table_row(line)
+
+                # the first row of every section table is its header
+                if header is None:
+                    header = cells
+                    continue
+
+                if len(cells) != len(header):
+                    continue
+
+                record = {
+                    "BioDolphinID": biodolphin_id,
+                    "binding_site": binding_site,
+                    "interaction": interaction,
+                }
+                record.update(zip(header, cells))
+                yield record
+                continue
+
+            # table separators ("+---+") don't change state
+            if line.startswith("+"):
+                continue
+
+            match = BINDING_SITE_RE.match(line)
+            if match:
+                binding_site = match.group(1)
+                interaction = None
+                header = None
+
+
+def _parse_all(report_path: str) -> list:
+    return list(parse_report(report_path))
+
+
+def parse_reports(
+    report_paths: Iterable[str],
+    workers: Optional[int] = 1,
+    chunk_size: int = 64,
+) -> Iterator[dict]:
+    """
+    Streams the interaction rows of many PLIP reports, optionally parsing them in a
+    process pool. Rows are yielded report by report in the order of report_paths,
+    so the output is identical to a serial run.
+
+    Args:
+        report_paths (iterable): paths to report.txt files.
+        workers (int): number of worker processes (None for all cores, 1 for serial).
+        chunk_size (int): number of reports handed to a worker at a time.
+    """
+    for records in parallel_map(_parse_all, report_paths, workers, chunk_size):
+        yield from records
+
+
+def count_interactions(report_path: str) -> dict:
+    """
+    Counts the interaction rows of each type in a PLIP report.
+
+    Args:
+        report_path (str): path to report.txt.
+    Returns:
+        a dictionary of interaction type -> number of rows (all types of INTERACTION_TYPES).
+    """
+    counts = {key: 0 for key in INTERACTION_TYPES.values()}
+    for record in parse_report(report_path):
+        if record["interaction"] in counts:
+            counts[record["interaction"]] += 1
+
+    return counts
+
+
+def iter_reports(root_dir: str, filename: str = "report.txt") -> Iterator[str]:
+    """
+    Walks a directory tree and yields the paths of all PLIP reports, in sorted order.
+
+    Args:
+        root_dir (str): directory to search.
+        filename (str): name of the report files.
+    """
+    for root, dirs, files in os.walk(root_dir):
+        dirs.sort()
+        if filename in files:
+            yield os.path.join(root, filename)
@@ -0,0 +1,101 @@
+"""
+Streaming parser for PLIP XML reports (report.xml).
+
+Alternative backend to plip_report.parse_report: it yields the same interaction records
+(same keys, e.g. "DIST_D-A"), but with typed values taken directly from the XML elements,
+so index lists and coordinates are exact lists instead of table strings.
+Reports are read with iterparse and every processed element is cleared, so memory use
+stays flat regardless of report size.
+"""
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Iterator, Optional
+
+from lipid_analysis.interaction_store import COLUMN_TYPES, convert_value
+
+__all__ = [
+    "XML_INTERACTION_TYPES",
+    "parse_report_xml",
+]
+
+# PLIP XML container element -> (interaction type key, record element)
+XML_INTERACTION_TYPES = {
+    "hydrophobic_interactions": ("hydrophobic", "hydrophobic_interaction"),
+    "hydrogen_bonds": ("hydrogen_bonds", "hydrogen_bond"),
+    "water_bridges": ("water_bridges", "water_bridge"),
+    "salt_bridges": ("salt_bridges", "salt_bridge"),
+    "pi_stacks": ("pi_stacking", "pi_stack"),
+    "pi_cation_interactions": ("pi_cation", "pi_cation_interaction"),
+    "halogen_bonds": ("halogen_bonds", "halogen_bond"),
+    "metal_complexes": ("metal_bonds", "metal_complex"),
+}
+
+RECORD_TAGS = {record_tag for _, record_tag in XML_INTERACTION_TYPES.values()}
+
+
+def _element_value(elem: ET.Element, column: str):
+    """
+    Returns the typed value of one field of an interaction element.
+    """
+    if len(elem):
+        # coordinates (<x>, <y>, <z>) or index lists (<idx id="1">...)
+        if column.endswith("COO"):
+            return [float(elem.findtext(axis)) for axis in ("x", "y", "z")]
+        return [int(child.text) for child in elem]
+
+    return convert_value(elem.text, COLUMN_TYPES.get(column, "str"))
+
+
+def parse_report_xml(report_path: str, biodolphin_id: Optional[str] = None) -> Iterator[dict]:
+    """
+    Streams all interaction rows from a PLIP report.xml file.
+
+    Records have the same keys as those of plip_report.parse_report: BioDolphinID,
+    binding site ("STE:A:133"), interaction type and one entry per PLIP column.
+
+    Args:
+        report_path (str): path to report.xml.
+        biodolphin_id (str): BioDolphinID of the structure.
+            Defaults to the name of the folder containing the report.
+    """
+    if biodolphin_id is None:
+        biodolphin_id = Path(report_path).parent.name
+
+    root = None
+    binding_site = None
+    interaction = None
+
+    for event, elem in ET.iterparse(report_path, events=("start", "end")):
+        tag = elem.tag
+
+        if event == "start":
+            if root is None:
+                root = elem
+            elif tag in XML_INTERACTION_TYPES:
+                interaction = XML_INTERACTION_TYPES[tag][0]
+            continue
+
+        if tag in RECORD_TAGS:
+            record = {
+                "BioDolphinID": biodolphin_id,
+                "binding_site": binding_site,
+                "interaction": interaction,
+            }
+            for child in elem:
+                column = child.tag.upper()
+                record[column] = _element_value(child, column)
+            elem.clear()
+            yield record
+
+        elif tag == "identifiers":
+            binding_site = ":".join(
+                elem.findtext(field).strip() for field in ("hetid", "chain", "position")
+            )
+
+        elif tag in XML_INTERACTION_TYPES:
+            interaction = None
+
+        elif tag == "bindingsite":
+            # drop the finished binding site from the tree
+            elem.clear()
+            root.clear()
@@ -0,0 +1,116 @@
+"""
+Mapping of PDB file names to protids (BioDolphinIDs) of a metadata table.
+
+PDB files are named after their BioDolphinID with tool-specific decorations
+(plipfixed.BD1hmt-A-A-STE1.pdb, BD1hmt-A-A-STE1_protonated.pdb). File names are
+normalized first and looked up in an exact map; names that still carry other text fall
+back to the longest protid contained in the name, found with an Aho-Corasick automaton
+over all protids in a single pass over the name instead of one substring test per protid.
+"""
+import os
+from collections import deque
+from typing import Iterable, Optional
+
+__all__ = [
+    "PDB_PREFIXES",
+    "PDB_SUFFIXES",
+    "normalize_pdb_name",
+    "ProtidResolver",
+]
+
+# Decorations added to the BioDolphinID in PDB file names
+PDB_PREFIXES = ["plipfixed."]
+PDB_SUFFIXES = ["_protonated"]
+
+
+def normalize_pdb_name(filename: str) -> str:
+    """
+    Strips the directory, extension and known prefixes/suffixes from a PDB file name.
+
+    Args:
+        filename (str): PDB file name or path (e.g. "plipfixed.BD1hmt-A-A-STE1_protonated.pdb").
+    """
+    name = os.path.splitext(os.path.basename(filename))[0]
+
+    for prefix in PDB_PREFIXES:
+        if name.startswith(prefix):
+            name = name[len(prefix):]
+    for suffix in PDB_SUFFIXES:
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+
+    return name
+
+
+class ProtidResolver:
+    """
+    Resolves PDB file names to protids of a metadata table.
+
+    Args:
+        protids (iterable): protids of the metadata table (e.g. the protid column of a
+            ProteinCartography results file).
+    """
+
+    def __init__(self, protids: Iterable[str]):
+        self.protids = {p for p in protids if isinstance(p, str) and p}
+
+        # Aho-Corasick automaton: goto transitions, failure links, and the longest protid
+        # ending at each state
+        self._goto = [{}]
+        self._fail = [0]
+        self._longest = [None]
+
+        for protid in sorted(self.protids):
+            state = 0
+            for char in protid:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._longest.append(None)
+                state = next_state
+            self._longest[state] = protid
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fail
+                # a protid ending here is longer than any ending at the failure state
+                if self._longest[next_state] is None:
+                    self._longest[next_state] = self._longest[fail]
+                queue.append(next_state)
+
+    def longest_match(self, text: str) -> Optional[str]:
+        """
+        Returns the longest protid contained in text (the first one on ties), or None.
+        """
+        goto, fail, longest = self._goto, self._fail, self._longest
+        state = 0
+        best = None
+
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            match = longest[state]
+            if match is not None and (best is None or len(match) > len(best)):
+                best = match
+
+        return best
+
+    def resolve(self, filename: str) -> Optional[str]:
+        """
+        Returns the protid of a PDB file name or path, or None if no protid matches.
+        """
+        name = normalize_pdb_name(filename)
+        if name in self.protids:
+            return name
+
+        return self.longest_match(name)
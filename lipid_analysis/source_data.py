@@ -0,0 +1,191 @@
+"""
+Cached access to the source-data workbooks (Source_Data_dpocket.xlsx, Source_Data_PLIP.xlsx).
+
+Parsing .xlsx files with openpyxl is slow, and every plotting script used to re-parse
+the same workbook once per sheet. Here a workbook is converted once into one Parquet file
+per sheet (in .source_data_cache/<workbook>/ next to it); later reads load only the
+requested sheets and columns from that cache. The cache is rebuilt whenever the SHA-256
+of the workbook changes.
+
+Columns of mixed types (e.g. numbers and text) are stored cell by cell as pickles, so
+every value comes back with the type pd.read_excel gives it.
+"""
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+__all__ = [
+    "SOURCE_DATA_DPOCKET",
+    "SOURCE_DATA_PLIP",
+    "sheet_names",
+    "read_sheet",
+    "read_sheets",
+]
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+SOURCE_DATA_DPOCKET = str(REPO_ROOT / "Source_Data_dpocket.xlsx")
+SOURCE_DATA_PLIP = str(REPO_ROOT / "Source_Data_PLIP.xlsx")
+
+CACHE_DIRNAME = ".source_data_cache"
+INDEX_FILE = "_index.json"
+# bumped when the cache layout changes, so caches of older versions are rebuilt
+CACHE_VERSION = 2
+
+# (path, size, mtime_ns) -> cache index, so a workbook is hashed once per process
+_checked = {}
+
+
+def _workbook_hash(path: str) -> str:
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def _cache_dir(workbook: str) -> str:
+    workbook = Path(workbook).resolve()
+    return str(workbook.parent / CACHE_DIRNAME / workbook.stem)
+
+
+def _to_arrow(df: pd.DataFrame) -> tuple:
+    """
+    Converts a sheet to an Arrow table. Column names become strings, and object columns
+    (which pd.read_excel only returns for values of mixed types) are stored as one pickle
+    per cell, since Arrow would coerce their values to a single type.
+
+    Returns:
+        (Arrow table, names of the pickled columns).
+    """
+    df = df.copy()
+    df.columns = [str(col) for col in df.columns]
+
+    pickled = [col for col in df.columns if df[col].dtype == object]
+    for col in pickled:
+        df[col] = df[col].map(pickle.dumps)
+
+    return pa.Table.from_pandas(df, preserve_index=False), pickled
+
+
+def _build_cache(workbook: str, cache_dir: str, digest: str) -> dict:
+    sheets = pd.read_excel(workbook, sheet_name=None)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    index = {"version": CACHE_VERSION, "sha256": digest, "sheets": {}, "pickled": {}}
+    for i, (name, df) in enumerate(sheets.items()):
+        filename = f"sheet_{i:02d}.parquet"
+        table, pickled = _to_arrow(df)
+        pq.write_table(table, os.path.join(cache_dir, filename))
+        index["sheets"][name] = filename
+        index["pickled"][name] = pickled
+
+    tmp_path = os.path.join(cache_dir, INDEX_FILE + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(index, f, indent=1)
+    os.replace(tmp_path, os.path.join(cache_dir, INDEX_FILE))
+
+    return index
+
+
+def _cache_index(workbook: str) -> dict:
+    """
+    Returns the cache index of a workbook, (re)building the cache if the workbook changed.
+    """
+    if not os.path.exists(workbook):
+        raise FileNotFoundError(f"Workbook not found: {workbook}")
+
+    stat = os.stat(workbook)
+    key = (str(Path(workbook).resolve()), stat.st_size, stat.st_mtime_ns)
+    if key in _checked:
+        return _checked[key]
+
+    cache_dir = _cache_dir(workbook)
+    digest = _workbook_hash(workbook)
+
+    index = None
+    index_path = os.path.join(cache_dir, INDEX_FILE)
+    if os.path.exists(index_path):
+        with open(index_path) as f:
+            index = json.load(f)
+        if index.get("sha256") != digest or index.get("version") != CACHE_VERSION:
+            index = None
+
+    if index is None:
+        print(f"Caching {workbook} in {cache_dir} ...")
+        index = _build_cache(workbook, cache_dir, digest)
+
+    index["cache_dir"] = cache_dir
+    _checked[key] = index
+
+    return index
+
+
+def sheet_names(workbook: str = SOURCE_DATA_DPOCKET) -> list:
+    """
+    Returns the sheet names of a workbook, in workbook order.
+
+    Args:
+        workbook (str): path to the .xlsx file.
+    """
+    return list(_cache_index(workbook)["sheets"])
+
+
+def read_sheet(
+    workbook: str = SOURCE_DATA_DPOCKET,
+    sheet: Optional[Union[str, int]] = 0,
+    columns: Optional[list] = None,
+) -> pd.DataFrame:
+    """
+    Reads one sheet of a workbook from its binary cache.
+    Drop-in replacement for pd.read_excel(workbook, sheet_name=sheet).
+
+    Args:
+        workbook (str): path to the .xlsx file.
+        sheet (str or int): sheet name, or position of the sheet in the workbook.
+        columns (list): columns to load. Defaults to all.
+    """
+    index = _cache_index(workbook)
+    names = list(index["sheets"])
+
+    if isinstance(sheet, int):
+        sheet = names[sheet]
+    if sheet not in index["sheets"]:
+        raise ValueError(f"Worksheet named '{sheet}' not found in {workbook}")
+
+    path = os.path.join(index["cache_dir"], index["sheets"][sheet])
+    df = pq.read_table(path, columns=columns).to_pandas()
+
+    for col in index["pickled"][sheet]:
+        if col in df.columns:
+            df[col] = df[col].map(pickle.loads).astype(object)
+
+    return df
+
+
+def read_sheets(
+    workbook: str = SOURCE_DATA_DPOCKET,
+    sheets: Optional[list] = None,
+    columns: Optional[list] = None,
+) -> dict:
+    """
+    Reads several sheets of a workbook from its binary cache.
+
+    Args:
+        workbook (str): path to the .xlsx file.
+        sheets (list): sheet names to load. Defaults to all sheets.
+        columns (list): columns to load from every sheet. Defaults to all.
+    Returns:
+        a dictionary of sheet name -> DataFrame.
+    """
+    if sheets is None:
+        sheets = sheet_names(workbook)
+
+    return {sheet: read_sheet(workbook, sheet, columns) for sheet in sheets}
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Extract PFAM summary (one PFAM per BioDolphinID), count unique BioDolphinIDs per PFAM,
+compute frequency relative to total unique BioDolphinIDs, and plot pie chart for PFAMs >1%.
+
+Runs any number of lipid classes (all eight by default), in parallel.
+
+Outputs (per lipid class, file names from lipid_analysis/lipid_classes.py):
+- <class>_pfams_summary.xlsx (BioDolphinID, protein_Pfam_ID, count, frequency_percent)
+- <class>_pfam_pie_chart.pdf (editable text, 50% transparent wedges)
+
+Usage:
+    python3 extract_pfam.py                          # all lipid classes
+    python3 extract_pfam.py -c sterol prenol -w 2
+"""
+
+import argparse
+import ast
+import os
+import re
+import sys
+from pathlib import Path
+
+import pandas as pd
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from matplotlib import patheffects
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lipid_analysis.lipid_classes import (
+    LIPID_CLASSES,
+    PFAM_SOURCE_ROOT,
+    get_lipid_class,
+    pfam_source_workbook,
+)
+from lipid_analysis.parallel import default_workers, parallel_map
+
+# ---------------------------
+# Ensure editable text in PDFs
+# ---------------------------
+matplotlib.rcParams['pdf.fonttype'] = 42  # TrueType
+matplotlib.rcParams['ps.fonttype'] = 42
+matplotlib.rcParams['font.family'] = 'Arial'
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-c",
+        "--classes",
+        nargs="+",
+        default=LIPID_CLASSES,
+        choices=LIPID_CLASSES,
+        help="Lipid classes to summarize. Defaults to all eight.",
+    )
+    parser.add_argument(
+        "-i",
+        "--source-root",
+        default=PFAM_SOURCE_ROOT,
+        help="Directory holding one BioDolphin export workbook per lipid class.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        default=".",
+        help="Directory the summaries and pie charts are written to.",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=min(default_workers(), len(LIPID_CLASSES)),
+        help="Number of lipid classes processed in parallel.",
+    )
+    return parser.parse_args(argv)
+
+
+# ---------------------------
+# Helper to parse PFAM cell into a list of PFAM IDs
+# ---------------------------
+def parse_pfam_cell(x):
+    if pd.isna(x):
+        return []
+    if isinstance(x, (list, tuple, set)):
+        return [str(s).strip() for s in x if str(s).strip()]
+    s = str(x).strip()
+    if s.startswith('[') and s.endswith(']'):
+        try:
+            parsed = ast.literal_eval(s)
+            if isinstance(parsed, (list, tuple, set)):
+                return [str(ii).strip() for ii in parsed if str(ii).strip()]
+        except Exception:
+            pass
+    if ',' in s or ';' in s:
+        tokens = re.split(r'[;,]\s*', s)
+        return [t.strip() for t in tokens if t.strip()]
+    if s:
+        return [s]
+    return []
+
+
+def summarize_pfams(df: pd.DataFrame) -> tuple:
+    """
+    Counts unique BioDolphinIDs per PFAM.
+
+    Args:
+        df (pd.DataFrame): BioDolphin export with BioDolphinID and protein_Pfam_ID columns.
+    Returns:
+        (per-PFAM counts, BioDolphin-PFAM pairs with counts and frequencies).
+    """
+    # ---------------------------
+    # Validate required columns
+    # ---------------------------
+    required_cols = ["BioDolphinID", "protein_Pfam_ID"]
+    missing = [c for c in required_cols if c not in df.columns]
+    if missing:
+        raise ValueError(f"ERROR: Missing required columns: {missing}")
+
+    # ---------------------------
+    # Expand rows: one PFAM per row per BioDolphinID
+    # ---------------------------
+    rows = []
+    for _, row in df.iterrows():
+        bd = row["BioDolphinID"]
+        pfam_cell = row["protein_Pfam_ID"]
+        pfams = parse_pfam_cell(pfam_cell)
+        for p in pfams:
+            rows.append({"BioDolphinID": bd, "protein_Pfam_ID": p})
+
+    expanded = pd.DataFrame(rows)
+    if expanded.empty:
+        raise ValueError("No PFAM entries found after parsing. Check protein_Pfam_ID formatting.")
+
+    # ---------------------------
+    # Count unique BioDolphinIDs per PFAM
+    # ---------------------------
+    pfam_counts = (
+        expanded.groupby("protein_Pfam_ID")["BioDolphinID"]
+        .nunique()
+        .reset_index(name="count")
+    )
+
+    total_unique_biodolphin = expanded["BioDolphinID"].nunique()
+    pfam_counts["frequency_percent"] = pfam_counts["count"] / total_unique_biodolphin * 100
+
+    # ---------------------------
+    # Merge counts onto unique BioDolphin–PFAM pairs
+    # ---------------------------
+    unique_pairs = expanded.drop_duplicates(subset=["BioDolphinID", "protein_Pfam_ID"])
+    result = unique_pairs.merge(pfam_counts, on="protein_Pfam_ID", how="left")
+
+    # Sort so highest-frequency PFAMs first
+    result = result.sort_values(by=["frequency_percent", "protein_Pfam_ID"], ascending=[False, True])
+
+    return pfam_counts, result
+
+
+def plot_pfam_pie(pfam_counts: pd.DataFrame, pie_output: str) -> bool:
+    """
+    Plots a pie chart of the PFAMs above 2% frequency.
+
+    Returns:
+        whether a pie chart was written.
+    """
+    pfam_over1 = pfam_counts[pfam_counts["frequency_percent"] > 2].reset_index(drop=True)
+    if pfam_over1.empty:
+        return False
+
+    labels = pfam_over1["protein_Pfam_ID"].tolist()
+    counts = pfam_over1["count"].tolist()
+    freqs = pfam_over1["frequency_percent"].tolist()
+
+    fig, ax = plt.subplots(figsize=(7, 7))
+
+    # Generate colors with 50% transparency
+    base_colors = plt.cm.tab20(np.linspace(0, 1, len(counts)))
+    base_colors[:, -1] = 0.5  # alpha = 50%
+
+    wedges, texts = ax.pie(
+        counts,
+        labels=labels,
+        startangle=90,
+        textprops={'fontsize': 10},
+        colors=base_colors
+    )
+
+    # Add frequency_percent text on wedges
+    for i, wedge in enumerate(wedges):
+        ang = (wedge.theta2 + wedge.theta1) / 2.0
+        x = 0.6 * np.cos(np.deg2rad(ang))
+        y = 0.6 * np.sin(np.deg2rad(ang))
+        pct_text = f"{freqs[i]:.2f}%"
+        txt = ax.text(x, y, pct_text, ha='center', va='center', fontsize=9, fontfamily='Arial')
+        txt.set_path_effects([patheffects.Stroke(linewidth=1.5, foreground='white'), patheffects.Normal()])
+
+    ax.set_title("PFAM distribution (>1% frequency)", fontsize=14, fontfamily='Arial')
+    plt.tight_layout()
+    plt.savefig(pie_output, dpi=300)
+    plt.close()
+
+    return True
+
+
+def run_class(job: tuple) -> list:
+    """
+    Writes the PFAM summary and pie chart of one lipid class.
+
+    Args:
+        job (tuple): (lipid class ID, source root, output directory).
+    Returns:
+        the lines to report for this class.
+    """
+    lipid_class, source_root, output_dir = job
+    messages = []
+
+    df = pd.read_excel(pfam_source_workbook(lipid_class, source_root))
+    pfam_counts, result = summarize_pfams(df)
+
+    # ---------------------------
+    # Save concise Excel output
+    # ---------------------------
+    output_path = os.path.join(output_dir, get_lipid_class(lipid_class)["pfam_summary"])
+    result[["BioDolphinID", "protein_Pfam_ID", "count", "frequency_percent"]].to_excel(output_path, index=False)
+    messages.append(f"Saved summary to: {output_path}")
+
+    # ---------------------------
+    # PIE CHART: PFAMs > 1% frequency
+    # ---------------------------
+    pie_output = os.path.join(output_dir, f"{lipid_class}_pfam_pie_chart.pdf")
+    if plot_pfam_pie(pfam_counts, pie_output):
+        messages.append(f"Saved pie chart to: {pie_output}")
+    else:
+        messages.append("No PFAMs exceed 1% frequency; no pie created.")
+
+    return messages
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    jobs = [(lipid_class, args.source_root, args.output_dir) for lipid_class in args.classes]
+    for lipid_class, messages in zip(args.classes, parallel_map(run_class, jobs, args.workers, chunk_size=1)):
+        print(f"{lipid_class}:")
+        for message in messages:
+            print(f"  {message}")
+
+
+if __name__ == "__main__":
+    main()
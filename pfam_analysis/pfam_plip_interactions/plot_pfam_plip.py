@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Aggregate PLIP interaction counts per PFAM (frequency >2%) and plot a normalized barplot.
+Y-axis is normalized per PFAM to the largest interaction count within that PFAM.
+
+Runs any number of lipid classes (all eight by default); the report.txt files of all
+requested classes are counted in one parallel pass.
+
+Inputs:
+- <class>_pfams_summary.xlsx with BioDolphinID, protein_Pfam_ID, count, frequency_percent
+  (written by pfam_analysis/pfam_frequencies/extract_pfam.py)
+- report.txt files for each BioDolphinID containing interaction data
+
+Outputs:
+- pfam_plip_<class>_barplot_normalized_colored.pdf: normalized barplot of interaction
+  counts per PFAM (PDF with editable text)
+
+Usage:
+    python3 plot_pfam_plip.py                        # all lipid classes
+    python3 plot_pfam_plip.py -c sterol prenol
+"""
+
+import argparse
+import os
+import ast
+import sys
+from pathlib import Path
+
+import pandas as pd
+import matplotlib
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lipid_analysis.lipid_classes import LIPID_CLASSES, PLIP_ROOT, get_lipid_class, plip_class_root
+from lipid_analysis.parallel import default_workers, parallel_map
+from lipid_analysis.plip_report import count_interactions
+
+# ---------------------------
+# Config: directories and files
+# ---------------------------
+pfam_dir = str(Path(__file__).resolve().parents[1] / "pfam_frequencies")  # <class>_pfams_summary.xlsx
+output_plot = "pfam_plip_{lipid_class}_barplot_normalized_colored.pdf"  # saved in current directory
+
+# Ensure editable PDF text
+matplotlib.rcParams['pdf.fonttype'] = 42
+matplotlib.rcParams['ps.fonttype'] = 42
+matplotlib.rcParams['font.family'] = 'Arial'
+
+# ---------------------------
+# Define interaction types and mapping for custom colors
+# ---------------------------
+interaction_types = [
+    'hydrophobic',
+    'hydrogen_bonds',
+    'salt_bridges',
+    'water_bridges',
+    'pi_stacking',
+    'pi_cation',
+    'halogen_bonds',
+    'metal_bonds'
+]
+
+interaction_labels = {
+    'hydrophobic': "Hydrophobic Interactions",
+    'hydrogen_bonds': "Hydrogen Bonds",
+    'salt_bridges': "Salt Bridges",
+    'water_bridges': "Water Bridges",
+    'pi_stacking': "pi-Stacking",
+    'pi_cation': "pi-Cation Interactions",
+    'halogen_bonds': "Halogen Bonds",
+    'metal_bonds': "Metal Complexes"
+}
+
+colors = {
+    "Hydrophobic Interactions": "#E88FBC",
+    "Hydrogen Bonds": "#7DD3F6",
+    "Salt Bridges": "#FFD478",
+    "Water Bridges": "#D3D3D3",          # optional gray for water bridges
+    "pi-Stacking": "#90C96A",
+    "pi-Cation Interactions": "#009152",
+    "Halogen Bonds": "#F79420",
+    "Metal Complexes": "#C2C0C0"
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-c",
+        "--classes",
+        nargs="+",
+        default=LIPID_CLASSES,
+        choices=LIPID_CLASSES,
+        help="Lipid classes to plot. Defaults to all eight.",
+    )
+    parser.add_argument(
+        "-r",
+        "--plip-root",
+        default=PLIP_ROOT,
+        help="Directory holding one PLIP output folder per lipid class.",
+    )
+    parser.add_argument(
+        "-p",
+        "--pfam-dir",
+        default=pfam_dir,
+        help="Directory holding the <class>_pfams_summary.xlsx files.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        default=".",
+        help="Directory the barplots are written to.",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=default_workers(),
+        help="Number of processes reading report.txt files in parallel. Defaults to all cores.",
+    )
+    return parser.parse_args(argv)
+
+
+def load_pfam_summary(lipid_class, pfam_dir):
+    """
+    Loads the PFAM summary of a lipid class, keeping PFAMs with frequency > 2%.
+    """
+    excel_path = os.path.join(pfam_dir, get_lipid_class(lipid_class)["pfam_summary"])
+    df = pd.read_excel(excel_path)
+    required_cols = ["BioDolphinID", "protein_Pfam_ID", "frequency_percent"]
+    missing = [c for c in required_cols if c not in df.columns]
+    if missing:
+        raise ValueError(f"Missing columns in Excel: {missing}")
+
+    return df[df["frequency_percent"] > 2]
+
+
+def plot_class(df_filtered, plip_base_dir, report_counts, output_plot):
+    """
+    Aggregates interaction counts per PFAM of one lipid class and saves the barplot.
+    """
+    # ---------------------------
+    # Aggregate counts per PFAM
+    # ---------------------------
+    pfam_list = df_filtered['protein_Pfam_ID'].dropna().unique().tolist()
+    pfam_agg = []
+
+    for pfam_entry in pfam_list:
+        # Parse pfam_entry if stored as a list string
+        if isinstance(pfam_entry, str) and pfam_entry.startswith('['):
+            try:
+                pfams = ast.literal_eval(pfam_entry)
+            except Exception:
+                pfams = [pfam_entry]
+        else:
+            pfams = [pfam_entry]
+
+        # Initialize counts
+        total_counts = {k: 0 for k in interaction_types}
+
+        # Find all BioDolphinIDs corresponding to this PFAM entry
+        pfam_mask = df_filtered['protein_Pfam_ID'] == pfam_entry
+        bio_ids = df_filtered.loc[pfam_mask, 'BioDolphinID'].dropna().tolist()
+
+        for bd_id in bio_ids:
+            report_path = os.path.join(plip_base_dir, bd_id, 'report.txt')
+            if report_path in report_counts:
+                bond_counts = report_counts[report_path]
+                for k in interaction_types:
+                    total_counts[k] += bond_counts[k]
+            else:
+                print(f"⚠️ report.txt missing for {bd_id}")
+
+        for pfam in pfams:
+            pfam_agg.append({'PFAM': pfam, **total_counts})
+
+    # ---------------------------
+    # Create DataFrame for plotting
+    # ---------------------------
+    plot_df = pd.DataFrame(pfam_agg)
+    plot_df[interaction_types] = plot_df[interaction_types].astype(float)
+
+    # ---------------------------
+    # Normalize counts per PFAM
+    # ---------------------------
+    for pfam in plot_df['PFAM'].unique():
+        mask = plot_df['PFAM'] == pfam
+        max_val = plot_df.loc[mask, interaction_types].values.max()
+        if max_val > 0:
+            plot_df.loc[mask, interaction_types] = plot_df.loc[mask, interaction_types] / max_val
+
+    # Melt for plotting and map labels
+    plot_df_melt = plot_df.melt(id_vars='PFAM', var_name='Interaction', value_name='Normalized_Count')
+    plot_df_melt['Interaction_Label'] = plot_df_melt['Interaction'].map(interaction_labels)
+
+    # ---------------------------
+    # Plot barplot
+    # ---------------------------
+    plt.figure(figsize=(12, 6))
+    sns.barplot(
+        data=plot_df_melt,
+        x='PFAM',
+        y='Normalized_Count',
+        hue='Interaction_Label',
+        palette=colors
+    )
+    plt.xticks(rotation=45, ha='right')
+    plt.ylabel('Normalized Interaction Count')
+    plt.title('Normalized Interaction Counts per PFAM (frequency >2%)')
+    plt.legend(title='Interaction Type', bbox_to_anchor=(1.05, 1), loc='upper left')
+    plt.tight_layout()
+    plt.savefig(output_plot, dpi=300)
+    plt.close()
+
+    print(f"Normalized barplot with custom colors and external legend saved to: {output_plot}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    # ---------------------------
+    # Load the PFAM summaries
+    # ---------------------------
+    summaries = {c: load_pfam_summary(c, args.pfam_dir) for c in args.classes}
+
+    # ---------------------------
+    # Count interactions in every report.txt of all classes (in parallel)
+    # ---------------------------
+    report_paths = []
+    for lipid_class, df_filtered in summaries.items():
+        plip_base_dir = plip_class_root(lipid_class, args.plip_root)
+        for bd_id in df_filtered['BioDolphinID'].dropna().unique():
+            report_path = os.path.join(plip_base_dir, bd_id, 'report.txt')
+            if os.path.exists(report_path):
+                report_paths.append(report_path)
+
+    report_counts = dict(zip(report_paths, parallel_map(count_interactions, report_paths, args.workers)))
+
+    # ---------------------------
+    # One barplot per lipid class
+    # ---------------------------
+    for lipid_class, df_filtered in summaries.items():
+        plot_class(
+            df_filtered,
+            plip_class_root(lipid_class, args.plip_root),
+            report_counts,
+            os.path.join(args.output_dir, output_plot.format(lipid_class=lipid_class)),
+        )
+
+
+if __name__ == "__main__":
+    main()
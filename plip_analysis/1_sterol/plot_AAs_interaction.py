@@ -7,30 +7,31 @@ matplotlib.rcParams['font.family'] = 'Arial'   # Force Arial
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
-import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lipid_analysis.interaction_store import PLIP_STORE, load_interactions
+from lipid_analysis.plip_report import SECTION_TITLES
 
 # ----------------------------------
-# Load and parse the input text file
+# Load residue counts from the interaction store
 # ----------------------------------
-input_file = "AA_sterol.txt"
+store_dir = PLIP_STORE  # written by plip_analysis/extract_plip_interactions.py
+lipid_class = "sterol"
+
+residues = load_interactions(
+    store_dir,
+    columns=["interaction", "RESTYPE"],
+    lipid_classes=[lipid_class]
+)
+residues = residues[residues["RESTYPE"].str.fullmatch(r"[A-Z]{3}", na=False)].copy()
+residues["interaction"] = residues["interaction"].map(lambda key: SECTION_TITLES.get(key, key))
 
 interaction_data = {}
-current_category = None
-
-with open(input_file, "r") as f:
-    for line in f:
-        line = line.strip()
-
-        if line.startswith("###"):
-            current_category = line.replace("###", "").strip()
-            interaction_data[current_category] = {}
-            continue
-
-        m = re.match(r"(\d+)\s+([A-Z]+)", line)
-        if m and current_category:
-            count = int(m.group(1))
-            aa = m.group(2)
-            interaction_data[current_category][aa] = count
+for (category, aa), count in residues.groupby(["interaction", "RESTYPE"]).size().items():
+    interaction_data.setdefault(category, {})[aa] = int(count)
 
 # ----------------------------------
 # Define AA order by biochemical class
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Single-pass extraction of PLIP interactions for all lipid classes.
+
+Every report.txt is read once and all of its interaction rows are written to the Parquet
+interaction store (plip_interactions/lipid_class=<class>/interactions.parquet), which the
+plotting scripts load from.
+
+With --format xml, report.xml is read with a streaming XML parser instead of the text
+tables (see lipid_analysis/plip_xml.py).
+
+Re-runs are incremental: a manifest of ingested reports (size, mtime, SHA-256) is kept
+next to each partition, and only new or changed reports are parsed. Use --full to
+rebuild from scratch.
+
+With --text-files, the legacy outputs of the interaction_*_stats_<class>.sh,
+interaction_hydrophobic_distances_<class>.sh and interaction_res_<class>.sh scripts are
+written from the same scan (those scripts now call this one with -c <class> --text-files):
+
+- hydrogen_bonds/<class>_hbond_stats/*.txt
+- halogen_bonds/<class>_halogenbond_stats/*.txt
+- salt_bridges/<class>_saltbridge_stats/*.txt
+- pi-stacking/<class>_pistacking_stats/*.txt
+- pi-cation/<class>_pication_stats/*.txt
+- metal_complex/<class>_metalcomplex_stats/*.txt
+- hydrophobic_distances/hydrophobic_distances_<class>.txt
+- <n>_<class>/AA_<class>.txt
+
+Usage:
+    python3 extract_plip_interactions.py [--plip-root DIR] [--classes sterol prenol ...]
+        [--workers N] [--full] [--format txt|xml] [--text-files]
+"""
+
+import argparse
+import os
+import re
+import sys
+from collections import Counter, defaultdict
+from functools import partial
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from lipid_analysis.interaction_store import (
+    PARTITION_FILE,
+    PLIP_STORE,
+    partition_dir,
+    update_partition,
+    write_partition,
+)
+from lipid_analysis.lipid_classes import LIPID_CLASSES, PLIP_ROOT, plip_class_root
+from lipid_analysis.manifest import file_fingerprint, load_manifest, plan_update, write_manifest
+from lipid_analysis.parallel import default_workers, parallel_map
+from lipid_analysis.plip_report import SECTION_TITLES, iter_reports, parse_report
+from lipid_analysis.plip_xml import parse_report_xml
+
+# report format -> (report file name, parser)
+REPORT_FORMATS = {
+    "txt": ("report.txt", parse_report),
+    "xml": ("report.xml", parse_report_xml),
+}
+
+# ---------------------------
+# Output layout of the legacy text files
+# ---------------------------
+NUMBER_RE = re.compile(r"^[0-9.]+$")
+INTEGER_RE = re.compile(r"^[0-9]+$")
+TEXT_RE = re.compile(r".+")
+
+# interaction -> (output folder, stats folder suffix, {file name: (PLIP column, value filter)})
+FEATURE_FILES = {
+    "hydrogen_bonds": ("hydrogen_bonds", "hbond_stats", {
+        "sidechain.txt": ("SIDECHAIN", TEXT_RE),
+        "dist_HA.txt": ("DIST_H-A", NUMBER_RE),
+        "dist_DA.txt": ("DIST_D-A", NUMBER_RE),
+        "donor_angle.txt": ("DON_ANGLE", NUMBER_RE),
+        "donor_type.txt": ("DONORTYPE", TEXT_RE),
+        "acceptor_type.txt": ("ACCEPTORTYPE", TEXT_RE),
+    }),
+    "halogen_bonds": ("halogen_bonds", "halogenbond_stats", {
+        "sidechain.txt": ("SIDECHAIN", TEXT_RE),
+        "dist.txt": ("DIST", NUMBER_RE),
+        "donor_angle.txt": ("DON_ANGLE", NUMBER_RE),
+        "acceptor_angle.txt": ("ACC_ANGLE", NUMBER_RE),
+        "donor_type.txt": ("DONORTYPE", TEXT_RE),
+        "acceptor_type.txt": ("ACCEPTORTYPE", TEXT_RE),
+    }),
+    "salt_bridges": ("salt_bridges", "saltbridge_stats", {
+        "RESTYPE_LIG.txt": ("RESTYPE_LIG", TEXT_RE),
+        "DIST.txt": ("DIST", NUMBER_RE),
+        "LIG_GROUP.txt": ("LIG_GROUP", TEXT_RE),
+    }),
+    "pi_stacking": ("pi-stacking", "pistacking_stats", {
+        "CENTDIST.txt": ("CENTDIST", NUMBER_RE),
+        "ANGLE.txt": ("ANGLE", NUMBER_RE),
+        "OFFSET.txt": ("OFFSET", NUMBER_RE),
+        "TYPE.txt": ("TYPE", TEXT_RE),
+    }),
+    "pi_cation": ("pi-cation", "pication_stats", {
+        "DIST.txt": ("DIST", NUMBER_RE),
+        "OFFSET.txt": ("OFFSET", NUMBER_RE),
+        "PROTCHARGED.txt": ("PROTCHARGED", TEXT_RE),
+        "LIG_GROUP.txt": ("LIG_GROUP", TEXT_RE),
+    }),
+    "metal_bonds": ("metal_complex", "metalcomplex_stats", {
+        "METAL_TYPE.txt": ("METAL_TYPE", TEXT_RE),
+        "TARGET_TYPE.txt": ("TARGET_TYPE", TEXT_RE),
+        "COORDINATION.txt": ("COORDINATION", INTEGER_RE),
+        "DIST.txt": ("DIST", NUMBER_RE),
+        "LOCATION.txt": ("LOCATION", TEXT_RE),
+        "GEOMETRY.txt": ("GEOMETRY", TEXT_RE),
+        "RESTYPE_LIG.txt": ("RESTYPE_LIG", TEXT_RE),
+    }),
+}
+
+RESTYPE_RE = re.compile(r"^[A-Z]{3}$")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-r",
+        "--plip-root",
+        default=PLIP_ROOT,
+        help="Directory holding one PLIP output folder per lipid class.",
+    )
+    parser.add_argument(
+        "-c",
+        "--classes",
+        nargs="+",
+        default=LIPID_CLASSES,
+        choices=LIPID_CLASSES,
+        help="Lipid classes to extract. Defaults to all eight.",
+    )
+    parser.add_argument(
+        "-s",
+        "--store",
+        default=PLIP_STORE,
+        help="Directory of the Parquet interaction store (partitioned by lipid class).",
+    )
+    parser.add_argument(
+        "-x",
+        "--format",
+        default="txt",
+        choices=list(REPORT_FORMATS),
+        help="PLIP report to read: the text tables (report.txt) or the XML report (report.xml).",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=default_workers(),
+        help="Number of processes parsing reports in parallel (1 for a serial run). Defaults to all cores.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=64,
+        help="Number of reports handed to a worker process at a time.",
+    )
+    parser.add_argument(
+        "-f",
+        "--full",
+        action="store_true",
+        help="Re-parse every report instead of only new or changed ones.",
+    )
+    parser.add_argument(
+        "-t",
+        "--text-files",
+        action="store_true",
+        help="Also write the legacy one-value-per-line feature files and AA_<class>.txt "
+        "(implies --full).",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        default=str(Path(__file__).resolve().parent),
+        help="plip_analysis directory to write the legacy text files into.",
+    )
+    args = parser.parse_args()
+
+    if args.text_files and args.format != "txt":
+        parser.error("--text-files requires --format txt")
+
+    return args
+
+
+def ingest_report(report_path: str, parser=parse_report):
+    """
+    Fingerprints and parses one PLIP report (run in the worker processes).
+
+    Args:
+        report_path (str): path to report.txt or report.xml.
+        parser (callable): parse_report or parse_report_xml.
+    Returns:
+        (fingerprint for the manifest, list of interaction rows).
+    """
+    return file_fingerprint(report_path), list(parser(report_path))
+
+
+def write_text_files(rows, lipid_class: str, output_dir: str):
+    """
+    Writes the legacy text outputs of the interaction_*_<class>.sh scripts
+    while passing every row through unchanged.
+
+    Args:
+        rows (iterable): interaction rows from parse_report.
+        lipid_class (str): lipid class ID.
+        output_dir (str): plip_analysis directory to write the feature files into.
+    """
+    # open all per-feature output files for this class up front
+    handles = {}
+    for interaction, (folder, suffix, files) in FEATURE_FILES.items():
+        stats_dir = os.path.join(output_dir, folder, f"{lipid_class}_{suffix}")
+        os.makedirs(stats_dir, exist_ok=True)
+        for filename, (column, pattern) in files.items():
+            out = open(os.path.join(stats_dir, filename), "w")
+            handles.setdefault(interaction, []).append((column, pattern, out))
+
+    hydrophobic_distances = []
+    residue_counts = defaultdict(Counter)
+
+    try:
+        for row in rows:
+            interaction = row["interaction"]
+
+            for column, pattern, out in handles.get(interaction, []):
+                value = row.get(column, "")
+                if pattern.match(value):
+                    out.write(value + "\n")
+
+            if interaction == "hydrophobic" and NUMBER_RE.match(row.get("DIST", "")):
+                hydrophobic_distances.append(row["DIST"])
+
+            restype = row.get("RESTYPE", "")
+            if RESTYPE_RE.match(restype):
+                section = SECTION_TITLES.get(interaction, interaction)
+                residue_counts[section][restype] += 1
+
+            yield row
+    finally:
+        for outputs in handles.values():
+            for _, _, out in outputs:
+                out.close()
+
+    # hydrophobic distances, sorted numerically like `sort -n`
+    hydro_dir = os.path.join(output_dir, "hydrophobic_distances")
+    os.makedirs(hydro_dir, exist_ok=True)
+    with open(os.path.join(hydro_dir, f"hydrophobic_distances_{lipid_class}.txt"), "w") as f:
+        f.write("Hydrophobic interaction distances across all files:\n")
+        for dist in sorted(hydrophobic_distances, key=float):
+            f.write(dist + "\n")
+
+    # residue counts per interaction type, formatted like `sort | uniq -c | sort -nr`
+    class_number = LIPID_CLASSES.index(lipid_class) + 1
+    aa_dir = os.path.join(output_dir, f"{class_number}_{lipid_class}")
+    os.makedirs(aa_dir, exist_ok=True)
+    with open(os.path.join(aa_dir, f"AA_{lipid_class}.txt"), "w") as f:
+        for section in sorted(residue_counts):
+            f.write(f"### {section}\n")
+            counts = sorted(residue_counts[section].items(), key=lambda x: (x[1], x[0]), reverse=True)
+            for restype, count in counts:
+                f.write(f"{count:7d} {restype}\n")
+            f.write("\n")
+
+
+def extract_class(
+    lipid_class: str,
+    class_root: str,
+    store_dir: str,
+    text_dir=None,
+    workers: int = 1,
+    chunk_size: int = 64,
+    full: bool = False,
+    report_format: str = "txt",
+):
+    """
+    Updates the partition of one lipid class in the interaction store (and, optionally,
+    writes the legacy text files).
+
+    Only reports that are new or changed since the last run (according to the partition
+    manifest) are parsed; rows of changed or deleted reports are replaced or dropped.
+    A full extraction reads every report.txt once and rewrites the partition.
+
+    Args:
+        lipid_class (str): lipid class ID.
+        class_root (str): directory containing the PLIP output folders of this class.
+        store_dir (str): root directory of the interaction store.
+        text_dir (str): if given, plip_analysis directory to write the legacy text files
+            into. Requires a full extraction.
+        workers (int): number of processes parsing reports.
+        chunk_size (int): number of reports handed to a worker at a time.
+        full (bool): re-parse every report.
+        report_format (str): "txt" to read report.txt, "xml" to read report.xml.
+    Returns:
+        (number of reports parsed, number of reports on disk, number of rows in the
+        partition or None if it was already up to date).
+    """
+    filename, parser = REPORT_FORMATS[report_format]
+    report_paths = list(iter_reports(class_root, filename))
+    out_dir = partition_dir(lipid_class, store_dir)
+
+    manifest = None
+    if not full and text_dir is None and os.path.exists(os.path.join(out_dir, PARTITION_FILE)):
+        manifest = load_manifest(out_dir)
+
+    if manifest is None:
+        to_parse, new_manifest, removed = report_paths, {}, []
+    else:
+        to_parse, new_manifest, removed = plan_update(report_paths, class_root, manifest)
+
+    if manifest is not None and not to_parse and not removed:
+        write_manifest(new_manifest, out_dir, class_root)
+        return 0, len(report_paths), None
+
+    def iter_rows():
+        results = parallel_map(partial(ingest_report, parser=parser), to_parse, workers, chunk_size)
+        for report_path, (fingerprint, records) in zip(to_parse, results):
+            rel_path = os.path.relpath(report_path, class_root)
+            new_manifest[rel_path] = {"BioDolphinID": Path(report_path).parent.name, **fingerprint}
+            yield from records
+
+    rows = iter_rows()
+    if text_dir is not None:
+        rows = write_text_files(rows, lipid_class, text_dir)
+
+    if manifest is None:
+        n_rows = write_partition(rows, lipid_class, store_dir)
+    else:
+        replaced_ids = [manifest[rel_path]["BioDolphinID"] for rel_path in removed]
+        replaced_ids += [Path(report_path).parent.name for report_path in to_parse]
+        id_order = [Path(report_path).parent.name for report_path in report_paths]
+        n_rows = update_partition(rows, lipid_class, replaced_ids, id_order, store_dir)
+
+    write_manifest(new_manifest, out_dir, class_root)
+
+    return len(to_parse), len(report_paths), n_rows
+
+
+def main():
+    args = parse_args()
+
+    for lipid_class in args.classes:
+        class_root = plip_class_root(lipid_class, args.plip_root)
+        if not os.path.isdir(class_root):
+            print(f"WARNING: {class_root} does not exist, skipping {lipid_class}.")
+            continue
+
+        text_dir = args.output_dir if args.text_files else None
+        n_parsed, n_reports, n_rows = extract_class(
+            lipid_class,
+            class_root,
+            args.store,
+            text_dir,
+            args.workers,
+            args.chunk_size,
+            args.full,
+            args.format,
+        )
+        if n_rows is None:
+            print(f"{lipid_class}: up to date ({n_reports} reports in {class_root})")
+        else:
+            print(
+                f"{lipid_class}: parsed {n_parsed} of {n_reports} reports from {class_root}, "
+                f"{n_rows} interactions stored"
+            )
+
+    print(f"Interaction store written to: {args.store}")
+    if args.text_files:
+        print(f"Legacy feature files written to: {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
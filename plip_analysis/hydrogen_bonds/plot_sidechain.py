@@ -6,26 +6,23 @@ matplotlib.rcParams['font.family'] = 'Arial'
 
 import pandas as pd
 import matplotlib.pyplot as plt
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lipid_analysis.interaction_store import PLIP_STORE, load_feature
+from lipid_analysis.lipid_classes import class_labels
+
 # --------------------------------------
 # User configuration
 # --------------------------------------
-base_dir = Path("/Users/amcshan3/Desktop/Manuscripts/PLIP_Dpocket_Lipid_Puri_2025/used-to-make/plip_amino_acid/hydrogen_bonds")
+store_dir = PLIP_STORE  # written by plip_analysis/extract_plip_interactions.py
 output_pdf = "sidechain_counts_barplot.pdf"
 output_txt = "sidechain_counts_normalized.txt"
 
-# Lipid classes and corresponding subfolders
-lipid_dirs = {
-    "sterol": "sterol_hbond_stats",
-    "Polyketide": "polyketide_hbond_stats",
-    "Prenol": "prenol_hbond_stats",
-    "saccharo lipid": "saccharolipid_hbond_stats",
-    "Spingo lipid": "sphingolipid_hbond_stats",
-    "Fatty Acyl": "fattyacyl_hbond_stats",
-    "Glycerophopspholipid": "glycerophospholipid_hbond_stats",
-    "Glycerolipid": "glycerolipid_hbond_stats"
-}
+# Lipid classes (display name -> ID in the interaction store), in figure order
+lipid_ids = class_labels()
 
 # Colors for True / False
 color_map = {
@@ -38,18 +35,10 @@ color_map = {
 # --------------------------------------
 all_data = []
 
-for lipid_class, folder in lipid_dirs.items():
-    txt_path = base_dir / folder / "sidechain.txt"
-
-    if not txt_path.exists():
-        print(f"WARNING: {txt_path} does not exist, skipping {lipid_class}.")
-        continue
-
-    with open(txt_path) as f:
-        lines = [line.strip() for line in f if line.strip()]
+values = load_feature("hydrogen_bonds", "SIDECHAIN", store_dir)
 
-    # Convert to boolean
-    bools = pd.Series([line.lower() == "true" for line in lines])
+for lipid_class, class_id in lipid_ids.items():
+    bools = values.get(class_id, pd.Series(dtype=bool)).astype(bool)
 
     if bools.empty:
         print(f"WARNING: {lipid_class} has no valid True/False entries. Skipping.")
@@ -60,7 +49,7 @@ for lipid_class, folder in lipid_dirs.items():
     all_data.append(counts)
 
 if not all_data:
-    raise ValueError("No valid sidechain.txt data found.")
+    raise ValueError(f"No valid sidechain data found in {store_dir}.")
 
 df_counts = pd.DataFrame(all_data)
 
@@ -1,35 +1,13 @@
 #!/bin/bash
 
-root_dir="/Volumes/8TB_McShan_Drive/nikki/project_1/plip/Gylcerolipids"
-output_file="hydrophobic_distances_glycerolipid.txt"
-temp_dir="temp_hydro_dist"
-
-mkdir -p "$temp_dir"
-> "$output_file"
-
-find "$root_dir" -type f -name "report.txt" | while read -r report_path; do
-    awk -v temp_dir="$temp_dir" '
-        BEGIN { in_hydro_section = 0; outfile = temp_dir "/hydrophobic.tmp" }
-
-        /^\*\*Hydrophobic Interactions\*\*/ { in_hydro_section = 1; next }
-        /^\*\*/ { in_hydro_section = 0 }
-
-        in_hydro_section && /^\| RESNR/ { next }
-
-        in_hydro_section && /^\|/ && !/RESNR/ {
-            gsub(/\|/, "", $0);
-            gsub(/[ \t]+/, " ", $0);
-            split($0, fields, " ");
-            dist = fields[7];
-            if (dist ~ /^[0-9.]+$/) {
-                print dist >> outfile
-            }
-        }
-    ' "$report_path"
-done
-
-echo "Hydrophobic interaction distances across all files:" >> "$output_file"
-sort -n "$temp_dir/hydrophobic.tmp" >> "$output_file"
-
-rm -r "$temp_dir"
-echo "Consolidated hydrophobic distances saved in: $output_file"
+# ----------------------------------------
+# Extracts the hydrophobic interaction distances of glycerolipid into
+# hydrophobic_distances_glycerolipid.txt.
+# Wrapper around plip_analysis/extract_plip_interactions.py --text-files, which reads
+# every report.txt of the class once and writes all legacy feature files of the class
+# (and its partition of the Parquet interaction store) from the same pass.
+# ----------------------------------------
+plip_root="/Volumes/8TB_McShan_Drive/nikki/project_1/plip"
+script_dir="$(cd "$(dirname "$0")" && pwd)"
+
+python3 "$script_dir/../extract_plip_interactions.py" -c glycerolipid -r "$plip_root" --text-files "$@"
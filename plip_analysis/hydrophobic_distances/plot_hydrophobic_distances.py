@@ -9,61 +9,38 @@ matplotlib.rcParams['font.family'] = 'Arial'
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lipid_analysis.interaction_store import PLIP_STORE, load_feature
+from lipid_analysis.lipid_classes import class_colors, class_labels
+
 # --------------------------------------
 # User configuration
 # --------------------------------------
-input_dir = "/Users/amcshan3/Desktop/Manuscripts/PLIP_Dpocket_Lipid_Puri_2025/used-to-make/plip_amino_acid/hydrophobic_distances"
+store_dir = PLIP_STORE  # written by plip_analysis/extract_plip_interactions.py
 output_pdf = "hydrophobic_distance_violin.pdf"
 median_output_txt = "hydrophobic_distance_median_values.txt"
 
-# Lipid classes and corresponding input files
-lipid_files = {
-    "sterol": "hydrophobic_distances_sterol.txt",
-    "Polyketide": "hydrophobic_distances_polyketide.txt",
-    "Prenol": "hydrophobic_distances_prenol.txt",
-    "saccharo lipid": "hydrophobic_distances_saccharolipid.txt",
-    "Spingo lipid": "hydrophobic_distances_sphingolipid.txt",
-    "Fatty Acyl": "hydrophobic_distances_fattyacyl.txt",
-    "Glycerophopspholipid": "hydrophobic_distances_glycerophospholipid.txt",
-    "Glycerolipid": "hydrophobic_distances_glycerolipid.txt"
-}
-
-# Custom colors per lipid class
-color_map = {
-    "sterol": "#F2C9D1",
-    "Polyketide": "#CBC7D6",
-    "Prenol": "#D0F2F2",
-    "saccharo lipid": "#F5F5F5",
-    "Spingo lipid": "#F2ECD3",
-    "Fatty Acyl": "#F2DDBF",
-    "Glycerophopspholipid": "#F5C1CE",
-    "Glycerolipid": "#D4EBD1"
-}
+# Lipid classes (display name -> ID in the interaction store), in figure order
+lipid_ids = class_labels()
+
+# Colors per lipid class
+color_map = class_colors()
 
 # --------------------------------------
 # Load data
 # --------------------------------------
 all_data = []
 
-for lipid_class, filename in lipid_files.items():
-    path = Path(input_dir) / filename
-    if not path.exists():
-        print(f"WARNING: file {filename} not found, skipping {lipid_class}")
-        continue
-
-    # Skip header line if present
-    with open(path) as f:
-        lines = [line.strip() for line in f if line.strip() and not line.lower().startswith("hydrophobic")]
-
-    if not lines:
-        print(f"WARNING: {filename} has no data, skipping {lipid_class}")
-        continue
+values = load_feature("hydrophobic", "DIST", store_dir)
 
-    distances = pd.to_numeric(pd.Series(lines), errors='coerce').dropna()
+for lipid_class, class_id in lipid_ids.items():
+    distances = values.get(class_id, pd.Series(dtype=float))
     if distances.empty:
-        print(f"WARNING: {filename} has no numeric values, skipping {lipid_class}")
+        print(f"WARNING: no hydrophobic distances for {class_id}, skipping {lipid_class}")
         continue
 
     df = pd.DataFrame({
@@ -73,7 +50,7 @@ for lipid_class, filename in lipid_files.items():
     all_data.append(df)
 
 if not all_data:
-    raise ValueError("No valid distance data found in any file.")
+    raise ValueError(f"No valid distance data found in {store_dir}.")
 
 merged = pd.concat(all_data, ignore_index=True)
 
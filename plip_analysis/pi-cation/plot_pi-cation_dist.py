@@ -6,55 +6,37 @@ matplotlib.rcParams['font.family'] = 'Arial'
 
 import pandas as pd
 import matplotlib.pyplot as plt
+import sys
 from pathlib import Path
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lipid_analysis.interaction_store import PLIP_STORE, load_feature
+from lipid_analysis.lipid_classes import class_colors, class_labels
+
 # --------------------------------------
 # User configuration
 # --------------------------------------
-base_dir = Path("/Users/amcshan3/Desktop/Manuscripts/PLIP_Dpocket_Lipid_Puri_2025/used-to-make/plip_amino_acid/pi-cation")
+store_dir = PLIP_STORE  # written by plip_analysis/extract_plip_interactions.py
 output_pdf = "pication_dist_violin.pdf"
 median_output_txt = "pication_dist_stats.txt"
 
-# Lipid classes and corresponding subfolders
-lipid_dirs = {
-    "sterol": "sterol_pication_stats",
-    "Polyketide": "polyketide_pication_stats",
-    "Prenol": "prenol_pication_stats",
-    "saccharo lipid": "saccharolipid_pication_stats",
-    "Spingo lipid": "sphingolipid_pication_stats",
-    "Fatty Acyl": "fattyacyl_pication_stats",
-    "Glycerophopspholipid": "glycerophospholipid_pication_stats",
-    "Glycerolipid": "glycerolipid_pication_stats"
-}
-
-# Custom colors per lipid class
-color_map = {
-    "sterol": "#F2C9D1",
-    "Polyketide": "#CBC7D6",
-    "Prenol": "#D0F2F2",
-    "saccharo lipid": "#F5F5F5",
-    "Spingo lipid": "#F2ECD3",
-    "Fatty Acyl": "#F2DDBF",
-    "Glycerophopspholipid": "#F5C1CE",
-    "Glycerolipid": "#D4EBD1"
-}
+# Lipid classes (display name -> ID in the interaction store), in figure order
+lipid_ids = class_labels()
+
+# Colors per lipid class
+color_map = class_colors()
 
 # --------------------------------------
 # Load data
 # --------------------------------------
 all_data = []
 
-for lipid_class, folder in lipid_dirs.items():
-    txt_path = base_dir / folder / "DIST.txt"
-    if not txt_path.exists():
-        print(f"WARNING: {txt_path} does not exist, skipping {lipid_class}.")
-        continue
-
-    with open(txt_path) as f:
-        lines = [line.strip() for line in f if line.strip()]
+values = load_feature("pi_cation", "DIST", store_dir)
 
-    DIST = pd.to_numeric(pd.Series(lines), errors="coerce").dropna()
+for lipid_class, class_id in lipid_ids.items():
+    DIST = values.get(class_id, pd.Series(dtype=float))
     if DIST.empty:
         print(f"WARNING: {lipid_class} has no numeric DIST values. Skipping.")
         continue
@@ -63,7 +45,7 @@ for lipid_class, folder in lipid_dirs.items():
     all_data.append(df)
 
 if not all_data:
-    raise ValueError("No valid DIST.txt data found.")
+    raise ValueError(f"No valid DIST data found in {store_dir}.")
 
 merged = pd.concat(all_data, ignore_index=True)
 
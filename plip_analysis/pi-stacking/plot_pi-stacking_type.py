@@ -6,26 +6,23 @@ matplotlib.rcParams['font.family'] = 'Arial'
 
 import pandas as pd
 import matplotlib.pyplot as plt
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lipid_analysis.interaction_store import PLIP_STORE, load_feature
+from lipid_analysis.lipid_classes import class_labels
+
 # --------------------------------------
 # User configuration
 # --------------------------------------
-base_dir = Path("/Users/amcshan3/Desktop/Manuscripts/PLIP_Dpocket_Lipid_Puri_2025/used-to-make/plip_amino_acid/pi-stacking")
+store_dir = PLIP_STORE  # written by plip_analysis/extract_plip_interactions.py
 output_pdf = "pistacking_type_barplot.pdf"
 output_txt = "pistacking_type_counts_normalized.txt"
 
-# Lipid classes and corresponding subfolders
-lipid_dirs = {
-    "sterol": "sterol_pistacking_stats",
-    "Polyketide": "polyketide_pistacking_stats",
-    "Prenol": "prenol_pistacking_stats",
-    "saccharo lipid": "saccharolipid_pistacking_stats",
-    "Spingo lipid": "sphingolipid_pistacking_stats",
-    "Fatty Acyl": "fattyacyl_pistacking_stats",
-    "Glycerophopspholipid": "glycerophospholipid_pistacking_stats",
-    "Glycerolipid": "glycerolipid_pistacking_stats"
-}
+# Lipid classes (display name -> ID in the interaction store), in figure order
+lipid_ids = class_labels()
 
 # Colors for pi-stacking types
 color_map = {
@@ -38,18 +35,13 @@ color_map = {
 # --------------------------------------
 all_data = []
 
-for lipid_class, folder in lipid_dirs.items():
-    txt_path = base_dir / folder / "TYPE.txt"
-
-    if not txt_path.exists():
-        print(f"WARNING: {txt_path} does not exist, skipping {lipid_class}.")
-        continue
+values = load_feature("pi_stacking", "TYPE", store_dir)
 
-    with open(txt_path) as f:
-        lines = [line.strip() for line in f if line.strip()]
+for lipid_class, class_id in lipid_ids.items():
+    lines = values.get(class_id, pd.Series(dtype=object)).tolist()
 
     if not lines:
-        print(f"WARNING: {lipid_class} TYPE.txt is empty. Skipping.")
+        print(f"WARNING: {lipid_class} has no TYPE values. Skipping.")
         continue
 
     # Count occurrences of each type (P or T)
@@ -58,7 +50,7 @@ for lipid_class, folder in lipid_dirs.items():
     all_data.append(counts)
 
 if not all_data:
-    raise ValueError("No valid TYPE.txt data found.")
+    raise ValueError(f"No valid TYPE data found in {store_dir}.")
 
 df_counts = pd.DataFrame(all_data)
 
@@ -9,63 +9,46 @@ matplotlib.rcParams['font.family'] = 'Arial'
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lipid_analysis.interaction_store import PLIP_STORE, load_feature
+from lipid_analysis.lipid_classes import class_colors, class_labels
+
 # --------------------------------------
 # User configuration
 # --------------------------------------
-base_dir = Path("/Users/amcshan3/Desktop/Manuscripts/PLIP_Dpocket_Lipid_Puri_2025/used-to-make/plip_amino_acid/salt_bridges")
+store_dir = PLIP_STORE  # written by plip_analysis/extract_plip_interactions.py
 output_pdf = "ligand_group_barplot.pdf"
 counts_output_txt = "ligand_group_counts.txt"
 
-# Lipid classes and corresponding subfolders
-lipid_dirs = {
-    "sterol": "sterol_saltbridge_stats",
-    "Polyketide": "polyketide_saltbridge_stats",
-    "Prenol": "prenol_saltbridge_stats",
-    "saccharo lipid": "saccharolipid_saltbridge_stats",
-    "Spingo lipid": "sphingolipid_saltbridge_stats",
-    "Fatty Acyl": "fattyacyl_saltbridge_stats",
-    "Glycerophopspholipid": "glycerophospholipid_saltbridge_stats",
-    "Glycerolipid": "glycerolipid_saltbridge_stats"
-}
-
-# Custom colors per lipid class
-color_map = {
-    "sterol": "#F2C9D1",
-    "Polyketide": "#CBC7D6",
-    "Prenol": "#D0F2F2",
-    "saccharo lipid": "#F5F5F5",
-    "Spingo lipid": "#F2ECD3",
-    "Fatty Acyl": "#F2DDBF",
-    "Glycerophopspholipid": "#F5C1CE",
-    "Glycerolipid": "#D4EBD1"
-}
+# Lipid classes (display name -> ID in the interaction store), in figure order
+lipid_ids = class_labels()
+
+# Colors per lipid class
+color_map = class_colors()
 
 # --------------------------------------
 # Load ligand group data
 # --------------------------------------
 all_data = []
 
-for lipid_class, folder in lipid_dirs.items():
-    txt_path = base_dir / folder / "LIG_GROUP.txt"
-
-    if not txt_path.exists():
-        print(f"WARNING: {txt_path} does not exist, skipping {lipid_class}.")
-        continue
+values = load_feature("salt_bridges", "LIG_GROUP", store_dir)
 
-    with open(txt_path) as f:
-        lines = [line.strip() for line in f if line.strip()]
+for lipid_class, class_id in lipid_ids.items():
+    lines = values.get(class_id, pd.Series(dtype=object)).tolist()
 
     if not lines:
-        print(f"WARNING: {lipid_class} LIG_GROUP.txt is empty. Skipping.")
+        print(f"WARNING: {lipid_class} has no LIG_GROUP values. Skipping.")
         continue
 
     df = pd.DataFrame({"lig_group": lines, "class": lipid_class})
     all_data.append(df)
 
 if not all_data:
-    raise ValueError("No valid LIG_GROUP.txt data found.")
+    raise ValueError(f"No valid LIG_GROUP data found in {store_dir}.")
 
 merged = pd.concat(all_data, ignore_index=True)
 
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Exports static PDFs of the ProteinCartography plots of any number of lipid classes
+(all eight by default) in one process.
+
+For every lipid class and embedding mode (pca_tsne, pca_umap), the coordinates file
+<run>_aggregated_features_<mode>.tsv is read once and every color mode of the interactive
+plot (Leiden cluster, Pfam, broad taxon, ...) is drawn with Matplotlib as one page of
+<run>_aggregated_features_<mode>_color_modes.pdf, with the plotting rules and colors of
+fixed_cartography_scripts/plot_interactive.py. No browser engine (kaleido) is started.
+
+plot_interactive.py imports color_utils from ProteinCartography, so the ProteinCartography
+checkout must be given with -p (default ~/ProteinCartography-main).
+
+Usage:
+    python3 export_cartography_pdfs.py
+    python3 export_cartography_pdfs.py -c sterol polyketide -e pca_tsne -o cartography_pdfs
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from lipid_analysis.lipid_classes import CARTOGRAPHY_ROOT, LIPID_CLASSES, cartography_tsv
+
+FIXED_SCRIPTS = str(Path(__file__).resolve().parent / "fixed_cartography_scripts")
+PROTEINCARTOGRAPHY_DIR = os.path.expanduser("~/ProteinCartography-main")
+EMBEDDING_MODES = ["pca_tsne", "pca_umap"]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-c",
+        "--classes",
+        nargs="+",
+        default=LIPID_CLASSES,
+        choices=LIPID_CLASSES,
+        help="Lipid classes to export. Defaults to all eight.",
+    )
+    parser.add_argument(
+        "-e",
+        "--embeddings",
+        nargs="+",
+        default=EMBEDDING_MODES,
+        choices=EMBEDDING_MODES,
+        help="Embedding (plotting) modes to export.",
+    )
+    parser.add_argument(
+        "-m",
+        "--cartography-root",
+        default=CARTOGRAPHY_ROOT,
+        help="Directory holding the ProteinCartography results.",
+    )
+    parser.add_argument(
+        "-p",
+        "--proteincartography-dir",
+        default=PROTEINCARTOGRAPHY_DIR,
+        help="ProteinCartography checkout providing color_utils.py.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        default=None,
+        help="Directory the PDFs are written to. Defaults to next to each coordinates file.",
+    )
+    parser.add_argument(
+        "-x",
+        "--taxon-focus",
+        default="euk",
+        choices=["euk", "bac"],
+        help="Coloring scheme/ taxonomic groups for the broad taxon plot.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # the fixed scripts first, so their plot_interactive.py is used over ProteinCartography's
+    sys.path.insert(0, args.proteincartography_dir)
+    sys.path.insert(0, FIXED_SCRIPTS)
+    from plot_interactive import export_static_pages, generate_plotting_rules
+
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    plotting_rules = generate_plotting_rules(args.taxon_focus)
+
+    n_files = 0
+    for lipid_class in args.classes:
+        for embedding in args.embeddings:
+            coordinates_file = cartography_tsv(
+                lipid_class, args.cartography_root, suffix=f"aggregated_features_{embedding}.tsv"
+            )
+            if not os.path.exists(coordinates_file):
+                print(f"WARNING: {lipid_class} {embedding}: {coordinates_file} not found, skipping.")
+                continue
+
+            output_name = os.path.basename(coordinates_file).replace(".tsv", "_color_modes.pdf")
+            output_dir = args.output_dir or os.path.dirname(coordinates_file)
+            output_file = os.path.join(output_dir, output_name)
+
+            n_pages = export_static_pages(coordinates_file, plotting_rules, output_file)
+            print(f"{lipid_class} {embedding}: {n_pages} color modes written to {output_file}")
+            n_files += 1
+
+    print(f"\nDone. {n_files} PDFs written.")
+
+
+if __name__ == "__main__":
+    main()
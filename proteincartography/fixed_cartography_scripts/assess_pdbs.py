@@ -2,8 +2,12 @@
 import argparse
 import os
 import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from io import StringIO
 from pathlib import Path
+from typing import Optional
 
 import numpy as np
 import pandas as pd
@@ -19,11 +23,17 @@ __all__ = [
     "assign_residue_colors",
     "parse_chains",
     "assign_origin",
+    "read_pdb_fields",
+    "score_origin",
+    "assess_structure",
     "assess_pdbs",
 ]
 
 RESIDUE_BINS = ["very_low", "low", "confident", "very_high"]
 
+ASSESSMENT_COLUMNS = ["protid", "pdb_origin", "pdb_confidence", "pdb_chains"]
+BATCH_SIZE = 500
+
 # based on: https://www.cgl.ucsf.edu/chimera/docs/UsersGuide/tutorials/pdbintro.html
 ATOM_SPEC_DICT = {
     "ATOM": (0, 6),
@@ -57,6 +67,25 @@ def parse_args():
         help="Path to the directory of PDB files to assess",
     )
     parser.add_argument("-o", "--output", required=True, help="Name of output TSV file.")
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes assessing PDB files in parallel.",
+    )
+    parser.add_argument(
+        "-b",
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help="Number of rows written to the output TSV at a time.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Keep the rows of an existing output TSV and only assess the remaining PDB files.",
+    )
     args = parser.parse_args()
     return args
 
@@ -213,42 +242,96 @@ def parse_chains(input_path: str):
     return chains
 
 
-def assign_origin(input_path: str):
+def read_pdb_fields(input_path: str) -> dict:
     """
-    Assigns an origin to a PDB file based on presence/ absence of references to AlphaFold,
-    Protein Data Bank, or ESMFold.
+    Reads a PDB file once and extracts every field used by the assessment:
+    validity, origin keywords, DBREF databases, TITLE, REMARK, EXPDTA,
+    and the chain and temperature (confidence) columns of the ATOM records.
+
+    The fields match those of is_valid_pdb, fetch_dbref, fetch_title, fetch_remark,
+    fetch_experiment, extract_residue_confidence and parse_chains, which each read the file again.
 
     Args:
         input_path (str): path of PDB file.
     """
+    with open(input_path) as f:
+        contents = f.read()
+
+    fields = {
+        "valid": "<Error>" not in contents,
+        "alphafold": bool(re.search("ALPHAFOLD", contents, re.IGNORECASE)),
+        "pdb": bool(re.search("PDB", contents, re.IGNORECASE)),
+        "esmfold": bool(re.search("ESMFOLD", contents, re.IGNORECASE)),
+        "dbref": [],
+        "title": [],
+        "remark": [],
+        "expdta": [],
+        "chains": [],
+        "temp": [],
+    }
+
+    chains = {}
+    chain_start, chain_end = ATOM_SPEC_DICT["CHAIN"]
+    temp_start, temp_end = ATOM_SPEC_DICT["TEMP"]
+
+    for line in contents.splitlines(keepends=True):
+        if "ATOM" in line[0:6]:
+            chain = line[chain_start:chain_end].strip()
+            chains.setdefault(chain if chain else np.nan, None)
+            try:
+                fields["temp"].append(float(line[temp_start:temp_end]))
+            except ValueError:
+                fields["temp"].append(np.nan)
+        elif "DBREF" in line[0:6]:
+            tokens = line.split()
+            if len(tokens) > 5:
+                fields["dbref"].append(tokens[5])
+
+        # as in fetch_title, fetch_remark and fetch_experiment, keywords are matched anywhere
+        if "TITLE" in line:
+            fields["title"].append(" ".join([i for i in line.split() if i != "TITLE"]))
+        if "REMARK" in line:
+            fields["remark"].append(" ".join([i for i in line.split() if i != "REMARK"]))
+        if "EXPDTA" in line:
+            fields["expdta"].append(" ".join([i for i in line.split() if i != "EXPDTA"]))
+
+    fields["chains"] = list(chains)
+    fields["title"] = " ".join(fields["title"])
+    fields["remark"] = " ".join(fields["remark"])
+    fields["expdta"] = " ".join(fields["expdta"]).split(";")
+
+    return fields
+
+
+def score_origin(fields: dict) -> str:
+    """
+    Assigns an origin to a PDB file from its fields (see read_pdb_fields), based on
+    presence/ absence of references to AlphaFold, Protein Data Bank, or ESMFold.
+
+    Args:
+        fields (dict): fields of the PDB file.
+    """
     AF_FLAG, AF_TITLE_FLAG, AF_REMARK_FLAG = 0, 0, 0
     PDB_FLAG, PDB_REF_FLAG, PDB_REMARK_FLAG = 0, 0, 0
     ESM_FLAG, ESM_TITLE_FLAG, ESM_REMARK_FLAG = 0, 0, 0
 
-    with open(input_path) as f:
-        contents = f.read()
-
-        if re.search("ALPHAFOLD", contents, re.IGNORECASE):
-            AF_FLAG = 1
-        if re.search("PDB", contents, re.IGNORECASE):
-            PDB_FLAG = 1
-        if re.search("ESMFOLD", contents, re.IGNORECASE):
-            ESM_FLAG = 1
-    try:
-        dbref = fetch_dbref(input_path)[5].values
-    except KeyError:
-        dbref = []
+    if fields["alphafold"]:
+        AF_FLAG = 1
+    if fields["pdb"]:
+        PDB_FLAG = 1
+    if fields["esmfold"]:
+        ESM_FLAG = 1
 
-    if "PDB" in dbref:
+    if "PDB" in fields["dbref"]:
         PDB_REF_FLAG = 1
 
-    title = fetch_title(input_path).upper()
+    title = fields["title"].upper()
     if "ALPHAFOLD" in title:
         AF_TITLE_FLAG = 1
     elif "ESMFOLD" in title:
         ESM_TITLE_FLAG = 1
 
-    remark = fetch_remark(input_path).upper()
+    remark = fields["remark"].upper()
     if "ALPHAFOLD" in remark:
         AF_REMARK_FLAG = 1
     elif "ESMFOLD" in remark:
@@ -274,75 +357,175 @@ def assign_origin(input_path: str):
     return maxscore
 
 
-def assess_pdbs(structure_filepaths: list, output_file=None):
+def assign_origin(input_path: str):
     """
-    Assesses PDB quality, experimental information, origin,
-    and lists chains for a list of PDB paths.
+    Assigns an origin to a PDB file based on presence/ absence of references to AlphaFold,
+    Protein Data Bank, or ESMFold.
 
     Args:
-        structure_filepaths (list): list of paths to the PDB files to assess.
-        output_file (str): path to output file, if saving results.
+        input_path (str): path of PDB file.
     """
-    collector_df = pd.DataFrame()
+    return score_origin(read_pdb_fields(input_path))
 
-    for structure_filepath in structure_filepaths:
-        if not os.path.exists(structure_filepath):
-            continue
 
-        if not is_valid_pdb(structure_filepath):
-            continue
+def assess_structure(structure_filepath) -> Optional[dict]:
+    """
+    Assesses one PDB file from a single read.
+
+    Args:
+        structure_filepath (str): path of PDB file.
+    Returns:
+        the protid, pdb_origin, pdb_confidence and pdb_chains of the file,
+        or None if it is missing, invalid, or has no confidence values.
+    """
+    if not os.path.exists(structure_filepath):
+        return None
+
+    fields = read_pdb_fields(structure_filepath)
 
-        origin = assign_origin(structure_filepath)
+    if not fields["valid"]:
+        return None
 
-        conf_vals = extract_residue_confidence(structure_filepath)
+    origin = score_origin(fields)
 
-        if origin != "PDB" and conf_vals is None:
-            continue
+    conf_vals = fields["temp"]
+    if not conf_vals or np.all(np.isnan(conf_vals)):
+        conf_vals = None
 
-        #if origin != "PDB":
-        #    max_confidence = np.max(extract_residue_confidence(structure_filepath))
-        #    min_confidence = np.min(extract_residue_confidence(structure_filepath))
-        #    if max_confidence <= 1 and min_confidence <= 1:
-        #        confidence = np.average(extract_residue_confidence(structure_filepath)) * 100
-        #    elif max_confidence >= 1 and min_confidence >= 1:
-        #        confidence = np.average(extract_residue_confidence(structure_filepath))
-        #else:
-        #    confidence = 100
+    if origin != "PDB" and conf_vals is None:
+        return None
 
-        if origin != "PDB":
-            max_confidence = np.max(conf_vals)
-            min_confidence = np.min(conf_vals)
+    if origin != "PDB":
+        max_confidence = np.max(conf_vals)
+        min_confidence = np.min(conf_vals)
 
-            if max_confidence <= 1 and min_confidence <= 1:
-                confidence = np.mean(conf_vals) * 100
-            else:
-                confidence = np.mean(conf_vals)
+        if max_confidence <= 1 and min_confidence <= 1:
+            confidence = np.mean(conf_vals) * 100
         else:
-             confidence = 100
+            confidence = np.mean(conf_vals)
+    else:
+         confidence = 100
+
+    return {
+        "protid": os.path.basename(structure_filepath).split(".pdb")[0],
+        "pdb_origin": origin,
+        "pdb_confidence": confidence,
+        "pdb_chains": fields["chains"],
+    }
+
+
+def read_assessed_protids(output_file: str) -> set:
+    """
+    Returns the protids already written to a partial output TSV, dropping a last row
+    left incomplete by an interrupted run.
 
-        chains = parse_chains(structure_filepath)
+    Args:
+        output_file (str): path to the output TSV.
+    """
+    with open(output_file, "rb") as f:
+        contents = f.read()
 
-        info_df = pd.DataFrame(
-            {
-                "protid": os.path.basename(structure_filepath).split(".pdb")[0],
-                "pdb_origin": [origin],
-                "pdb_confidence": [confidence],
-                "pdb_chains": [chains],
-            }
-        )
+    complete = contents[: contents.rfind(b"\n") + 1]
+    lines = complete.decode().splitlines()
 
-        collector_df = pd.concat([collector_df, info_df], ignore_index=True)
+    if not lines or lines[0].split("\t") != ASSESSMENT_COLUMNS:
+        raise ValueError(f"{output_file} is not an assess_pdbs output; cannot resume from it.")
 
-    if output_file is not None:
-        collector_df.to_csv(output_file, sep="\t", index=None)
+    if len(complete) < len(contents):
+        with open(output_file, "r+b") as f:
+            f.truncate(len(complete))
 
-    return collector_df
+    return {line.split("\t")[0] for line in lines[1:]}
+
+
+def assess_pdbs(
+    structure_filepaths: list,
+    output_file=None,
+    workers: int = 1,
+    batch_size: int = BATCH_SIZE,
+    resume: bool = False,
+):
+    """
+    Assesses PDB quality, experimental information, origin,
+    and lists chains for a list of PDB paths.
+
+    Rows are appended to the output file every batch_size rows, so an interrupted run
+    can be resumed, and throughput is reported after each batch.
+
+    Args:
+        structure_filepaths (list): list of paths to the PDB files to assess.
+        output_file (str): path to output file, if saving results.
+        workers (int): number of processes assessing files in parallel.
+        batch_size (int): number of rows written at a time.
+        resume (bool): keep the rows of an existing output file and skip their PDB files.
+    Returns:
+        the rows assessed in this run.
+    """
+    structure_filepaths = list(structure_filepaths)
+
+    write_header = True
+    if resume and output_file is not None and os.path.exists(output_file):
+        assessed = read_assessed_protids(output_file)
+        structure_filepaths = [
+            path
+            for path in structure_filepaths
+            if os.path.basename(path).split(".pdb")[0] not in assessed
+        ]
+        write_header = False
+        print(f"Resuming: {len(assessed)} PDB files already assessed.")
+
+    total = len(structure_filepaths)
+    rows = []
+    batch = []
+    start_time = time.time()
+
+    def flush(done):
+        nonlocal write_header
+        if output_file is not None:
+            with open(output_file, "w" if write_header else "a") as f:
+                pd.DataFrame(batch, columns=ASSESSMENT_COLUMNS).to_csv(
+                    f, sep="\t", index=None, header=write_header
+                )
+            write_header = False
+        rows.extend(batch)
+        batch.clear()
+
+        elapsed = time.time() - start_time
+        rate = done / elapsed if elapsed > 0 else 0.0
+        print(f"Assessed {done}/{total} PDB files ({rate:.1f} files/s)", file=sys.stderr)
+
+    if workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        chunksize = max(1, min(64, total // (workers * 4)))
+        results = executor.map(assess_structure, structure_filepaths, chunksize=chunksize)
+    else:
+        executor = None
+        results = map(assess_structure, structure_filepaths)
+
+    try:
+        for done, row in enumerate(results, start=1):
+            if row is not None:
+                batch.append(row)
+            if len(batch) >= batch_size:
+                flush(done)
+        flush(total)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    return pd.DataFrame(rows, columns=ASSESSMENT_COLUMNS)
 
 
 def main():
     args = parse_args()
-    structure_filepaths = Path(args.input).glob("*.pdb")
-    assess_pdbs(structure_filepaths, output_file=args.output)
+    structure_filepaths = sorted(Path(args.input).glob("*.pdb"))
+    assess_pdbs(
+        structure_filepaths,
+        output_file=args.output,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        resume=args.resume,
+    )
 
 
 if __name__ == "__main__":
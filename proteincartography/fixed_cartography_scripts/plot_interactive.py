@@ -3,6 +3,7 @@ import argparse
 import textwrap
 from typing import Optional, Union
 import hashlib
+import json
 
 import arcadia_pycolor as apc
 import numpy as np
@@ -27,11 +28,35 @@ from color_utils import (
 __all__ = [
     "apply_coordinates",
     "assign_taxon",
+    "assign_taxa",
     "rescale_list",
     "generate_plotting_rules",
+    "generate_large_data_figure",
     "plot_interactive",
+    "plot_static",
+    "export_static_pages",
 ]
 
+# number of proteins above which plot_interactive plots a single WebGL trace by default
+LARGE_DATA_THRESHOLD = 20000
+
+# rebuilds the customdata of the data trace from the columnar hover payload
+# when a large-data HTML file is opened (see write_large_data_html)
+HOVER_PAYLOAD_SCRIPT = """
+var gd = document.getElementById('{plot_id}');
+var payload = __HOVER_PAYLOAD__;
+var n = payload.length ? payload[0].codes.length : 0;
+var rows = new Array(n);
+for (var i = 0; i < n; i++) {
+    var row = new Array(payload.length);
+    for (var j = 0; j < payload.length; j++) {
+        row[j] = payload[j].values[payload[j].codes[i]];
+    }
+    rows[i] = row;
+}
+Plotly.restyle(gd, {customdata: [rows]}, [0]);
+"""
+
 COLORBAR_DEFAULT_DICT = {
     "x": 0.5,
     "y": 0,
@@ -82,6 +107,16 @@ def parse_args():
     )
     parser.add_argument("-X", "--plot-width", default="700", help="width of resulting plot.")
     parser.add_argument("-Y", "--plot-height", default="750", help="width of resulting plot.")
+    parser.add_argument(
+        "-L",
+        "--large-data",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help=(
+            "Plot all proteins as a single WebGL trace recolored by the dropdown.\n"
+            f"Used by default above {LARGE_DATA_THRESHOLD} proteins."
+        ),
+    )
     args = parser.parse_args()
 
     return args
@@ -213,6 +248,30 @@ def assign_taxon(taxon_list: list, rank_list: list, hierarchical=False, sep=",")
         return sep.join(output)
 
 
+def assign_taxa(taxa: pd.Series, rank_list: list, hierarchical=False, sep=","):
+    """
+    Applies assign_taxon to every element of a series of taxon lists,
+    computing each distinct taxon list once.
+
+    Args:
+        taxa (pd.Series): series of taxon lists.
+        rank_list (list): ranked list to search through.
+        hierarchical (bool): whether to return the first element found in the rank_list
+            or a concatentation of all hits.
+        sep (str): separator character when returning a concatenation of hits.
+    """
+    rank_list = list(rank_list)
+    cache = {}
+
+    def assign(taxon_list):
+        key = tuple(taxon_list)
+        if key not in cache:
+            cache[key] = assign_taxon(key, rank_list, hierarchical=hierarchical, sep=sep)
+        return cache[key]
+
+    return taxa.map(assign)
+
+
 def hash_color(value):
     # hash → 6-digit hex color
     h = hashlib.md5(value.encode()).hexdigest()
@@ -379,13 +438,34 @@ def generate_plotting_rules(
     if wordwrap:
         for rule in plotting_rules:
             if rule in ["Protein names", "Gene Names (primary)", "Organism"]:
-                plotting_rules[rule]["apply"] = (
-                    lambda x: "</br>".join(textwrap.wrap(x, width=40)),
+                plotting_rules[rule]["apply"] = lambda x: "</br>".join(
+                    textwrap.wrap(x, width=40)
                 )
 
     return plotting_rules
 
 
+def apply_unique(values: pd.Series, func) -> pd.Series:
+    """
+    Applies a function to every element of a series, calling it once per distinct value.
+
+    Args:
+        values (pd.Series): series to transform.
+        func (function): function applied to each element.
+    """
+    try:
+        codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    except TypeError:
+        # unhashable elements (e.g. lists) are transformed one by one
+        return values.apply(func)
+
+    results = np.empty(len(uniques), dtype=object)
+    for i, value in enumerate(uniques):
+        results[i] = func(value)
+
+    return pd.Series(results[codes], index=values.index, name=values.name).infer_objects()
+
+
 def preprocess_dataframe(
     plotting_rules: dict,
     df: pd.DataFrame,
@@ -393,6 +473,7 @@ def preprocess_dataframe(
     """
     Preprocesses a dataframe based on the plotting rules.
     Fills NAs and applies functions as needed.
+    Functions are applied once per distinct value of a column (see apply_unique).
 
     Args:
         plotting_rules (dict): plotting rules dictionary.
@@ -408,7 +489,7 @@ def preprocess_dataframe(
 
         # if the plotting rule 'apply' is present, applies that function
         if "apply" in plotting_rules[col].keys():
-            df[col] = df[col].apply(plotting_rules[col]["apply"])
+            df[col] = apply_unique(df[col], plotting_rules[col]["apply"])
 
 
 def generate_hovertemplate(
@@ -458,17 +539,20 @@ def generate_hovertemplate(
     return hovertemplate
 
 
-def generate_scatterplot(
-    plotting_rule: dict,
-    col: str,
-    df: pd.DataFrame,
-    custom_data: list,
-    dim1: str,
-    dim2: str,
-):
-    category_orders = None  # <- define it at the top
+def categorical_colors(plotting_rule: dict, col: str, df: pd.DataFrame):
+    """
+    Determines the category order and colors of a categorical or taxonomic plotting rule.
+    For taxonomic rules, adds a '<col>_taxonomic' column with the assigned taxon to df.
+
+    Args:
+        plotting_rule (dict): plotting rule of the column.
+        col (str): column to color by.
+        df (pd.DataFrame): dataframe to plot.
+    Returns:
+        the column holding the categories, the ordered categories, and the
+        category -> color dictionary (None to use the default Plotly colors).
+    """
     colors_dict = None
-    color_scale = None
 
     if plotting_rule["type"] == "categorical":
         color_keys = np.sort(df[col].unique())
@@ -495,15 +579,6 @@ def generate_scatterplot(
                 color_order = apc.extend_colors(color_order, len(color_keys))
             colors_dict = dict(zip(color_keys, color_order))
 
-        # set category_orders for categorical plots
-        category_orders = {col: color_keys}
-        color_scale = None
-
-    elif plotting_rule["type"] == "continuous":
-        color_scale = plotting_rule.get("color_scale", "viridis")
-        colors_dict = None
-        category_orders = None
-
     elif plotting_rule["type"] == "taxonomic":
         taxon_order = plotting_rule.get("taxon_order")
         if taxon_order is None:
@@ -522,12 +597,94 @@ def generate_scatterplot(
             colors_dict["Other"] = apc.All["arcadia:brightgrey"]
 
         col_taxonomic = col + "_taxonomic"
-        df[col_taxonomic] = df[col].apply(
-            lambda x, taxon_order=taxon_order: assign_taxon(x, taxon_order, hierarchical=True)
-        )
+        df[col_taxonomic] = assign_taxa(df[col], taxon_order, hierarchical=True)
         col = col_taxonomic
+
+    else:
+        raise Exception(f'{col} is not a categorical or taxonomic plotting rule.')
+
+    return col, color_keys, colors_dict
+
+
+def continuous_color_scale(plotting_rule: dict, col: str, df: pd.DataFrame):
+    """
+    Determines the color scale and range of a continuous plotting rule.
+
+    If the 'fillna' value lies below cmin, the scale is extended down to it
+    with the 'na_color' (bright grey by default), so missing values stand out.
+
+    Args:
+        plotting_rule (dict): plotting rule of the column.
+        col (str): column to color by.
+        df (pd.DataFrame): dataframe to plot.
+    Returns:
+        the color scale, cmin and cmax.
+    """
+    # rescale the colorbar to user-defined values if needed
+    # this is needed when (e.g. for pLDDT scores) the maximum value computed
+    # is not the maximum value possible
+    if "cmax" in plotting_rule:
+        cmax = plotting_rule["cmax"]
+    else:
+        cmax = df[col].max()
+
+    if "cmin" in plotting_rule:
+        cmin = plotting_rule["cmin"]
+    else:
+        cmin = df[col].min()
+
+    if "color_scale" in plotting_rule:
+        new_color_scale = plotting_rule["color_scale"]
+    else:
+        new_color_scale = "viridis"
+
+    if "fillna" in plotting_rule and plotting_rule["fillna"] < cmin:
+        fillna_value = plotting_rule["fillna"]
+        fillna_fraction = -1 * (cmin - fillna_value) / (cmax - fillna_value)
+
+        input_values = [fillna_fraction] + [i[0] for i in new_color_scale]
+        original_colors = [i[1] for i in new_color_scale]
+        new_values = rescale_list(input_values, 0, 1)
+        new_values_discretized = new_values[0:2] + new_values[1:]
+
+        if "na_color" in plotting_rule:
+            na_color = plotting_rule["na_color"]
+        else:
+            na_color = apc.All["arcadia:brightgrey"]
+
+        new_colors = [na_color] * 2 + original_colors
+
+        new_color_scale_collector = [
+            [new_values_discretized[i], new_colors[i]]
+            for i in np.arange(len(new_values_discretized))
+        ]
+        new_color_scale = new_color_scale_collector
+
+        cmin = plotting_rule["fillna"]
+
+    return new_color_scale, cmin, cmax
+
+
+def generate_scatterplot(
+    plotting_rule: dict,
+    col: str,
+    df: pd.DataFrame,
+    custom_data: list,
+    dim1: str,
+    dim2: str,
+):
+    category_orders = None  # <- define it at the top
+    colors_dict = None
+    color_scale = None
+
+    if plotting_rule["type"] in ["categorical", "taxonomic"]:
+        col, color_keys, colors_dict = categorical_colors(plotting_rule, col, df)
+
+        # set category_orders for categorical plots
         category_orders = {col: color_keys}
-        color_scale = None
+
+    elif plotting_rule["type"] == "continuous":
+        color_scale = plotting_rule.get("color_scale", "viridis")
 
     plot = px.scatter(
         df,
@@ -611,47 +768,7 @@ def regenerate_scatterplot(
             # TODO: There may be another way to solve this,
             # but this is the solution that works for now.
             if plotting_rules[col]["type"] == "continuous":
-                # rescale the colorbar to user-defined values if needed
-                # this is needed when (e.g. for pLDDT scores) the maximum value computed
-                # is not the maximum value possible
-                if "cmax" in plotting_rules[col]:
-                    cmax = plotting_rules[col]["cmax"]
-                else:
-                    cmax = df[col].max()
-
-                if "cmin" in plotting_rules[col]:
-                    cmin = plotting_rules[col]["cmin"]
-                else:
-                    cmin = df[col].min()
-
-                if "color_scale" in plotting_rules[col]:
-                    new_color_scale = plotting_rules[col]["color_scale"]
-                else:
-                    new_color_scale = "viridis"
-
-                if "fillna" in plotting_rules[col] and plotting_rules[col]["fillna"] < cmin:
-                    fillna_value = plotting_rules[col]["fillna"]
-                    fillna_fraction = -1 * (cmin - fillna_value) / (cmax - fillna_value)
-
-                    input_values = [fillna_fraction] + [i[0] for i in new_color_scale]
-                    original_colors = [i[1] for i in new_color_scale]
-                    new_values = rescale_list(input_values, 0, 1)
-                    new_values_discretized = new_values[0:2] + new_values[1:]
-
-                    if "na_color" in plotting_rules[col]:
-                        na_color = plotting_rules[col]["na_color"]
-                    else:
-                        na_color = apc.All["arcadia:brightgrey"]
-
-                    new_colors = [na_color] * 2 + original_colors
-
-                    new_color_scale_collector = [
-                        [new_values_discretized[i], new_colors[i]]
-                        for i in np.arange(len(new_values_discretized))
-                    ]
-                    new_color_scale = new_color_scale_collector
-
-                    cmin = plotting_rules[col]["fillna"]
+                new_color_scale, cmin, cmax = continuous_color_scale(plotting_rules[col], col, df)
 
                 fig.add_trace(
                     obj_method(
@@ -723,6 +840,249 @@ def generate_dropdown(scatter_counter, plotting_rules, plots):
     return dropdown_menu
 
 
+def category_codes(values: pd.Series, color_keys) -> tuple:
+    """
+    Encodes the categories of every point as integer codes.
+
+    Args:
+        values (pd.Series): category of every point.
+        color_keys (list): ordered categories of the plotting rule.
+    Returns:
+        the codes (np.ndarray) and the categories present in values, in color_keys order
+        (followed by any category missing from color_keys, e.g. 'Other' taxa).
+    """
+    present = set(values.unique())
+    categories = [key for key in color_keys if key in present]
+    categories += sorted(present - set(categories), key=str)
+
+    codes = pd.Categorical(values, categories=categories).codes
+
+    return codes.astype(np.min_scalar_type(max(len(categories) - 1, 0))), categories
+
+
+def stepped_color_scale(colors: list) -> list:
+    """
+    Builds a color scale giving integer code i the color colors[i],
+    for a color range of -0.5 to len(colors) - 0.5.
+
+    Args:
+        colors (list): color of every category code.
+    """
+    n = len(colors)
+    color_scale = []
+    for i, color in enumerate(colors):
+        color_scale.append([i / n, color])
+        color_scale.append([(i + 1) / n, color])
+
+    return color_scale
+
+
+def generate_large_data_figure(
+    plotting_rules: dict,
+    df: pd.DataFrame,
+    custom_data: list,
+    hovertemplate: str,
+    dim1: str,
+    dim2: str,
+    marker_opacity: float = 0.8,
+    marker_size: int = 4,
+):
+    """
+    Plots all proteins as a single WebGL trace, for datasets too large for one SVG trace
+    per category of every plotting rule.
+
+    Every plotting rule is turned into a per-point color array (category codes on a stepped
+    color scale for categorical and taxonomic rules, values with a color scale for
+    continuous rules), and the dropdown restyles the one trace with the selected array.
+    The hover data is stored once, on the data trace, and only the color arrays are
+    repeated per color mode.
+    Categorical rules with at most 50 categories get a legend made of empty traces.
+
+    Args:
+        plotting_rules (dict): full plotting rules dictionary.
+        df (pd.DataFrame): preprocessed dataframe to plot.
+        custom_data (list): columns passed as custom data for the hovertemplate.
+        hovertemplate (str): hovertemplate of the points.
+        dim1 (str): column of the x coordinates.
+        dim2 (str): column of the y coordinates.
+        marker_opacity (float): opacity of markers.
+        marker_size (int): size of markers.
+    Returns:
+        the figure and its dropdown menu.
+    """
+    # marker settings of the data trace and legend entries for every plotted rule
+    color_modes = {}
+
+    for col in plotting_rules.keys():
+        if col not in df.columns or plotting_rules[col]["type"] == "hovertext":
+            continue
+
+        plotting_rule = plotting_rules[col]
+
+        if plotting_rule["type"] == "continuous":
+            color_scale, cmin, cmax = continuous_color_scale(plotting_rule, col, df)
+            color_modes[col] = {
+                "marker": {
+                    "color": df[col].to_numpy(),
+                    "colorscale": color_scale,
+                    "cmin": cmin,
+                    "cmax": cmax,
+                    "showscale": True,
+                    "colorbar": dict(COLORBAR_DEFAULT_DICT, title=col),
+                },
+                "legend": [],
+            }
+        else:
+            color_col, color_keys, colors_dict = categorical_colors(plotting_rule, col, df)
+            if colors_dict is None:
+                default_colors = px.colors.qualitative.Plotly
+                colors_dict = {
+                    key: default_colors[i % len(default_colors)] for i, key in enumerate(color_keys)
+                }
+
+            codes, categories = category_codes(df[color_col], color_keys)
+            colors = [colors_dict.get(key, apc.All["arcadia:brightgrey"]) for key in categories]
+
+            color_modes[col] = {
+                "marker": {
+                    "color": codes,
+                    "colorscale": stepped_color_scale(colors),
+                    "cmin": -0.5,
+                    "cmax": len(categories) - 0.5,
+                    "showscale": False,
+                    "colorbar": None,
+                },
+                # if there are more than 50 different categories, hide the legend
+                # this keeps the plot's aspect ratio from changing too much
+                "legend": list(zip(categories, colors)) if len(categories) <= 50 else [],
+            }
+
+    cols = list(color_modes.keys())
+    first = color_modes[cols[0]]
+
+    fig = go.Figure()
+    fig.add_trace(
+        go.Scattergl(
+            x=df[dim1],
+            y=df[dim2],
+            mode="markers",
+            customdata=df[custom_data].values,
+            hovertemplate=hovertemplate,
+            marker=dict(first["marker"], opacity=marker_opacity, size=marker_size),
+            showlegend=False,
+            name="",
+        )
+    )
+
+    # legend-only traces (no points), toggled with the color mode they belong to
+    legend_owner = []
+    for col in cols:
+        for key, color in color_modes[col]["legend"]:
+            fig.add_trace(
+                go.Scattergl(
+                    x=[None],
+                    y=[None],
+                    mode="markers",
+                    marker=dict(color=color, size=8),
+                    name=str(key),
+                    legendgroup=col,
+                    showlegend=True,
+                    visible=col == cols[0],
+                    hoverinfo="skip",
+                )
+            )
+            legend_owner.append(col)
+
+    legend_colors = [fig.data[i + 1].marker.color for i in range(len(legend_owner))]
+    trace_indices = list(range(1 + len(legend_owner)))
+
+    buttons = []
+    for col in cols:
+        marker = color_modes[col]["marker"]
+        n_legend = len(legend_owner)
+
+        # restyle the data trace; legend traces keep their color and follow the selection
+        trace_update = {
+            "visible": [True] + [owner == col for owner in legend_owner],
+            "marker.color": [marker["color"].tolist()] + legend_colors,
+            "marker.colorscale": [marker["colorscale"]] + [None] * n_legend,
+            "marker.cmin": [marker["cmin"]] + [None] * n_legend,
+            "marker.cmax": [marker["cmax"]] + [None] * n_legend,
+            "marker.showscale": [marker["showscale"]] + [False] * n_legend,
+            "marker.colorbar": [marker["colorbar"]] + [None] * n_legend,
+        }
+
+        buttons.append(
+            dict(
+                args=[trace_update, {}, trace_indices],
+                label=plotting_rules[col].get("textlabel", col),
+                method="update",
+            )
+        )
+
+    dropdown_menu = dict(
+        buttons=buttons,
+        showactive=True,
+        x=0.08,
+        xanchor="left",
+        y=1.02,
+        yanchor="bottom",
+        font_size=14,
+        bgcolor="white",
+    )
+
+    return fig, dropdown_menu
+
+
+def hover_payload(df: pd.DataFrame, custom_data: list) -> list:
+    """
+    Encodes the custom data columns as distinct values plus one code per point,
+    so every distinct hover string is stored once.
+
+    Args:
+        df (pd.DataFrame): preprocessed dataframe.
+        custom_data (list): columns passed as custom data for the hovertemplate.
+    Returns:
+        a list with a {"values": [...], "codes": [...]} dictionary per column.
+    """
+    payload = []
+    for col in custom_data:
+        values = df[col]
+        try:
+            codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        except TypeError:
+            # unhashable cells (e.g. lists) are shown as strings
+            codes, uniques = pd.factorize(values.astype(str), use_na_sentinel=False)
+
+        payload.append({"values": list(uniques), "codes": codes.tolist()})
+
+    return payload
+
+
+def write_large_data_html(fig, output_file: str, df: pd.DataFrame, custom_data: list):
+    """
+    Writes a large-data figure (see generate_large_data_figure) to HTML with its hover data
+    stored once as a columnar payload, from which the customdata of the data trace is
+    rebuilt in the browser.
+
+    Args:
+        fig: figure returned by generate_large_data_figure.
+        output_file (str): path of destination HTML file.
+        df (pd.DataFrame): preprocessed dataframe.
+        custom_data (list): columns passed as custom data for the hovertemplate.
+    """
+    payload = json.dumps(hover_payload(df, custom_data), default=str)
+    post_script = HOVER_PAYLOAD_SCRIPT.replace("__HOVER_PAYLOAD__", payload)
+
+    data_trace = fig.data[0]
+    customdata = data_trace.customdata
+    data_trace.customdata = None
+    try:
+        fig.write_html(output_file, post_script=post_script)
+    finally:
+        data_trace.customdata = customdata
+
+
 def plot_interactive(
     coordinates_file: str,
     plotting_rules: dict,
@@ -736,6 +1096,7 @@ def plot_interactive(
     plot_bgcolor=apc.All["arcadia:paper"],
     paper_bgcolor="rgba(0,0,0,0)",
     hide_hover: bool = False,
+    large_data: Optional[bool] = None,
 ):
     """
     Plots all proteins on a 2D interactive Plotly plot using a set of rules.
@@ -807,6 +1168,9 @@ def plot_interactive(
         keyids (list): list of key protids to assign a star-shaped marker. Usually input proteins.
         show (bool): whether or not to show the plot.
         hide_hover (bool): whether to override the hover text and just show the protid.
+        large_data (bool): whether to plot all proteins as a single WebGL trace recolored by
+            the dropdown (see generate_large_data_figure) instead of one trace per category.
+            If not provided, used for more than LARGE_DATA_THRESHOLD proteins.
     Returns:
         if show = False, returns the plotly.graphobjects object of the plot.
     """
@@ -821,7 +1185,10 @@ def plot_interactive(
     preprocess_dataframe(plotting_rules, df)
 
     valid_plotting_rules = [col for col in plotting_rules.keys() if col in df.columns]
-    custom_data = ["protid"] + list(valid_plotting_rules)
+    # only columns shown in the hover text are passed as custom data
+    custom_data = ["protid"] + [
+        col for col in valid_plotting_rules if "skip_hover" not in plotting_rules[col].keys()
+    ]
 
     # generates a full hovertemplate string from hovertemplate_generator list
     hovertemplate = generate_hovertemplate(plotting_rules, df, custom_data)
@@ -830,70 +1197,85 @@ def plot_interactive(
     if hide_hover:
         hovertemplate = "<b>%{customdata[0]}</b>"
 
-    # Collector dictionary for making plots
-    plots = {}
-
-    # Iterate through the plotting rules for each plotted datatype
-    # We make each plot for each datatype individually;
-    # Then, we transfer the points from the existing plots to a new, single plot
-    # This way we can get the toggle system working
-    for col in plotting_rules.keys():
-        # ignore invalid rules
-        if col not in df.columns:
-            continue
-
-        plotting_rule = plotting_rules[col]
-        if plotting_rule["type"] == "hovertext":
-            continue
+    if large_data is None:
+        large_data = len(df) > LARGE_DATA_THRESHOLD
 
-        # Generate a plot based on rules
-        plots[col] = generate_scatterplot(
-            plotting_rules[col],
-            col,
+    if large_data:
+        fig, dropdown_menu = generate_large_data_figure(
+            plotting_rules,
             df,
             custom_data,
+            hovertemplate,
             dim1,
             dim2,
+            marker_opacity=marker_opacity,
+            marker_size=marker_size,
         )
-        # Update the plot with the hovertemplate
-        plots[col].update_traces(
-            marker=dict(size=marker_size, opacity=marker_opacity),
-            hovertemplate=hovertemplate,
-        )
-
-    # keep track of how many traces there are per plot
-    # for example, a categorical trace would have one trace per category
-    # whereas a continuous trace would have one trace total
-    # this is used to toggle visibility of traces using a dropdown later
-    scatter_counter = {}
+    else:
+        # Collector dictionary for making plots
+        plots = {}
+
+        # Iterate through the plotting rules for each plotted datatype
+        # We make each plot for each datatype individually;
+        # Then, we transfer the points from the existing plots to a new, single plot
+        # This way we can get the toggle system working
+        for col in plotting_rules.keys():
+            # ignore invalid rules
+            if col not in df.columns:
+                continue
+
+            plotting_rule = plotting_rules[col]
+            if plotting_rule["type"] == "hovertext":
+                continue
+
+            # Generate a plot based on rules
+            plots[col] = generate_scatterplot(
+                plotting_rules[col],
+                col,
+                df,
+                custom_data,
+                dim1,
+                dim2,
+            )
+            # Update the plot with the hovertemplate
+            plots[col].update_traces(
+                marker=dict(size=marker_size, opacity=marker_opacity),
+                hovertemplate=hovertemplate,
+            )
 
-    # iterate through the plots to get their objects
-    for col, plot in plots.items():
-        # counts the number of different scatter traces within the original plot
-        # this is needed to determine the number of true or false values
-        # for the dropdown toggle visibility field
-        scatter_counter[col] = len(plot.data)
-
-    # create new empty figure to move every original figure onto
-    # this is a workaround to allow colored legends to be preserved
-    # and automatically switched using the dropdown
-    # the alternative approach forces you to show all legend items at the same time
-    # for all colorations, which is messy
-    fig = regenerate_scatterplot(
-        plots,
-        plotting_rules,
-        df,
-        scatter_counter,
-        marker_opacity=marker_opacity,
-        marker_size=marker_size,
-    )
+        # keep track of how many traces there are per plot
+        # for example, a categorical trace would have one trace per category
+        # whereas a continuous trace would have one trace total
+        # this is used to toggle visibility of traces using a dropdown later
+        scatter_counter = {}
+
+        # iterate through the plots to get their objects
+        for col, plot in plots.items():
+            # counts the number of different scatter traces within the original plot
+            # this is needed to determine the number of true or false values
+            # for the dropdown toggle visibility field
+            scatter_counter[col] = len(plot.data)
+
+        # create new empty figure to move every original figure onto
+        # this is a workaround to allow colored legends to be preserved
+        # and automatically switched using the dropdown
+        # the alternative approach forces you to show all legend items at the same time
+        # for all colorations, which is messy
+        fig = regenerate_scatterplot(
+            plots,
+            plotting_rules,
+            df,
+            scatter_counter,
+            marker_opacity=marker_opacity,
+            marker_size=marker_size,
+        )
 
-    # generate the dropdown menu with dynamic toggle visibility per trace for each plotting rule
-    dropdown_menu = generate_dropdown(
-        scatter_counter,
-        plotting_rules,
-        plots,
-    )
+        # generate the dropdown menu with dynamic toggle visibility per trace for each plotting rule
+        dropdown_menu = generate_dropdown(
+            scatter_counter,
+            plotting_rules,
+            plots,
+        )
 
     # if there are any keyids provided, generate an additional plot and add a toggle button
     if keyids is not None:
@@ -1033,7 +1415,10 @@ def plot_interactive(
         pass
 
     if output_file is not None:
-        fig.write_html(output_file)
+        if large_data:
+            write_large_data_html(fig, output_file, df, custom_data)
+        else:
+            fig.write_html(output_file)
         print(f"[plot_interactive] Saved interactive plot → {output_file}")
         export_static_pdf(fig, output_file)  # optional PDF
     if show:
@@ -1057,6 +1442,182 @@ def export_static_pdf(fig, output_file):
         print("  → Install kaleido: pip install -U kaleido")
         print("  Error:", e)
 
+def to_mpl_color(color):
+    """
+    Converts a Plotly color ("#RRGGBB", "rgb(r, g, b)" or "rgba(r, g, b, a)") to a Matplotlib color.
+    """
+    if isinstance(color, str) and color.startswith("rgb"):
+        values = [float(v) for v in color[color.index("(") + 1 : color.index(")")].split(",")]
+        return tuple([v / 255 for v in values[:3]] + values[3:])
+    return color
+
+
+def static_color_map(color_scale):
+    """
+    Converts a Plotly color scale (list of [position, color] pairs or a named scale)
+    to a Matplotlib colormap.
+    """
+    from matplotlib.colors import LinearSegmentedColormap
+
+    if isinstance(color_scale, str):
+        import matplotlib
+
+        return matplotlib.colormaps[color_scale]
+
+    return LinearSegmentedColormap.from_list(
+        "plotting_rule", [(float(pos), to_mpl_color(color)) for pos, color in color_scale]
+    )
+
+
+def plot_static(
+    ax,
+    plotting_rules: dict,
+    col: str,
+    df: pd.DataFrame,
+    dim1: str,
+    dim2: str,
+    marker_size: int = 4,
+    marker_opacity: float = 0.8,
+):
+    """
+    Draws one color mode of the cartography plot on a Matplotlib axis,
+    with the colors of the interactive plot.
+
+    Args:
+        ax: Matplotlib axis.
+        plotting_rules (dict): full plotting rules dictionary.
+        col (str): plotting rule to color by.
+        df (pd.DataFrame): preprocessed dataframe.
+        dim1 (str): column of the x coordinates.
+        dim2 (str): column of the y coordinates.
+        marker_size (int): marker diameter in points, as in the interactive plot.
+        marker_opacity (float): opacity of markers.
+    """
+    plotting_rule = plotting_rules[col]
+    label = plotting_rule.get("textlabel", col)
+    scatter_kwargs = dict(s=marker_size**2, alpha=marker_opacity, linewidths=0, rasterized=True)
+
+    if plotting_rule["type"] == "continuous":
+        color_scale, cmin, cmax = continuous_color_scale(plotting_rule, col, df)
+        points = ax.scatter(
+            df[dim1],
+            df[dim2],
+            c=df[col],
+            cmap=static_color_map(color_scale),
+            vmin=cmin,
+            vmax=cmax,
+            **scatter_kwargs,
+        )
+        ax.figure.colorbar(points, ax=ax, orientation="horizontal", shrink=0.7, pad=0.02, label=col)
+    else:
+        color_col, color_keys, colors_dict = categorical_colors(plotting_rule, col, df)
+        if colors_dict is None:
+            default_colors = px.colors.qualitative.Plotly
+            colors_dict = {
+                key: default_colors[i % len(default_colors)] for i, key in enumerate(color_keys)
+            }
+
+        codes, categories = category_codes(df[color_col], color_keys)
+        colors = [
+            to_mpl_color(colors_dict.get(key, apc.All["arcadia:brightgrey"])) for key in categories
+        ]
+        ax.scatter(df[dim1], df[dim2], c=[colors[code] for code in codes], **scatter_kwargs)
+
+        # if there are more than 50 different categories, hide the legend
+        if len(categories) <= 50:
+            from matplotlib.lines import Line2D
+
+            handles = [
+                Line2D([], [], marker="o", linestyle="", color=color, label=str(key))
+                for key, color in zip(categories, colors)
+            ]
+            ax.legend(
+                handles=handles,
+                loc="upper left",
+                bbox_to_anchor=(0, -0.02),
+                ncol=4,
+                frameon=False,
+                fontsize=8,
+            )
+
+    ax.set_title(label, loc="left", fontsize=12)
+
+
+def export_static_pages(
+    coordinates_file: str,
+    plotting_rules: dict,
+    output_file: str,
+    color_modes: Optional[list] = None,
+    keyids: Optional[list] = None,
+    marker_size: int = 4,
+    marker_opacity: float = 0.8,
+    plot_bgcolor=apc.All["arcadia:paper"],
+):
+    """
+    Exports every color mode of a cartography plot as one page of a PDF, using Matplotlib
+    instead of rendering each Plotly figure through a browser engine.
+    The dataframe is read and preprocessed once for all pages.
+
+    Args:
+        coordinates_file (str): path to coordinates file (see plot_interactive).
+        plotting_rules (dict): full plotting rules dictionary.
+        output_file (str): path of destination PDF file.
+        color_modes (list): plotting rules to export, in page order.
+            Defaults to every plotted rule, in dropdown order.
+        keyids (list): list of key protids to mark with a star.
+        marker_size (int): size of markers.
+        marker_opacity (float): opacity of markers.
+        plot_bgcolor: background color of the plotting area.
+    Returns:
+        the number of pages written.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    df = pd.read_csv(coordinates_file, sep="\t")
+    dim1 = df.columns[1]
+    dim2 = df.columns[2]
+    preprocess_dataframe(plotting_rules, df)
+
+    if color_modes is None:
+        color_modes = [
+            col
+            for col in plotting_rules.keys()
+            if col in df.columns and plotting_rules[col]["type"] != "hovertext"
+        ]
+
+    # fix the scale of the x and y axes across pages
+    xmin, xmax = df[dim1].min(), df[dim1].max()
+    ymin, ymax = df[dim2].min(), df[dim2].max()
+    xwiggle = 0.07 * (xmax - xmin)
+    ywiggle = 0.07 * (ymax - ymin)
+
+    with PdfPages(output_file) as pdf:
+        for col in color_modes:
+            fig, ax = plt.subplots(figsize=(7, 7.5))
+            plot_static(ax, plotting_rules, col, df, dim1, dim2, marker_size, marker_opacity)
+
+            if keyids is not None:
+                keypoints = df[df["protid"].isin(keyids)]
+                ax.scatter(keypoints[dim1], keypoints[dim2], marker="*", s=144, c="black", alpha=0.9)
+
+            ax.set_xlim(xmin - xwiggle, xmax + xwiggle)
+            ax.set_ylim(ymin - ywiggle, ymax + ywiggle)
+            ax.set_xticks([])
+            ax.set_yticks([])
+            ax.set_facecolor(to_mpl_color(plot_bgcolor))
+            for spine in ax.spines.values():
+                spine.set_edgecolor("#EAEAEA")
+
+            pdf.savefig(fig, bbox_inches="tight")
+            plt.close(fig)
+
+    return len(color_modes)
+
+
 # run this if called from the interpreter
 def main():
     args = parse_args()
@@ -1089,6 +1650,7 @@ def main():
         keyids=keyids,
         plot_width=plot_width,
         plot_height=plot_height,
+        large_data=args.large_data,
     )
 
 
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Secondary structure (DSSP) of the protein residues near the ligand, per structure and per
+LeidenCluster, for any number of lipid classes (all eight by default).
+
+The structures of all requested classes are analyzed in one process pool, each PDB file
+once even if several classes share it. DSSP assignments are cached on disk by PDB content
+hash (lipid_analysis/dssp_cache.py), so later runs with another cutoff or metadata file
+do not run DSSP again.
+
+For every lipid class, writes to secondarystructure/<class>s/:
+- ss_per_structure.csv
+- ss_by_LeidenCluster.csv (plotted by plot_ss_LC.py)
+
+Usage:
+    python3 secondarystructure.py                      # all lipid classes
+    python3 secondarystructure.py -c sterol -r /PATH/plip
+    python3 secondarystructure.py --cutoff 4.0 --residue-atoms all
+"""
+
+import argparse
+import os
+import sys
+import numpy as np
+import pandas as pd
+from collections import defaultdict
+from pathlib import Path
+from scipy.spatial import cKDTree
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from lipid_analysis.lipid_classes import (
+    CARTOGRAPHY_ROOT,
+    LIPID_CLASSES,
+    cartography_tsv,
+    plip_class_root,
+)
+from lipid_analysis.dssp_cache import DSSP_CACHE, secondary_structure
+from lipid_analysis.parallel import default_workers, parallel_map
+from lipid_analysis.pdb_atoms import (
+    ligand_mask,
+    protein_mask,
+    read_pdb_atoms,
+    residue_keys,
+    select_altlocs,
+)
+from lipid_analysis.protids import ProtidResolver, normalize_pdb_name
+
+# ============================================================
+# USER SETTINGS
+# ============================================================
+PDB_ROOT = "/Volumes/GigiMurin/plip"  # one folder of PLIP runs (with PDB files) per lipid class
+DIST_CUTOFF = 5.0  # Å
+RESIDUE_ATOMS = "ca"  # "ca": residue CA within cutoff; "all": any residue atom within cutoff
+
+OUTPUT_ROOT = str(Path(__file__).resolve().parent)  # <class>s/ folders
+OUTPUT_PER_STRUCT = "ss_per_structure.csv"
+OUTPUT_PER_LC = "ss_by_LeidenCluster.csv"
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-c",
+        "--classes",
+        nargs="+",
+        default=LIPID_CLASSES,
+        choices=LIPID_CLASSES,
+        help="Lipid classes to analyze. Defaults to all eight.",
+    )
+    parser.add_argument(
+        "-r",
+        "--pdb-root",
+        default=PDB_ROOT,
+        help="Directory holding one folder of PLIP runs (with PDB files) per lipid class.",
+    )
+    parser.add_argument(
+        "-m",
+        "--cartography-root",
+        default=CARTOGRAPHY_ROOT,
+        help="Directory holding the ProteinCartography results (protid -> LeidenCluster).",
+    )
+    parser.add_argument(
+        "-d",
+        "--cutoff",
+        type=float,
+        default=DIST_CUTOFF,
+        help="Distance (Å) from a ligand atom within which a residue counts as ligand-proximal.",
+    )
+    parser.add_argument(
+        "-a",
+        "--residue-atoms",
+        default=RESIDUE_ATOMS,
+        choices=["ca", "all"],
+        help="Residue atoms tested against the cutoff: the CA only, or all atoms "
+        "(backbone and side chain).",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-root",
+        default=OUTPUT_ROOT,
+        help="Directory holding the <class>s/ output folders.",
+    )
+    parser.add_argument(
+        "--dssp-cache",
+        default=DSSP_CACHE,
+        help="Directory of the DSSP cache.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Run DSSP on every structure without reading or writing the cache.",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=default_workers(),
+        help="Number of processes analyzing structures in parallel. Defaults to all cores.",
+    )
+    return parser.parse_args(argv)
+
+
+# ============================================================
+# LOAD METADATA
+# ============================================================
+def load_metadata(metadata_tsv):
+    """
+    Returns the protid -> LeidenCluster mapping of a ProteinCartography results file.
+    """
+    meta = pd.read_csv(metadata_tsv, sep="\t")
+    required_cols = {"protid", "LeidenCluster"}
+    missing = required_cols - set(meta.columns)
+    if missing:
+        raise ValueError(f"Missing required metadata columns: {missing}")
+
+    return dict(zip(meta["protid"], meta["LeidenCluster"]))
+
+
+def proximal_residues(atoms, ligand_coords, cutoff=DIST_CUTOFF, residue_atoms=RESIDUE_ATOMS):
+    """
+    Returns the protein residues with an atom within cutoff of any ligand atom.
+
+    The ligand atoms are indexed in a KD-tree once, and the residue atoms are queried
+    against it in a single vectorized call.
+
+    Args:
+        atoms (np.ndarray): atoms of the structure (lipid_analysis.pdb_atoms.read_pdb_atoms).
+        ligand_coords (np.ndarray): (n, 3) ligand atom coordinates.
+        cutoff (float): distance cutoff in Å.
+        residue_atoms (str): "ca" to test the CA of each residue, "all" for all its atoms.
+    Returns:
+        a set of (chain ID, residue number) tuples.
+    """
+    residues = atoms[protein_mask(atoms)]
+    if residue_atoms == "ca":
+        residues = residues[residues["name"] == "CA"]
+
+    if len(residues) == 0:
+        return set()
+
+    # nearest ligand atom of every residue atom; inf if none within cutoff
+    # (the bound is exclusive, so it is nudged up to keep atoms at exactly the cutoff)
+    dists, _ = cKDTree(ligand_coords).query(
+        residues["coord"], k=1, distance_upper_bound=np.nextafter(cutoff, np.inf)
+    )
+
+    return set(residue_keys(residues[dists <= cutoff]))
+
+
+def analyze_structure(protid, pdb_path, cutoff=DIST_CUTOFF, residue_atoms=RESIDUE_ATOMS,
+                      dssp_cache=DSSP_CACHE):
+    """
+    Counts helix, sheet and loop residues within cutoff of a ligand atom.
+
+    Returns:
+        a dictionary of counts, or None if the structure has no ligand or no nearby residues.
+    """
+    atoms = select_altlocs(read_pdb_atoms(pdb_path))
+
+    # ------------------------------------------------
+    # Collect ligand atom coordinates (any HETATM except water)
+    # ------------------------------------------------
+    ligand_atoms = atoms[ligand_mask(atoms)]
+
+    if len(ligand_atoms) == 0:
+        print(f"No ligands detected for {protid}, skipping...")
+        return None
+
+    ligand_coords = ligand_atoms["coord"]
+    print(f"Ligands found in {protid}: {set(ligand_atoms['resname'].tolist())}")
+
+    # ------------------------------------------------
+    # DSSP (secondary structure)
+    # ------------------------------------------------
+    residue_ss = secondary_structure(pdb_path, cache_dir=dssp_cache)
+
+    # ------------------------------------------------
+    # Find protein residues within cutoff
+    # ------------------------------------------------
+    ss_counts = defaultdict(set)
+    for key in proximal_residues(atoms, ligand_coords, cutoff, residue_atoms):
+        ss_counts[residue_ss.get(key, "-")].add(key)
+
+    helix = len(ss_counts.get("H", []))
+    sheet = len(ss_counts.get("E", []))
+    loop = sum(len(v) for k, v in ss_counts.items() if k not in ("H", "E"))
+    total = helix + sheet + loop
+
+    if total == 0:
+        print(f"No residues near ligand within cutoff for {protid}, skipping...")
+        return None
+
+    return {
+        "helix": helix,
+        "sheet": sheet,
+        "loop": loop,
+        "total": total,
+        "helix_pct": 100 * helix / total,
+        "sheet_pct": 100 * sheet / total,
+        "loop_pct": 100 * loop / total,
+    }
+
+
+def collect_structures(lipid_class, pdb_root, cartography_root):
+    """
+    Finds the PDB files of one lipid class and their metadata protids.
+
+    Returns:
+        (protid -> LeidenCluster mapping, list of (protid, PDB path) tuples),
+        or None if the class has no ProteinCartography results file.
+    """
+    root_dir = plip_class_root(lipid_class, pdb_root)
+
+    metadata_tsv = cartography_tsv(lipid_class, cartography_root)
+    if not os.path.exists(metadata_tsv):
+        print(f"WARNING: {lipid_class}: {metadata_tsv} not found, skipping.")
+        return None
+
+    print(f"Loading metadata for {lipid_class}...")
+    protid_to_lc = load_metadata(metadata_tsv)
+    resolver = ProtidResolver(protid_to_lc)
+
+    # ============================================================
+    # WALK PDB FILES
+    # ============================================================
+    structures = []
+    for root, _, files in os.walk(root_dir):
+        for file in files:
+            if not file.lower().endswith(".pdb"):
+                continue
+
+            protid = resolver.resolve(file)
+            if protid is None:
+                print("Skipping, protid not in metadata:", normalize_pdb_name(file))
+                continue
+            structures.append((protid, os.path.join(root, file)))
+
+    return protid_to_lc, structures
+
+
+def analyze_job(job):
+    """
+    Worker: analyzes one structure, reporting failures instead of raising.
+
+    Args:
+        job (tuple): (protid, PDB path, distance cutoff, residue atoms, DSSP cache or None).
+    """
+    protid, pdb_path, cutoff, residue_atoms, dssp_cache = job
+    print(f"Processing: {protid}")
+
+    try:
+        return analyze_structure(protid, pdb_path, cutoff, residue_atoms, dssp_cache)
+    except Exception as e:
+        print(f"FAILED: {protid} ({e})")
+        return None
+
+
+def write_class_tables(lipid_class, rows, output_root):
+    """
+    Writes the per-structure and per-LeidenCluster secondary structure tables of one lipid class.
+
+    Returns:
+        the number of structures written.
+    """
+    # ============================================================
+    # BUILD DATAFRAME AND SAVE
+    # ============================================================
+    ss_df = pd.DataFrame(rows)
+    if ss_df.empty:
+        print(
+            f"WARNING: no {lipid_class} structures passed all filters. "
+            "Check protid matching, ligand detection, and DSSP."
+        )
+        return 0
+
+    output_dir = os.path.join(output_root, f"{lipid_class}s")
+    os.makedirs(output_dir, exist_ok=True)
+
+    output_per_struct = os.path.join(output_dir, OUTPUT_PER_STRUCT)
+    ss_df.to_csv(output_per_struct, index=False)
+    print(f"Per-structure CSV written: {output_per_struct}")
+
+    # ============================================================
+    # AGGREGATE BY LEIDEN CLUSTER
+    # ============================================================
+    lc_summary = (
+        ss_df
+        .groupby("LeidenCluster")
+        .agg(
+            n_structures=("protid", "count"),
+            helix_mean=("helix_pct", "mean"),
+            helix_std=("helix_pct", "std"),
+            sheet_mean=("sheet_pct", "mean"),
+            sheet_std=("sheet_pct", "std"),
+            loop_mean=("loop_pct", "mean"),
+            loop_std=("loop_pct", "std"),
+        )
+        .reset_index()
+    )
+
+    output_per_lc = os.path.join(output_dir, OUTPUT_PER_LC)
+    lc_summary.to_csv(output_per_lc, index=False)
+    print(f"Per-LC summary CSV written: {output_per_lc}")
+
+    return len(ss_df)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    dssp_cache = None if args.no_cache else args.dssp_cache
+
+    classes = {}
+    for lipid_class in args.classes:
+        collected = collect_structures(lipid_class, args.pdb_root, args.cartography_root)
+        if collected is not None:
+            classes[lipid_class] = collected
+
+    if not classes:
+        raise FileNotFoundError(
+            f"No ProteinCartography results found in {args.cartography_root} "
+            "for the requested lipid classes."
+        )
+
+    # ============================================================
+    # ANALYZE EVERY PDB FILE ONCE (in parallel)
+    # ============================================================
+    jobs = {}
+    for _, structures in classes.values():
+        for protid, pdb_path in structures:
+            jobs.setdefault(os.path.realpath(pdb_path), (protid, pdb_path))
+
+    results = dict(zip(
+        jobs,
+        parallel_map(
+            analyze_job,
+            [(protid, pdb_path, args.cutoff, args.residue_atoms, dssp_cache)
+             for protid, pdb_path in jobs.values()],
+            args.workers,
+            chunk_size=4,
+        ),
+    ))
+
+    # ============================================================
+    # ONE SET OF TABLES PER LIPID CLASS
+    # ============================================================
+    n_written = 0
+    for lipid_class, (protid_to_lc, structures) in classes.items():
+        rows = []
+        for protid, pdb_path in structures:
+            counts = results[os.path.realpath(pdb_path)]
+            if counts is not None:
+                rows.append({"protid": protid, "LeidenCluster": protid_to_lc[protid], **counts})
+
+        n = write_class_tables(lipid_class, rows, args.output_root)
+        print(f"{lipid_class}: {n} structures")
+        n_written += n
+
+    if n_written == 0:
+        raise RuntimeError(
+            "No structures passed all filters. "
+            "Check protid matching, ligand detection, and DSSP."
+        )
+
+    print("\nDone.")
+
+
+if __name__ == "__main__":
+    main()